@@ -0,0 +1,188 @@
+"""Run the scm-helper command line against a synthetic club, and time it."""
+
+import argparse
+import json
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import time
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from scm_helper.config import CONFIG_DIR, CONFIG_FILE, KEYFILE  # noqa: E402
+from scm_helper.crypto import Crypto  # noqa: E402
+from scm_helper.default import DEFAULT_CONFIG  # noqa: E402
+
+from club import Club  # noqa: E402 isort:skip
+from server import serve, url  # noqa: E402 isort:skip
+
+CLUB_NAME = "Benchmark Swimming Club"
+PASSWORD = "benchmark"
+TOKEN = "benchmark-api-key"
+
+DEFAULT_SIZES = [500, 2000]
+
+# Name: (options, input)
+SCENARIOS = {
+    "report": ([], None),
+    "member": (["--member"], None),
+    "error": (["--error"], None),
+    "coaches": (["--coaches"], None),
+    "sessions": (["--sessions"], None),
+    "lists": (["--lists"], None),
+    "fix": (["--fix", "--bulk"], "y\n"),
+}
+
+
+def make_home(home, club, api):
+    """Create config and API key files for the club, in a new home directory."""
+    cfg_dir = os.path.join(home, CONFIG_DIR)
+    os.makedirs(cfg_dir, exist_ok=True)
+
+    cfg = yaml.safe_load(DEFAULT_CONFIG)  # The checks a new user would get
+    cfg.update(club.config())
+    cfg["club"] = CLUB_NAME
+    cfg["allow_update"] = True
+    cfg["debug_level"] = 0
+    if api:
+        cfg["api"] = api
+
+    with open(os.path.join(cfg_dir, CONFIG_FILE), "w", encoding="utf8") as file:
+        yaml.safe_dump(cfg, file)
+
+    crypto = Crypto(CLUB_NAME, PASSWORD)
+    with open(os.path.join(cfg_dir, KEYFILE), "wb") as file:
+        file.write(crypto.encrypt_data(TOKEN.encode()))
+
+
+def run(options, stdin, home, server):
+    """Run the command line once, returning (seconds, exit code)."""
+    env = dict(os.environ)
+    env["HOME"] = home
+
+    local = os.path.join("benchmark", "local.py")
+    cmd = [sys.executable, local, url(server), "--password", PASSWORD] + options
+    start = time.perf_counter()
+    proc = subprocess.run(
+        cmd,
+        cwd=ROOT,
+        env=env,
+        input=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,  # Progress, and any error
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        print(proc.stderr, file=sys.stderr)
+    return elapsed, proc.returncode
+
+
+def bench(args, api):
+    """Run each scenario for each club size."""
+    # pylint: disable=too-many-locals
+    results = []
+    for size in args.sizes:
+        start = time.perf_counter()
+        club = Club(size, args.seed)
+        data = json.dumps(club.endpoints())
+        generate = time.perf_counter() - start
+
+        for name in args.scenarios:
+            options, stdin = SCENARIOS[name]
+            times = []
+            code = 0
+            if args.profile:
+                os.makedirs(args.profile, exist_ok=True)
+                filename = os.path.join(args.profile, f"{size}-{name}.json")
+                options = options + ["--profile", os.path.abspath(filename)]
+
+            for _ in range(args.repeat):
+                # Fresh data and home each time, as scenarios write to SCM
+                server = serve(
+                    json.loads(data), TOKEN, latency=args.latency, errors=args.errors
+                )
+                with tempfile.TemporaryDirectory() as home:
+                    make_home(home, club, api)
+                    elapsed, code = run(options, stdin, home, server)
+                server.shutdown()
+                server.server_close()
+                if code == 0 and server.RequestHandlerClass.store.requests == 0:
+                    # scm-helper exits 0 on e.g. a config error
+                    print("No data read from the server", file=sys.stderr)
+                    code = -1
+                times.append(elapsed)
+                if code:
+                    break
+
+            result = {
+                "members": len(club.members),
+                "scenario": name,
+                "options": options,
+                "generate": round(generate, 3),
+                "times": [round(x, 3) for x in times],
+                "best": round(min(times), 3),
+                "requests": server.RequestHandlerClass.store.requests,
+                "errors": server.RequestHandlerClass.store.errors,
+                "exit": code,
+            }
+            results.append(result)
+            print(
+                f"{result['members']:>8} {name:<10} {result['best']:>9.2f}s "
+                f"{result['requests']:>8} {result['exit']:>5}"
+            )
+
+    return results
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="club sizes"
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=list(SCENARIOS),
+        choices=list(SCENARIOS),
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--errors", type=float, default=0.0, help="503 rate, 0-1")
+    parser.add_argument("--workers", type=int, help="api: workers")
+    parser.add_argument("--max-requests", type=int, help="api: max_requests")
+    parser.add_argument("--processes", type=int, help="api: processes")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--profile", help="directory for --profile output")
+    args = parser.parse_args()
+
+    api = {}
+    if args.workers:
+        api["workers"] = args.workers
+    if args.max_requests:
+        api["max_requests"] = args.max_requests
+    if args.processes:
+        api["processes"] = args.processes
+
+    print(f"{'Members':>8} {'Scenario':<10} {'Time':>10} {'Requests':>8} {'Exit':>5}")
+    results = bench(args, api)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as file:
+            json.dump({"api": api, "results": results}, file, indent=2)
+
+    if any(result["exit"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""Generate a synthetic swimming club, in the form returned by the SCM API."""
+
+import argparse
+import json
+import random
+from datetime import date, timedelta
+
+FIRST_NAMES = [
+    "Alice", "Ben", "Chloe", "Daniel", "Emily", "Finn", "Grace", "Harry",
+    "Isla", "Jack", "Katie", "Liam", "Megan", "Noah", "Olivia", "Peter",
+    "Rosie", "Sam", "Tom", "Zara",
+]  # fmt: skip
+
+LAST_NAMES = [
+    "Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson",
+    "Davies", "Robinson", "Wright", "Thompson", "Evans", "Walker", "White",
+    "Roberts", "Green", "Hall", "Wood", "Jackson", "Clarke",
+]  # fmt: skip
+
+SQUADS = ["Tadpoles", "Development", "Junior Squad", "Senior Squad", "Performance"]
+SQUAD_AGES = [(5, 8), (8, 11), (10, 14), (13, 18), (14, 21)]
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+MEMBERS_PER_SQUAD = 60  # Beyond 5 squads, add more, numbered
+SESSIONS_PER_SQUAD = 3
+
+CONDUCT_SWIMMERS = "Code of Conduct for Swimmers"
+CONDUCT_COACHES = "Code of Conduct for Coaches"
+
+SCM_DATE_FORMAT = "%Y-%m-%d"
+YES = "1"
+NO = "0"
+
+
+class Club:
+    """A synthetic club."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, size, seed=1, today=None):
+        """Initialise."""
+        self.random = random.Random(seed)
+        self.today = today or date.today()
+        self.size = size
+        self.members = []
+        self.groups = []
+        self.sessions = []
+        self.lists = []
+        self.roles = []
+        self.conduct = []
+        self.squads = []
+
+        self.create_members()
+        self.create_squads()
+        self.create_conduct()
+        self.create_roles()
+        self.create_lists()
+
+    def guid(self):
+        """Random GUID."""
+        rand = self.random.getrandbits
+        return f"{rand(32):08x}-{rand(16):04x}-{rand(16):04x}-{rand(16):04x}-{rand(48):012x}"
+
+    def days_ago(self, low, high):
+        """Date between low and high days ago, in SCM format."""
+        when = self.today - timedelta(days=self.random.randint(low, high))
+        return when.strftime(SCM_DATE_FORMAT)
+
+    def dob(self, min_age, max_age):
+        """Date of birth for someone aged between min_age and max_age."""
+        return self.days_ago(min_age * 365 + 1, max_age * 365 + 364)
+
+    def maybe(self, chance):
+        """True with the given chance."""
+        return self.random.random() < chance
+
+    def new_member(self, index, age):
+        """Create one member."""
+        rand = self.random
+        return {
+            "Guid": self.guid(),
+            "Firstname": rand.choice(FIRST_NAMES),
+            "Lastname": f"{rand.choice(LAST_NAMES)}{index}",
+            "KnownAs": None,
+            "Gender": rand.choice(["M", "F"]),
+            "DOB": self.dob(*age),
+            "Active": YES if self.maybe(0.9) else NO,
+            "IsASwimmer": NO,
+            "IsACoach": NO,
+            "IsAParent": NO,
+            "IsAVolunteer": NO,
+            "CommitteeMember": NO,
+            "Masters": NO,
+            "WaterPolo": NO,
+            "SynchronisedSwimming": NO,
+            "OpenWater": NO,
+            "LTSTeacher": NO,
+            "LifeSaving": NO,
+            "Email": f"member{index}@example.com" if self.maybe(0.95) else None,
+            "Username": f"member{index}" if self.maybe(0.8) else None,
+            "ASANumber": str(1000000 + index),
+            "ASACategory": rand.choice(["1", "2", "3"]),
+            "DateJoinedClub": self.days_ago(1, 3650),
+            "LastModifiedDate": self.days_ago(0, 700),
+            "DetailsConfirmedCorrect": (
+                self.days_ago(0, 500) if self.maybe(0.9) else None
+            ),
+            "LastLoggedIn": self.days_ago(0, 300) if self.maybe(0.7) else None,
+            "JobTitle": None,
+            "Notes": None,
+            "Address1": "1 High Street",
+            "HomePhone": None,
+            "MobilePhone": "07700 900000",
+            "DateLeft": None,
+            "DBSRenewalDate": None,
+            "SafeguardingRenewalDate": None,
+            "Parents": [],
+            "Swimmers": [],
+            "SessionRestrictions": [],
+        }
+
+    def create_members(self):
+        """Create members: swimmers, their parents, coaches and volunteers."""
+        swimmers = int(self.size * 0.6)
+        coaches = max(2, int(self.size * 0.05))
+        parents = self.size - swimmers - coaches
+
+        index = 0
+        for _ in range(swimmers):
+            age = (5, 17) if self.maybe(0.8) else (18, 60)  # Mostly juniors
+            member = self.new_member(index, age)
+            member["IsASwimmer"] = YES
+            member["Masters"] = YES if self.maybe(0.05) else NO
+            member["WaterPolo"] = YES if self.maybe(0.05) else NO
+            self.members.append(member)
+            index += 1
+
+        parent_list = []
+        for _ in range(parents):
+            member = self.new_member(index, (25, 60))
+            member["IsAParent"] = YES
+            member["IsAVolunteer"] = YES if self.maybe(0.2) else NO
+            member["CommitteeMember"] = YES if self.maybe(0.02) else NO
+            if member["CommitteeMember"] == YES:
+                member["JobTitle"] = "Committee Member"
+            self.members.append(member)
+            parent_list.append(member)
+            index += 1
+
+        for _ in range(coaches):
+            member = self.new_member(index, (18, 60))
+            member["IsACoach"] = YES
+            member["Active"] = YES
+            member["DBSRenewalDate"] = self.days_ago(-700, 30)
+            member["SafeguardingRenewalDate"] = self.days_ago(-700, 30)
+            self.members.append(member)
+            index += 1
+
+        # Link children to parents, every parent has at least one
+        children = [x for x in self.members if x["IsASwimmer"] == YES]
+        children = [x for x in children if self.age(x) < 18 and self.maybe(0.9)]
+        for number, child in enumerate(children):
+            if not parent_list:
+                break
+            if number < len(parent_list):
+                parent = parent_list[number]
+            else:
+                parent = self.random.choice(parent_list)
+            child["Parents"].append({"Guid": parent["Guid"]})
+            parent["Swimmers"].append({"Guid": child["Guid"]})
+            parent["Active"] = child["Active"]
+
+    def age(self, member):
+        """Age of member."""
+        dob = date.fromisoformat(member["DOB"])
+        return (self.today - dob).days // 365
+
+    def active(self, flag):
+        """Active members with flag set."""
+        return [x for x in self.members if x["Active"] == YES and x[flag] == YES]
+
+    def create_squads(self):
+        """Create squad groups, with sessions, swimmers and coaches."""
+        # pylint: disable=too-many-locals
+        swimmers = self.active("IsASwimmer")
+        coaches = self.active("IsACoach")
+
+        count = max(len(SQUADS), len(swimmers) // MEMBERS_PER_SQUAD)
+        for i in range(count):
+            base = SQUADS[i % len(SQUADS)]
+            name = base if i < len(SQUADS) else f"{base} {i // len(SQUADS) + 1}"
+            self.squads.append([name, SQUAD_AGES[i % len(SQUADS)]])
+
+        members = {squad[0]: [] for squad in self.squads}
+        for swimmer in swimmers:
+            age = self.age(swimmer)
+            fits = [name for name, (low, high) in self.squads if low <= age <= high]
+            if not fits:
+                fits = [self.squads[-1][0]]  # Masters etc in the top squad
+            members[self.random.choice(fits)].append(swimmer)
+
+        for name, _ in self.squads:
+            guids = [{"Guid": x["Guid"]} for x in members[name]]
+            self.groups.append(
+                {"Guid": self.guid(), "GroupName": name, "Members": guids}
+            )
+
+            for number in range(SESSIONS_PER_SQUAD):
+                self.create_session(f"{name} {number + 1}", members[name], coaches)
+
+        # A few groups that are not squads
+        for name in ["Water Polo", "Team Managers", "Resignations"]:
+            flag = "WaterPolo" if name == "Water Polo" else "IsAVolunteer"
+            candidates = self.active(flag) or swimmers
+            sample = self.random.sample(candidates, min(len(candidates), 30))
+            guids = [{"Guid": x["Guid"]} for x in sample]
+            self.groups.append(
+                {"Guid": self.guid(), "GroupName": name, "Members": guids}
+            )
+
+    def create_session(self, name, swimmers, coaches):
+        """Create a session."""
+        attending = [x for x in swimmers if self.maybe(0.8)]
+        session_coaches = self.random.sample(coaches, min(len(coaches), 2))
+        session = {
+            "Guid": self.guid(),
+            "SessionName": name,
+            "WeekDay": self.random.choice(WEEKDAYS),
+            "SessionLocation": "Main Pool",
+            "StartTime": "18:00",
+            "Archived": 0,
+            "MaxMembers": 40,
+            "Members": [
+                {"Guid": x["Guid"], "LastAttended": self.days_ago(0, 150)}
+                for x in attending
+            ],
+            "Coaches": [
+                {"Guid": x["Guid"], "LastAttended": self.days_ago(0, 30)}
+                for x in session_coaches
+            ],
+        }
+        self.sessions.append(session)
+
+        for coach in session_coaches:
+            coach["SessionRestrictions"].append({"Guid": session["Guid"]})
+
+    def create_conduct(self):
+        """Create codes of conduct, most members have agreed."""
+        for title, flag in [
+            [CONDUCT_SWIMMERS, "IsASwimmer"],
+            [CONDUCT_COACHES, "IsACoach"],
+        ]:
+            agreed = [x for x in self.active(flag) if self.maybe(0.85)]
+            members = [
+                {"Guid": x["Guid"], "DateAgreed": self.days_ago(0, 700)} for x in agreed
+            ]
+            self.conduct.append(
+                {"Guid": self.guid(), "Title": title, "Members": members}
+            )
+
+    def create_roles(self):
+        """Create roles."""
+        coaches = self.active("IsACoach")
+        volunteers = self.active("IsAVolunteer")
+        for name, members in [
+            ["Coaches", coaches],
+            ["Register Taker", volunteers[:20]],
+        ]:
+            guids = [{"Guid": x["Guid"]} for x in members]
+            self.roles.append({"Guid": self.guid(), "RoleName": name, "Members": guids})
+
+    def create_lists(self):
+        """Create some existing email lists."""
+        for name, _ in self.squads[: len(SQUADS)]:
+            group = [x for x in self.groups if x["GroupName"] == name][0]
+            self.lists.append(
+                {
+                    "Guid": self.guid(),
+                    "ListName": f"{name} (Generated)",
+                    "Members": list(group["Members"]),
+                }
+            )
+
+    def config(self):
+        """Configuration (as a dict) for scm-helper, to match the club."""
+        groups = {}
+        sessions = {}
+        lists = {}
+        for name, (low, high) in self.squads:
+            names = [f"{name} {number + 1}" for number in range(SESSIONS_PER_SQUAD)]
+            groups[name] = {"sessions": names, "min_age": low, "max_age": high}
+            for session in names:
+                sessions[session] = {"groups": [name]}
+            lists[name] = {"group": name}
+
+        lists["Swimmers: 17 and under on Dec 31"] = {
+            "type": "swimmer",
+            "max_age_eoy": 17,
+        }
+        lists["Water Polo: Men: 16 and over"] = {
+            "group": "Water Polo",
+            "min_age": 16,
+            "gender": "male",
+        }
+
+        groups["Resignations"] = {"ignore_swimmer": True, "no_sessions": True}
+        groups["Team Managers"] = {"type": "volunteer", "unique": False}
+        groups["Water Polo"] = {"no_sessions": True, "unique": False}
+
+        return {
+            "groups": {"priority": ["Water Polo"], "group": groups},
+            "sessions": {"absence": 120, "register": 60, "session": sessions},
+            "conduct": {
+                CONDUCT_SWIMMERS: {"types": ["swimmer"]},
+                CONDUCT_COACHES: {"types": ["coach"]},
+            },
+            "lists": {
+                "suffix": " (Generated)",
+                "edit": True,
+                "confirmation": False,
+                "list": lists,
+            },
+        }
+
+    def endpoints(self):
+        """Data by SCM API endpoint."""
+        res = {
+            "Members": self.members,
+            "ClubGroups": self.groups,
+            "ClubSessions": self.sessions,
+            "EmailLists": self.lists,
+            "ClubRoles": self.roles,
+            "CodeOfConduct": [
+                {"Guid": x["Guid"], "Title": x["Title"]} for x in self.conduct
+            ],
+        }
+        for conduct in self.conduct:
+            res[f"CodeOfConduct/{conduct['Guid']}"] = conduct
+        return res
+
+
+def main():
+    """Write a synthetic club as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=500, help="club size")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="club.json")
+    args = parser.parse_args()
+
+    club = Club(args.members, args.seed)
+    with open(args.output, "w", encoding="utf8") as file:
+        json.dump(club.endpoints(), file)
+    print(f"Club of {len(club.members)} members written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
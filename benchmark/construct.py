@@ -0,0 +1,80 @@
+"""Time creating the Member objects, for a synthetic club."""
+
+import argparse
+import json
+import os.path
+import sys
+import time
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from scm_helper.api import API  # noqa: E402
+from scm_helper.config import URL_MEMBERS  # noqa: E402
+from scm_helper.default import DEFAULT_CONFIG  # noqa: E402
+from scm_helper.issue import IssueHandler  # noqa: E402
+from scm_helper.members import Members  # noqa: E402
+from scm_helper.settings import Settings  # noqa: E402
+
+from club import Club  # noqa: E402 isort:skip
+
+DEFAULT_SIZES = [10000]
+
+
+def construct(size, seed, repeat):
+    """Best time (seconds) to create the members, and to then read their dates."""
+    club = Club(size, seed)
+    data = json.dumps(club.endpoints()["Members"])
+
+    cfg = yaml.safe_load(DEFAULT_CONFIG)
+    cfg.update(club.config())
+    scm = API(IssueHandler())
+    scm.settings = Settings(cfg)
+
+    best_create = best_decode = None
+    for _ in range(repeat):
+        raw = json.loads(data)
+        members = Members(scm, "Members", URL_MEMBERS)
+        start = time.perf_counter()
+        members.create_entities(raw)
+        create = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for member in members.entities:
+            _ = (member.dob, member.date_joined, member.last_modified_date)
+            _ = (member.confirmed_date, member.last_login, member.ignore_errors)
+        decode = time.perf_counter() - start
+
+        if best_create is None or create < best_create:
+            best_create = create
+        if best_decode is None or decode < best_decode:
+            best_decode = decode
+
+    return {
+        "members": len(members.entities),
+        "create": best_create,
+        "decode": best_decode,
+    }
+
+
+def main():
+    """Time each club size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="club sizes"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5, help="runs, best is reported")
+    args = parser.parse_args()
+
+    print(f"{'Members':>8} {'Create':>9} {'Decode':>9}  (seconds)")
+    for size in args.sizes:
+        res = construct(size, args.seed, args.repeat)
+        print(f"{res['members']:>8} {res['create']:>9.3f} {res['decode']:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
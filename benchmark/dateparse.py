@@ -0,0 +1,63 @@
+"""Compare scm_helper.dates.parse_date with datetime.strptime."""
+
+import argparse
+import datetime
+import os.path
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from scm_helper.config import SCM_CSV_DATE_FORMAT, SCM_DATE_FORMAT  # noqa: E402
+from scm_helper.dates import _CACHE, _parse, parse_date  # noqa: E402
+
+DEFAULT_COUNT = 100000
+DAYS = 3 * 365  # Attendance and conduct dates fall in the last few years
+
+
+def make_dates(count, distinct, xformat, seed):
+    """count dates, drawn from distinct days."""
+    rand = random.Random(seed)
+    start = datetime.datetime(2020, 1, 1)
+    days = [start + datetime.timedelta(days=day) for day in range(distinct)]
+    return [rand.choice(days).strftime(xformat) for _ in range(count)]
+
+
+def time_it(func, dates, xformat):
+    """Seconds to parse all the dates, best of 3, starting with an empty cache."""
+    return min(
+        timeit.repeat(
+            lambda: [func(date, xformat) for date in dates],
+            setup=_CACHE.clear,
+            number=1,
+            repeat=3,
+        )
+    )
+
+
+def main():
+    """Run the comparison."""
+    # pylint: disable=protected-access
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="dates")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    strptime = datetime.datetime.strptime
+    print(f"{'Format':<10} {'Distinct':>8} {'strptime':>9} {'fast':>9} {'cached':>9}")
+    for xformat in (SCM_DATE_FORMAT, SCM_CSV_DATE_FORMAT):
+        for distinct in (DAYS, args.count):
+            dates = make_dates(args.count, distinct, xformat, args.seed)
+            slow = time_it(strptime, dates, xformat)
+            fast = time_it(_parse, dates, xformat)
+            cached = time_it(parse_date, dates, xformat)
+            print(
+                f"{xformat:<10} {distinct:>8} {slow:>9.3f} {fast:>9.3f} {cached:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Run the command line (as scm-cmd.py) against a local server, such as server.py.
+
+usage: python benchmark/local.py <server URL> [scm-cmd.py options]
+"""
+
+import os.path
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from scm_helper import config  # noqa: E402
+
+
+def redirect(base):
+    """Point the SCM URLs at base - before anything else imports them."""
+    old = config.URL_BASE
+    for name, value in list(vars(config).items()):
+        if name.startswith("URL_") and value.startswith(old):
+            setattr(config, name, base + value[len(old) :])
+
+
+def main():
+    """Run the command line."""
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    redirect(sys.argv[1].rstrip("/"))
+
+    # pylint: disable=import-outside-toplevel
+    from scm_helper import main as scm
+
+    scm.cmd(sys.argv[2:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measure the memory used per member, for a synthetic club."""
+
+import argparse
+import gc
+import json
+import os.path
+import sys
+import tracemalloc
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from scm_helper.api import API  # noqa: E402
+from scm_helper.config import URL_MEMBERS  # noqa: E402
+from scm_helper.default import DEFAULT_CONFIG  # noqa: E402
+from scm_helper.issue import IssueHandler  # noqa: E402
+from scm_helper.members import Members  # noqa: E402
+from scm_helper.settings import Settings  # noqa: E402
+
+from club import Club  # noqa: E402 isort:skip
+
+DEFAULT_SIZES = [2000, 20000]
+
+
+def measure(size, seed, keep_raw):
+    """Bytes per member: the data read from SCM, and what is kept after analysis."""
+    club = Club(size, seed)
+    data = json.dumps(club.endpoints()["Members"])
+
+    cfg = yaml.safe_load(DEFAULT_CONFIG)
+    cfg.update(club.config())
+    scm = API(IssueHandler())
+    scm.settings = Settings(cfg)
+    scm.keep_raw = keep_raw
+    members = Members(scm, "Members", URL_MEMBERS)
+
+    gc.collect()
+    tracemalloc.start()
+    raw = json.loads(data)
+    read, _ = tracemalloc.get_traced_memory()
+    members.create_entities(raw)
+    del raw  # Only what the Members keep is left
+    gc.collect()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(members.entities)
+    return {"members": count, "read": read // count, "kept": kept // count}
+
+
+def main():
+    """Measure each club size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="club sizes"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Members':>8} {'Read':>8} {'Kept':>8} {'Compact':>8}  (bytes/member)")
+    for size in args.sizes:
+        full = measure(size, args.seed, True)
+        compact = measure(size, args.seed, False)
+        print(
+            f"{full['members']:>8} {full['read']:>8} {full['kept']:>8} "
+            f"{compact['kept']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""A local stand-in for the SCM API, serving a synthetic club."""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from club import Club
+
+PAGE_SIZE = 100  # As SCM
+RETRY_AFTER = 1  # Seconds, sent with a 503
+MIN_GZIP = 1024  # Bytes, don't compress small responses
+
+
+class Store:
+    """Club data, by endpoint, shared between request threads."""
+
+    def __init__(self, endpoints):
+        """Initialise."""
+        self.endpoints = endpoints
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.writes = 0
+
+    def read(self, path):
+        """Data for path, None if not found."""
+        with self.lock:
+            self.requests += 1
+            return self.endpoints.get(path)
+
+    def write(self, path, data, create):
+        """Create or replace an entity, returning it (None if not found)."""
+        with self.lock:
+            self.requests += 1
+            self.writes += 1
+            if create:
+                entities = self.endpoints.get(path)
+                if entities is None:
+                    return None
+                data["Guid"] = str(uuid.uuid4())
+                entities.append(data)
+                return data
+
+            endpoint, _, guid = path.rpartition("/")
+            entities = self.endpoints.get(endpoint)
+            if entities is None:
+                return None
+            for index, entity in enumerate(entities):
+                if entity.get("Guid") == guid:
+                    entities[index] = {**entity, **data}
+                    return entities[index]
+            return None
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Handle SCM API requests."""
+
+    protocol_version = "HTTP/1.1"  # Keep alive, as SCM
+
+    # Set by serve()
+    store = None
+    token = None
+    latency = 0.0
+    errors = 0.0
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Quiet."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Read a page of an endpoint."""
+        if self.check() is False:
+            return
+
+        path = urlparse(self.path).path.strip("/")
+        data = self.store.read(path)
+        if data is None:
+            if path in ["WhosWho", "ClubEvents", "Meets", "IncidentBook"]:
+                data = []  # Not used by the benchmark, but read by --backup
+            else:
+                self.reply(404)
+                return
+
+        if isinstance(data, list):
+            since = self.headers.get("ModifiedSince")
+            if since:
+                data = [x for x in data if (x.get("LastModifiedDate") or "") >= since]
+            try:
+                page = int(self.headers.get("Page", "1"))
+            except ValueError:
+                page = 1
+            data = data[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+
+        body = json.dumps(data).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.reply(304, headers={"ETag": etag})
+            return
+
+        self.reply(200, body, {"ETag": etag})
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Update an entity."""
+        self.update(False)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Create an entity."""
+        self.update(True)
+
+    def update(self, create):
+        """Create or update an entity."""
+        length = int(self.headers.get("Content-Length", "0"))
+        data = self.rfile.read(length)
+        if self.check() is False:
+            return
+
+        try:
+            data = json.loads(data)
+        except ValueError:
+            self.reply(400)
+            return
+
+        path = urlparse(self.path).path.strip("/")
+        entity = self.store.write(path, data, create)
+        if entity is None:
+            self.reply(404)
+            return
+        self.reply(200, json.dumps(entity).encode())
+
+    def check(self):
+        """Add latency, random errors, and check the API key."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.errors and random.random() < self.errors:
+            with self.store.lock:
+                self.store.errors += 1
+            self.reply(503, headers={"Retry-After": str(RETRY_AFTER)})
+            return False
+
+        if self.headers.get("Authorization-Token") != self.token:
+            self.reply(401)
+            return False
+
+        return True
+
+    def reply(self, code, body=b"", headers=None):
+        """Send a response."""
+        self.send_response(code)
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+
+        if body:
+            self.send_header("Content-Type", "application/json")
+            accept = self.headers.get("Accept-Encoding", "")
+            if len(body) >= MIN_GZIP and "gzip" in accept:
+                body = gzip.compress(body, compresslevel=1)
+                self.send_header("Content-Encoding", "gzip")
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def serve(endpoints, token, port=0, latency=0.0, errors=0.0):
+    """Start a server in a background thread, returning it."""
+    handler = type(
+        "ClubHandler",
+        (Handler,),
+        {
+            "store": Store(endpoints),
+            "token": token,
+            "latency": latency,
+            "errors": errors,
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def url(server):
+    """Base URL of a server, for local.py."""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def main():
+    """Serve a synthetic club until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=500, help="club size")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--token", default="benchmark", help="API key to accept")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--errors", type=float, default=0.0, help="503 rate, 0-1")
+    args = parser.parse_args()
+
+    club = Club(args.members, args.seed)
+    server = serve(club.endpoints(), args.token, args.port, args.latency, args.errors)
+    print(f"Serving {len(club.members)} members at {url(server)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
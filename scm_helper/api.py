@@ -2,20 +2,37 @@
 
 import os.path
 import platform
-from datetime import date, datetime
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
 from pathlib import Path
 from shutil import copyfile
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
+from scm_helper.cache import K_DATA, ResponseCache
 from scm_helper.conduct import CodesOfConduct
 from scm_helper.config import (
     BACKUP_DIR,
     BACKUP_URLS,
     C_ALLOW_UPDATE,
+    C_API,
+    C_CACHE,
     C_CLUB,
+    C_CONNECT_TIMEOUT,
     C_DEBUG_LEVEL,
+    C_MAX_REQUESTS,
+    C_READ_TIMEOUT,
+    C_RETRIES,
+    C_WORKERS,
+    C_WRITERS,
     CODES_OF_CONDUCT,
     CONFIG_DIR,
     CONFIG_FILE,
@@ -23,8 +40,13 @@ from scm_helper.config import (
     KEYFILE,
     LISTS,
     MEMBERS,
+    O_BULK,
+    O_DUMP,
     O_FIX,
     O_FORMAT,
+    O_LISTS,
+    O_REFRESH,
+    O_RESTORE,
     O_VERIFY,
     ROLES,
     SESSIONS,
@@ -42,17 +64,33 @@ from scm_helper.config import (
     verify_schema,
     verify_schema_data,
 )
+from scm_helper.configcache import config_hash, read_config_cache, write_config_cache
 from scm_helper.default import create_default_config
 from scm_helper.entity import Entities, Who
+from scm_helper.fetch import WRITERS, write_all
 from scm_helper.groups import Groups
+from scm_helper.instrument import phase, record_request, section
 from scm_helper.issue import debug, set_debug_level
 from scm_helper.lists import Lists
 from scm_helper.members import Members
-from scm_helper.notify import notify
+from scm_helper.notify import interact_yesno, notify
 from scm_helper.roles import Roles
+from scm_helper.rules import analyse_class
 from scm_helper.sessions import Sessions
+from scm_helper.settings import Settings
 from scm_helper.version import VERSION
 
+CONNECT_TIMEOUT = 30
+READ_TIMEOUT = 30
+
+RETRIES = 3
+BACKOFF = 1  # Seconds, doubled for each retry
+MAX_BACKOFF = 30
+MAX_RETRY_AFTER = 300
+
+RETRY_STATUS = [429, 500, 502, 503, 504]
+RETRY_STATUS_POST = [429, 503]  # Request was not processed, so safe to repeat
+
 
 class API:
     """Main SCM object."""
@@ -68,6 +106,8 @@ class API:
         self._options = {}
         self._config = []
         self._key = None
+        self.settings = None  # Compiled config, for the checks
+        self.keep_raw = True  # Keep all data read from SCM, not just that checked
         self.groups = None
         self.lists = None
         self.roles = None
@@ -80,7 +120,16 @@ class API:
         self.issue_handler = issues
         self.fixable = []
         self.crypto = None
+        self.cache = None
+        self.revalidate = False  # Always check cached data with SCM (GUI)
+        self.refresh = False  # Re-read everything from SCM (--refresh, backup)
         self.ipad = False
+        self._requests = nullcontext()  # Limit on requests in flight
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._session = None
+        self._timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+        self.count_requests = 0
 
         self.today = datetime.now()
         q_month = (int((self.today.month - 1) / 3) * 3) + 1
@@ -104,20 +153,32 @@ class API:
             nmsg += "This is used to protect the API key.\n"
             notify(nmsg)
 
+        self.close_session()  # Pool size or timeouts may have changed
+
         try:
-            with open(cfg, encoding="utf8") as file:
+            with open(cfg, "rb") as file:
                 self._config = None
                 delete_schema()
-                self._config = yaml.safe_load(file)
+                data = file.read()
         except EnvironmentError:
             notify(f"Cannot open configuration file: {cfg}\n")
             return False
-        except (yaml.scanner.ScannerError, yaml.parser.ParserError) as error:
-            notify(f"Error in configuration file: {error}\n")
-            return False
 
-        if verify_schema(self._config) is False:
-            return False
+        key = config_hash(data)
+        self._config = read_config_cache(key)  # Unchanged since last verified?
+        if self._config is None:
+            try:
+                self._config = yaml.safe_load(data.decode("utf8"))
+            except (yaml.scanner.ScannerError, yaml.parser.ParserError) as error:
+                notify(f"Error in configuration file: {error}\n")
+                return False
+
+            if verify_schema(self._config) is False:
+                return False
+
+            write_config_cache(key, self._config)
+
+        self.settings = Settings(self._config)
 
         return True
 
@@ -144,6 +205,10 @@ class API:
         if self._key is None:
             return False
 
+        self.cache = None
+        if self.ipad is False and get_config(self, C_API, C_CACHE) is not None:
+            self.cache = ResponseCache(self, self.crypto)
+
         debug_config = self.config(C_DEBUG_LEVEL)
         set_debug_level(debug_config)
 
@@ -216,10 +281,87 @@ class API:
         if backup:
             loop = self.classes + self.backup_classes
 
+        self.refresh = bool(backup or self.option(O_REFRESH))
+        dump = self.option(O_DUMP) or self.option(O_RESTORE)
+        self.keep_raw = bool(backup or dump)
+
+        if self.cache:
+            self.cache.refresh = bool(self.option(O_REFRESH))
+            # Data may be written back to SCM, so must be current
+            writes = self.option(O_FIX) or self.option(O_LISTS)
+            self.cache.revalidate = bool(self.revalidate or backup or writes)
+
+        self._cancel.clear()
+        max_requests = get_config(self, C_API, C_MAX_REQUESTS)
+        with phase("read"):
+            if max_requests and max_requests > 1:
+                res = self.get_data_parallel(loop, max_requests)
+            else:
+                res = self.get_data_serial(loop)
+
+        if res is False:
+            return False
+
+        debug(self.print_connections(), 2)
+
+        if self.cache:
+            self.cache.evict()
+            debug(self.cache.print_stats(), 2)
+            if self.cache.hits:
+                notify("Using cached data, use --refresh to re-read from SCM.\n")
+
+        return True
+
+    def get_data_serial(self, loop):
+        """Get data for each class in turn."""
+        self._requests = nullcontext()
         for aclass in loop:
-            if aclass.get_data() is False:
+            with section("read", aclass.name):
+                res = aclass.get_data()
+            if res is False:
                 return False
+        return True
 
+    def get_data_parallel(self, loop, max_requests):
+        """Get data for all classes at the same time."""
+        self._requests = threading.BoundedSemaphore(max_requests)
+        failed = []
+
+        def get_class(aclass):
+            """Read one class, cancelling the others if it fails."""
+            res = False
+            try:
+                with section("read", aclass.name):
+                    res = aclass.get_data()
+            finally:
+                if res is False:
+                    with self._lock:
+                        if self._cancel.is_set() is False:
+                            failed.append(aclass)
+                            self._cancel.set()
+            return res
+
+        for aclass in loop:
+            aclass.hold_progress()
+
+        with ThreadPoolExecutor(max_workers=len(loop)) as executor:
+            futures = [executor.submit(get_class, aclass) for aclass in loop]
+
+            # Report progress in the usual order, as each class completes.
+            for aclass, future in zip(loop, futures):
+                try:
+                    future.result()
+                finally:
+                    notify(aclass.release_progress())
+                if failed and failed[0] == aclass:
+                    notify("\n")
+                    break
+
+            for aclass in loop:
+                aclass.release_progress()
+
+        if failed:
+            return False
         return True
 
     def get_members_only(self):
@@ -234,8 +376,10 @@ class API:
         """Set up cross reference links between Entities."""
         notify("Linking...\n")
 
-        for aclass in self.classes:
-            aclass.linkage()
+        with phase("linkage"):
+            for aclass in self.classes:
+                with section("linkage", aclass.name):
+                    aclass.linkage()
 
         if verify_schema_data(self) is False:
             return False
@@ -245,15 +389,18 @@ class API:
         """Analyse the data."""
         notify("Analysing...\n")
 
-        for aclass in self.classes:
-            aclass.analyse()
+        with phase("analyse"):
+            for aclass in self.classes:
+                with section("analyse", aclass.name):
+                    analyse_class(self, aclass)
 
         notify("Done.\n")
 
     def update(self):
         """Update (lists)."""
         notify("Updating...\n")
-        self.lists.update()
+        with phase("update"):
+            self.lists.update()
         notify("Done.\n")
 
     def restore(self, xclass):
@@ -262,6 +409,9 @@ class API:
             notify("Not implemented on iPad")
             return False
 
+        if self.cache:
+            self.cache.revalidate = True  # Restore compares with current data
+
         xclass = xclass.lower()
         if xclass in self.class_byname:
             item = self.class_byname[xclass]
@@ -351,6 +501,7 @@ class API:
             return False
 
         restore = self.classes + self.backup_classes
+        self.keep_raw = True
 
         for aclass in restore:
             decrypted = self.crypto.decrypt_backup(aclass.name, xdate)
@@ -394,66 +545,223 @@ class API:
         else:
             self._options[opt] = True
 
-    def api_read(self, url, page):
-        """Read URL page."""
+    def http_session(self):
+        """Return the HTTP session, shared by all reads and writes."""
+        with self._lock:
+            if self._session is None:
+                self._session = self.create_session()
+            return self._session
+
+    def create_session(self):
+        """Create a pooled, keep-alive HTTP session."""
+        workers = get_config(self, C_API, C_WORKERS) or 1
+        max_requests = get_config(self, C_API, C_MAX_REQUESTS) or 1
+        writers = get_config(self, C_API, C_WRITERS) or WRITERS
+        pool_size = max(workers, max_requests, writers)
+
+        connect = get_config(self, C_API, C_CONNECT_TIMEOUT) or CONNECT_TIMEOUT
+        read = get_config(self, C_API, C_READ_TIMEOUT) or READ_TIMEOUT
+        self._timeout = (connect, read)
+
         club = self._config[C_CLUB]
         user_agent = USER_AGENT.replace("###CLUB_NAME###", club)
 
-        headers = {
-            "User-Agent": user_agent,
-            "Authorization-Token": self._key,
-            "Page": str(page),
-        }
+        session = requests.Session()
+        session.headers.update(
+            {
+                "User-Agent": user_agent,
+                "Authorization-Token": self._key,
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+        # SCM does not use cookies; ignoring them keeps the session
+        # stateless, so it is safe to share between threads.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        debug(f"HTTP session: pool size {pool_size}, timeouts {self._timeout}", 7)
+        return session
+
+    def close_session(self):
+        """Close the HTTP session (if open)."""
+        with self._lock:
+            if self._session:
+                self._session.close()
+            self._session = None
+            self.count_requests = 0
+
+    def http_request(self, method, url, **kwargs):
+        """Make a request using the shared session."""
+        session = self.http_session()
+        response = session.request(method, url, timeout=self._timeout, **kwargs)
+        with self._lock:
+            self.count_requests += 1
+        return response
+
+    def request_retry(self, method, url, **kwargs):
+        """Make a request, retrying errors that may be transient."""
+        retries = get_config(self, C_API, C_RETRIES)
+        if retries is None:
+            retries = RETRIES
+
+        retry_status = RETRY_STATUS
+        retry_errors = (requests.Timeout, requests.ConnectionError)
+        if method == "POST":
+            # May have been processed, so only retry if not
+            retry_status = RETRY_STATUS_POST
+            retry_errors = (requests.ConnectTimeout,)
+
+        attempt = 0
+        error = None
+        while True:
+            response = None
+            with self._requests:
+                if self._cancel.is_set():
+                    return None
+                try:
+                    response = self.http_request(method, url, **kwargs)
+                    error = response.reason
+                    if response.status_code not in retry_status:
+                        return response
+                except retry_errors as exception:
+                    error = exception
+                except requests.RequestException as exception:
+                    notify(f"\nError connecting to SCM: {url}\n{exception}\n")
+                    return None
+
+            if attempt >= retries:
+                break
+
+            delay = self.retry_delay(attempt, response)
+            attempt += 1
+            debug(f"Retry {attempt} of {url} in {delay:.1f}s: {error}", 2)
+            if self._cancel.wait(delay):
+                return None  # Another read failed, so give up
+
+        if response is not None:
+            return response  # Let the caller report the error
+
+        notify(f"\nError connecting to SCM: {url}\n{error}\n")
+        return None
+
+    @staticmethod
+    def retry_delay(attempt, response):
+        """Delay before retrying: as asked by SCM, or a jittered backoff."""
+        if response is not None and "Retry-After" in response.headers:
+            retry_after = response.headers["Retry-After"]
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    delay = (when - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0), MAX_RETRY_AFTER)
+
+        backoff = min(BACKOFF * (2**attempt), MAX_BACKOFF)
+        return random.uniform(0, backoff)
+
+    @property
+    def count_connections(self):
+        """Number of HTTP connections opened."""
+        with self._lock:
+            if self._session is None:
+                return 0
+            adapters = set(self._session.adapters.values())
+
+        count = 0
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                count += pools[key].num_connections
+        return count
+
+    def print_connections(self):
+        """Connection reuse, for debug."""
+        requests_made = self.count_requests
+        connections = self.count_connections
+        reused = requests_made - connections
+        return f"HTTP: {requests_made} requests, {connections} connections, {reused} reused"
+
+    def api_read(self, url, page, params=None):
+        """Read URL page."""
+        headers = {"Page": str(page)}
+
+        cached = None
+        if params:
+            headers.update(params)  # Filtered - not cached
+        elif self.cache:
+            cached = self.cache.get(url, page)
+            if cached:
+                if self.cache.is_fresh(url, cached):
+                    debug("Cached:\n%s, page %s", 9, url, page)
+                    record_request(url, None, 0, 0)
+                    return cached[K_DATA]
+                headers.update(self.cache.conditional_headers(cached))
+
+        debug("URL:\n%s", 9, url)
+        debug("Headers:\n%s", 8, headers)
+
+        start = time.perf_counter()
+        response = self.request_retry("GET", url, headers=headers)
+        if response is None:
+            return None
+        elapsed = time.perf_counter() - start
+        record_request(url, response.status_code, len(response.content), elapsed)
 
-        debug(f"URL:\n{url}", 9)
-        debug(f"Headers:\n{headers}", 8)
+        if cached and response.status_code == 304:  # Not modified
+            self.cache.touch(url, page, cached)
+            return cached[K_DATA]
 
-        response = requests.get(url, headers=headers, timeout=30)
         if response.ok:
-            return response.json()
+            data = response.json()
+            if self.cache and params is None:
+                self.cache.put(url, page, data, response.headers)
+            return data
 
         if response.status_code == 404:  # Worked, but not found
             return False
 
-        notify(f"\nErroring getting data from {url}, page:{page}\n")
-        notify(response.reason)
-        notify("\n")
+        # One notify, so messages from parallel reads don't interleave
+        notify(f"\nErroring getting data from {url}, page:{page}\n{response.reason}\n")
         return None
 
     def api_write(self, entity, create):
         """Write data back to SCM."""
-        club = self._config[C_CLUB]
-        user_agent = USER_AGENT.replace("###CLUB_NAME###", club)
-
-        headers = {
-            "content-type": "application/json",
-            "User-Agent": user_agent,
-            "Authorization-Token": self._key,
-        }
+        headers = {"content-type": "application/json"}
 
         if get_config(entity.scm, C_ALLOW_UPDATE) is False:
             notify("Update prohibited by config.\n")
             return None
 
-        debug(f"URL:\n{entity.url}", 9)
-        debug(f"Headers:\n{headers}", 8)
+        debug("URL:\n%s", 9, entity.url)
+        debug("Headers:\n%s", 8, headers)
 
         data = entity.newdata
         if create:
-            debug(f"Post request:\n{data}", 7)
-            response = requests.post(entity.url, json=data, headers=headers, timeout=30)
+            debug("Post request:\n%s", 7, data)
+            response = self.request_retry(
+                "POST", entity.url, json=data, headers=headers
+            )
         else:
-            debug(f"Put request:\n{data}", 7)
-            response = requests.put(entity.url, json=data, headers=headers, timeout=30)
+            debug("Put request:\n%s", 7, data)
+            response = self.request_retry("PUT", entity.url, json=data, headers=headers)
+        if response is None:
+            return None
         if response.ok:
+            if self.cache:
+                self.cache.clear()  # Data in SCM has changed
             return response
 
         if response.status_code == 404:  # Worked, but not found
             return False
 
-        notify(f"\nErroring posting data {entity.name}\n")
-        notify(response.reason)
-        notify("\n")
+        notify(f"\nErroring posting data {entity.name}\n{response.reason}\n")
         return None
 
     def fix_search(self):
@@ -493,6 +801,9 @@ class API:
             notify("Nothing to fix\n")
             return False
 
+        if self.option(O_BULK):
+            return self.apply_fixes_bulk()
+
         for fix in self.fixable:
             if fix.apply_fix() is None:
                 self.fixable = []
@@ -501,6 +812,48 @@ class API:
         self.fixable = []
         return True
 
+    def apply_fixes_bulk(self):
+        """Apply all fixes, after one confirmation."""
+        length = len(self.fixable)
+        if length == 0:
+            notify("Nothing to fix\n")
+            return False
+
+        notify(f"\n{length} fixes...\n{self.list_fixes()}\n")
+        if interact_yesno(f"Apply all {length} fixes") is False:
+            return False
+
+        if get_config(self, C_ALLOW_UPDATE) is False:
+            notify("Update prohibited by config.\n")
+            return False
+
+        while True:
+            # Only failures are left in fixable, so a retry won't repeat a fix
+            self.fixable = self.write_fixes(self.fixable)
+            if len(self.fixable) == 0:
+                return True
+
+            if interact_yesno(f"Retry {len(self.fixable)} failed fixes") is False:
+                return False
+
+    def write_fixes(self, fixes):
+        """Write fixes to SCM at the same time, returning those that failed."""
+        notify("Fixing...\n")
+        results = write_all(self, lambda fix: fix.write_fix(), fixes)
+
+        report = ""
+        failed = []
+        for fix, res in zip(fixes, results):
+            if res:
+                report += f"   Fixed: {fix.name}\n"
+            else:
+                report += f"   FAILED: {fix.name}: {fix.fixmsg}\n"
+                failed.append(fix)
+
+        fixed = len(fixes) - len(failed)
+        notify(f"{report}{fixed} fixed, {len(failed)} failed.\n")
+        return failed
+
     def list_fixes(self):
         """List any fixes."""
         if len(self.fixable) == 0:
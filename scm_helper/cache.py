@@ -0,0 +1,222 @@
+"""Local cache of SCM API responses."""
+
+import hashlib
+import json
+import os
+import os.path
+import threading
+import time
+from pathlib import Path
+
+from scm_helper.config import (
+    C_API,
+    C_CACHE,
+    C_ENTITY_TTL,
+    C_MAX_SIZE,
+    C_TTL,
+    CACHE_DIR,
+    CONFIG_DIR,
+    get_config,
+)
+from scm_helper.issue import debug
+
+DEFAULT_TTL = 900  # Seconds
+DEFAULT_MAX_SIZE = 50  # MBytes
+MBYTE = 1024 * 1024
+
+CACHE_SUFFIX = ".enc"
+TMP_SUFFIX = ".tmp"
+
+# Labels in a cache entry
+K_DATA = "data"
+K_ETAG = "etag"
+K_MODIFIED = "modified"
+K_PAGE = "page"
+K_TIME = "time"
+K_URL = "url"
+
+
+class ResponseCache:
+    """Encrypted on-disk cache of SCM API responses, keyed by URL and page."""
+
+    # pylint: disable=too-many-instance-attributes
+    # Need them all!
+
+    def __init__(self, scm, crypto):
+        """Initialise."""
+        self.scm = scm
+        self.crypto = crypto
+        self.refresh = False  # Ignore the cache (but save new responses)
+        self.revalidate = False  # Always check cached data with SCM
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+        self._lock = threading.Lock()
+
+        home = str(Path.home())
+        self._dir = os.path.join(home, CONFIG_DIR, CACHE_DIR)
+
+    def filename(self, url, page):
+        """Cache file for URL page."""
+        key = hashlib.sha256(f"{url}#{page}".encode()).hexdigest()
+        return os.path.join(self._dir, f"{key}{CACHE_SUFFIX}")
+
+    def ttl(self, url):
+        """How long data from URL can be used without checking with SCM."""
+        ttl = get_config(self.scm, C_API, C_CACHE, C_TTL)
+        if ttl is None:
+            ttl = DEFAULT_TTL
+
+        entity_ttl = get_config(self.scm, C_API, C_CACHE, C_ENTITY_TTL)
+        if entity_ttl:
+            for name, aclass in self.scm.class_byname.items():
+                if name not in entity_ttl:
+                    continue
+                if url == aclass.url or url.startswith(f"{aclass.url}/"):
+                    return entity_ttl[name]
+
+        return ttl
+
+    def get(self, url, page):
+        """Get cache entry for URL page (None if not cached)."""
+        if self.refresh:
+            return None
+
+        filename = self.filename(url, page)
+        if os.path.isfile(filename) is False:
+            return None
+
+        try:
+            with open(filename, "rb") as file:
+                data = self.crypto.decrypt_data(file.read())
+            if data:
+                entry = json.loads(data.decode())
+                if entry[K_URL] == url and entry[K_PAGE] == page:
+                    return entry
+        except (OSError, ValueError, KeyError):
+            pass
+
+        # Corrupt, or encrypted with a different password
+        debug("Discarding cache entry for %s, page %s", 7, url, page)
+        self.remove(filename)
+        return None
+
+    def is_fresh(self, url, entry):
+        """Can the entry be used without checking with SCM?"""
+        if self.revalidate:
+            return False
+
+        age = time.time() - entry[K_TIME]
+        if age < self.ttl(url):
+            self.count("hits")
+            return True
+        return False
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Headers to ask SCM if the entry has changed."""
+        headers = {}
+        if entry[K_ETAG]:
+            headers["If-None-Match"] = entry[K_ETAG]
+        if entry[K_MODIFIED]:
+            headers["If-Modified-Since"] = entry[K_MODIFIED]
+        return headers
+
+    def put(self, url, page, data, headers):
+        """Save a response."""
+        entry = {
+            K_URL: url,
+            K_PAGE: page,
+            K_TIME: time.time(),
+            K_ETAG: headers.get("ETag"),
+            K_MODIFIED: headers.get("Last-Modified"),
+            K_DATA: data,
+        }
+        self.count("downloads")
+        self.write(url, page, entry)
+
+    def touch(self, url, page, entry):
+        """SCM says the entry has not changed - restart its TTL."""
+        self.count("revalidated")
+        entry[K_TIME] = time.time()
+        self.write(url, page, entry)
+
+    def write(self, url, page, entry):
+        """Write an entry to disk."""
+        filename = self.filename(url, page)
+        tmp = f"{filename}.{threading.get_ident()}{TMP_SUFFIX}"
+        try:
+            if os.path.exists(self._dir) is False:
+                os.makedirs(self._dir, exist_ok=True)
+
+            data = self.crypto.encrypt_data(json.dumps(entry).encode())
+            with open(tmp, "wb") as file:
+                file.write(data)
+            os.replace(tmp, filename)
+
+        except OSError as error:
+            debug(f"Cannot write cache file: {error}", 1)
+            self.remove(tmp)
+
+    def clear(self):
+        """Delete all cache entries, e.g. after data has been changed in SCM."""
+        for filename, _, _ in self.files():
+            self.remove(filename)
+        debug("Cache cleared", 7)
+
+    def evict(self):
+        """Delete the oldest entries, if the cache is too big."""
+        max_size = get_config(self.scm, C_API, C_CACHE, C_MAX_SIZE)
+        if max_size is None:
+            max_size = DEFAULT_MAX_SIZE
+        max_size *= MBYTE
+
+        files = self.files()
+        size = sum(filesize for _, filesize, _ in files)
+        if size <= max_size:
+            return
+
+        files.sort(key=lambda item: item[2])  # Oldest first
+        for filename, filesize, _ in files:
+            self.remove(filename)
+            size -= filesize
+            if size <= max_size:
+                break
+
+        debug(f"Cache reduced to {size} bytes", 7)
+
+    def files(self):
+        """List of (filename, size, modified time) in the cache."""
+        res = []
+        if os.path.isdir(self._dir) is False:
+            return res
+
+        with os.scandir(self._dir) as entries:
+            for entry in entries:
+                if entry.is_file() is False:
+                    continue
+                if entry.name.endswith(CACHE_SUFFIX) is False:
+                    continue
+                stat = entry.stat()
+                res.append([entry.path, stat.st_size, stat.st_mtime])
+
+        return res
+
+    @staticmethod
+    def remove(filename):
+        """Remove a file (if it exists)."""
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def count(self, counter):
+        """Increment a counter (from any thread)."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def print_stats(self):
+        """Cache statistics, for debug."""
+        res = f"Cache: {self.hits} hits, {self.revalidated} unchanged, "
+        res += f"{self.downloads} read from SCM"
+        return res
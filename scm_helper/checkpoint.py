@@ -0,0 +1,80 @@
+"""Checkpoint of pages read, so an interrupted read can be continued."""
+
+import hashlib
+import json
+import os
+import os.path
+import time
+from pathlib import Path
+
+from scm_helper.config import CHECKPOINT_DIR, CONFIG_DIR
+from scm_helper.issue import debug
+
+CHECKPOINT_AGE = 3600  # Seconds, after which a checkpoint is too old to use
+
+# Labels in a checkpoint
+K_PAGES = "pages"
+K_TIME = "time"
+K_URL = "url"
+
+
+def checkpoint_file(url):
+    """Checkpoint filename for URL."""
+    home = str(Path.home())
+    key = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(home, CONFIG_DIR, CHECKPOINT_DIR, f"{key}.enc")
+
+
+def read_checkpoint(scm, url):
+    """Read pages saved from an earlier failed read of URL."""
+    if scm.crypto is None or scm.ipad or scm.refresh:
+        return []
+
+    filename = checkpoint_file(url)
+    if os.path.isfile(filename) is False:
+        return []
+
+    try:
+        with open(filename, "rb") as file:
+            data = scm.crypto.decrypt_data(file.read())
+        if data:
+            checkpoint = json.loads(data.decode())
+            age = time.time() - checkpoint[K_TIME]
+            if checkpoint[K_URL] == url and age < CHECKPOINT_AGE:
+                return checkpoint[K_PAGES]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    debug(f"Checkpoint for {url} not usable - ignoring", 2)
+    delete_checkpoint(url)
+    return []
+
+
+def write_checkpoint(scm, url, pages):
+    """Save pages read so far, after a failure."""
+    if scm.crypto is None or scm.ipad or len(pages) == 0:
+        return False
+
+    checkpoint = {K_URL: url, K_TIME: time.time(), K_PAGES: pages}
+
+    filename = checkpoint_file(url)
+    tmp = f"{filename}.tmp"
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        data = scm.crypto.encrypt_data(json.dumps(checkpoint).encode())
+        with open(tmp, "wb") as file:
+            file.write(data)
+        os.replace(tmp, filename)
+        return True
+
+    except OSError as error:
+        debug(f"Cannot write checkpoint: {error}", 1)
+        return False
+
+
+def delete_checkpoint(url):
+    """Delete checkpoint (if any) for URL."""
+    try:
+        os.remove(checkpoint_file(url))
+    except OSError:
+        pass
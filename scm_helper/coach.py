@@ -3,14 +3,11 @@
 from scm_helper.config import (
     A_ISCOACH,
     A_GUID,
-    C_COACHES,
-    C_MANDATORY,
-    C_ROLE,
     EXCEPTION_NOSESSIONS,
     EXCEPTION_PERMISSIONS,
-    get_config,
     SCM_TRUE,
 )
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_COACH_WITH_SESSIONS,
     E_NO_ROLE_COACH,
@@ -23,10 +20,11 @@ from scm_helper.issue import (
 )
 
 
+@timed
 def analyse_coach(coach):
     """Analyse a coach..."""
     if coach.coach_role is False:
-        if get_config(coach.scm, C_COACHES, C_ROLE, C_MANDATORY):
+        if coach.scm.settings.coach_role:
             issue(coach, E_NO_ROLE_COACH)
 
     if len(coach.coach_sessions) == 0:
@@ -40,7 +38,7 @@ def check_coach_permissions(coach, role):
     """Check a coaches permissions."""
     # pylint: disable=too-many-branches
 
-    debug(f"Permission check: {coach.name}, {role.name}", 7)
+    debug("Permission check: %s, %s", 7, coach.name, role.name)
     if coach.is_coach is False:
         issue(coach, E_NOT_A_COACH, f"Role: {role.name} (fixable)")
         fix = {A_ISCOACH: SCM_TRUE}
@@ -64,25 +62,17 @@ def check_coach_permissions(coach, role):
         fix["SessionRestrictions"] = []
     msg = "Fix permissions:\n"
 
+    restricted = set(coach.restricted)
     for session in coach.coach_sessions:
-        match = False
-        for permission in coach.restricted:
-            if session == permission:
-                match = True
-                break
-        if match is False:
+        if session not in restricted:
             issue(coach, E_PERMISSION_MISSING, session.full_name)
             fix["SessionRestrictions"].append({A_GUID: session.guid})
             msg += f"  Add {session.name}\n"
             fixed = True
 
+    sessions = set(coach.coach_sessions)
     for permission in coach.restricted:
-        match = False
-        for session in coach.coach_sessions:
-            if session == permission:
-                match = True
-                break
-        if match is False:
+        if permission not in sessions:
             issue(coach, E_PERMISSION_EXTRA, permission.full_name)
             fix["SessionRestrictions"].remove({A_GUID: permission.guid})
             fixed = True
@@ -1,29 +1,19 @@
 """SCM Conduct."""
 
-import datetime
-
 from scm_helper.config import (
     A_DATEAGREED,
     A_GUID,
     A_MEMBERS,
-    C_CONDUCT,
-    C_DATE,
-    C_IGNORE_GROUP,
-    C_LISTS,
-    C_TYPES,
-    CTYPE_COACH,
-    CTYPE_COMMITTEE,
-    CTYPE_PARENT,
-    CTYPE_POLO,
-    CTYPE_SWIMMER,
-    CTYPE_SYNCHRO,
-    CTYPE_VOLUNTEER,
+    C_API,
+    C_WORKERS,
     SCM_DATE_FORMAT,
     get_config,
 )
-from scm_helper.entity import Entities, Entity
+from scm_helper.dates import parse_date
+from scm_helper.entity import Entities, Entity, check_type
+from scm_helper.fetch import read_urls
+from scm_helper.instrument import timed
 from scm_helper.issue import E_NO_CONDUCT, E_NO_CONDUCT_DATE, debug_trace, issue
-from scm_helper.notify import notify
 
 
 class CodesOfConduct(Entities):
@@ -38,18 +28,19 @@ class CodesOfConduct(Entities):
         """
         self._raw_data = []
 
-        notify(f"{self._name}... ")
+        self.progress(f"{self._name}... ")
 
         entities = self.scm.api_read(self._url, 1)
         if entities is None:
             return False
         page = 1
 
-        for entity in entities:
-            guid = entity["Guid"]
-            notify(f"{page} ")
+        workers = get_config(self.scm, C_API, C_WORKERS)
+        urls = [f"{self._url}/{entity[A_GUID]}" for entity in entities]
+
+        for api_data in read_urls(self.scm, urls, workers):
+            self.progress(f"{page} ")
 
-            api_data = self.scm.api_read(f"{self._url}/{guid}", 1)
             if api_data is None:
                 return False
             self._raw_data += [api_data]
@@ -63,7 +54,7 @@ class CodesOfConduct(Entities):
                 self.count += 1
             page += 1
 
-        notify("\n")
+        self.progress("\n")
 
         return True
 
@@ -74,12 +65,15 @@ class CodesOfConduct(Entities):
     @debug_trace(5)
     def analyse(self):
         """Analyse the conduct class."""
-        if get_config(self.scm, C_CONDUCT) is None:
-            return
-
-        for code in self.entities:
+        for code in self.to_analyse():
             code.analyse()
 
+    def to_analyse(self):
+        """Codes to check."""
+        if self.scm.settings.has_conduct is False:
+            return []
+        return self.entities
+
 
 class Conduct(Entity):
     """A conduct instance."""
@@ -88,6 +82,7 @@ class Conduct(Entity):
         """Initialise."""
         super().__init__(entity, scm, url)
         self._raw_data = entity
+        self.agreed = {}  # GUID: date agreed (None if not), see linkage
 
     def linkage(self, members):
         """Link code."""
@@ -95,29 +90,37 @@ class Conduct(Entity):
         for member in self.members:
             member.add_conduct(self)
 
+        agreed = {}
+        for member in self.data[A_MEMBERS]:
+            when = None
+            if member[A_DATEAGREED]:
+                when = parse_date(member[A_DATEAGREED], SCM_DATE_FORMAT)
+            guid = member[A_GUID]
+            previous = agreed.get(guid, None)
+            if previous is None or (when and when > previous):
+                agreed[guid] = when  # The latest, if listed more than once
+        self.agreed = agreed
+
+    def agreed_since(self, member, date):
+        """Has the member agreed to the code since date."""
+        when = self.agreed.get(member.guid, None)
+        return when is not None and when > date
+
     def analyse(self):
         """Analyse the conduct entry."""
         # A better way of doing this would be to add
         # the attribute to the swimmer in linkage.
         # This approach breaks the model. Oh well.
 
-        ignores = get_config(self.scm, C_CONDUCT, self.name, C_IGNORE_GROUP)
-        c_date_str = get_config(self.scm, C_CONDUCT, self.name, C_DATE)
+        cfg = self.scm.settings.code(self.name)
+        ignores = cfg.ignore_group
+        c_date = cfg.date
 
-        if c_date_str is None:
-            c_date_str = "1900-01-01"
-        c_date = datetime.datetime.strptime(c_date_str, SCM_DATE_FORMAT)
+        for guid, m_date in self.agreed.items():
+            if m_date and m_date >= c_date:
+                continue
 
-        for member in self.data[A_MEMBERS]:
-
-            if member[A_DATEAGREED]:
-                m_date = datetime.datetime.strptime(
-                    member[A_DATEAGREED], SCM_DATE_FORMAT
-                )
-                if m_date >= c_date:
-                    continue
-
-            person = self.scm.members.by_guid[member[A_GUID]]
+            person = self.scm.members.by_guid[guid]
             if person.confirmed_date:  # Will get a not confirmed error later in not set
 
                 found_ignore = False
@@ -129,7 +132,7 @@ class Conduct(Entity):
                     continue
 
                 issue(person, E_NO_CONDUCT_DATE, self.name, 0, person.first_group)
-                codes = get_config(self.scm, C_LISTS, C_CONDUCT)
+                codes = self.scm.settings.list_conduct
                 if codes:
                     for code in codes:
                         if self.name == code:
@@ -143,27 +146,19 @@ class Conduct(Entity):
 
 
 # Outside of class
-def check_conduct(member, my_codes):
+@timed
+def check_conduct(member):
     """Analyse a code of conduct."""
     # pylint: disable=too-many-branches
 
-    if get_config(member.scm, C_CONDUCT) is None:
+    if member.scm.settings.has_conduct is False:
         return
 
-    type_dict = {
-        CTYPE_SWIMMER: member.is_swimmer,
-        CTYPE_PARENT: member.is_parent,
-        CTYPE_COACH: member.is_coach,
-        CTYPE_COMMITTEE: member.is_committee_member,
-        CTYPE_VOLUNTEER: member.is_volunteer,
-        CTYPE_POLO: member.is_polo,
-        CTYPE_SYNCHRO: member.is_synchro,
-    }
-
     codes = member.scm.conduct.entities
 
     for code in codes:
-        ignores = get_config(member.scm, C_CONDUCT, code.name, C_IGNORE_GROUP)
+        cfg = member.scm.settings.code(code.name)
+        ignores = cfg.ignore_group
 
         found_ignore = False
         if ignores:
@@ -173,27 +168,12 @@ def check_conduct(member, my_codes):
         if found_ignore:
             continue
 
-        types = get_config(member.scm, C_CONDUCT, code.name, C_TYPES)
+        types = cfg.types
         if types is None:
             return
 
         for atype in types:
-            found = False
-            func = type_dict[atype]
-            if func is True:
-                for my_code in my_codes:
-                    if my_code == code:
-                        found = True
-                        break
-                if found is False:
+            if check_type(member, atype):
+                if member.guid not in code.agreed:
                     issue(member, E_NO_CONDUCT, f"{code.name}")
-
-                    if code.newdata and (A_MEMBERS in code.newdata):
-                        fix = code.newdata
-                    else:
-                        fix = {}
-
-                    fix[A_MEMBERS] = code.data[A_MEMBERS].copy()
-                    add = {A_GUID: member.guid}
-                    fix[A_MEMBERS].append(add)
-                    code.fixit(fix, f"Add {member.name}")
+                    code.fix_member(member, True, f"Add {member.name}")
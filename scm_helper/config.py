@@ -25,13 +25,18 @@ URL_WHO = f"{URL_BASE}/WhosWho"
 HELPURL = "https://github.com/ColinRobbins/scm-helper/wiki"
 
 USER_AGENT = f"SCM-Helper-v{VERSION} ###CLUB_NAME###"
+MODIFIED_SINCE = "ModifiedSince"  # Header to ask for changed records only
 
 # Do not change below here...
 
 BACKUP_DIR = "backups"
+CACHE_DIR = "cache"
+CHECKPOINT_DIR = "checkpoint"
 CONFIG_DIR = "scm-helper"
 CONFIG_FILE = "config.yaml"
+CONFIG_CACHE = "config.cache"
 KEYFILE = "apikey.enc"
+SNAPSHOT_FILE = "members.enc"
 RECORDS_DIR = "records"
 
 CODES_OF_CONDUCT = "Conduct"
@@ -86,6 +91,7 @@ SCM_CSV_DATE_FORMAT = "%d/%m/%Y"
 SCM_ALT_CSV_DATE_FORMAT = "%d %b %Y"
 SCM_FALSE = "0"
 SCM_TRUE = "1"
+SCM_CHECKED = (SCM_TRUE, "Yes")  # A ticked check box
 
 
 # SCM Data Attributes
@@ -98,11 +104,19 @@ A_DOB = "DOB"
 A_FIRSTNAME = "Firstname"
 A_GUID = "Guid"
 A_ISCOACH = "IsACoach"
+A_ISCOMMITTEE = "CommitteeMember"
+A_ISLIFESAVER = "LifeSaving"
+A_ISLTS = "LTSTeacher"
 A_ISMASTER = "Masters"
+A_ISOPENWATER = "OpenWater"
 A_ISPARENT = "IsAParent"
+A_ISPOLO = "WaterPolo"
+A_ISSWIMMER = "IsASwimmer"
+A_ISSYNCHRO = "SynchronisedSwimming"
 A_ISVOLUNTEER = "IsAVolunteer"
 A_KNOWNAS = "KnownAs"
 A_LAST_ATTENDED = "LastAttended"
+A_LAST_MODIFIED = "LastModifiedDate"
 A_LASTNAME = "Lastname"
 A_MAX_MEMBERS = "MaxMembers"
 A_MEMBERS = "Members"
@@ -119,8 +133,10 @@ C_ALIGN_QUARTER = "align_quarter"
 C_ALL_AGES = "all_ages_u18"
 C_ALLOW_GROUP = "allow_group"
 C_ALLOW_UPDATE = "allow_update"
+C_API = "api"
 C_BASE_URL = "base_url"
 C_BROWSER = "browser"
+C_CACHE = "cache"
 C_CHECK_DBS = "check_dbs"
 C_CHECK_PERMISSIONS = "check_permissions"
 C_CHECK_RESTRICTIONS = "check_restrictions"
@@ -134,6 +150,7 @@ C_COACHES = "coaches"
 C_CONDUCT = "conduct"
 C_CONF_DIFF = "confirmation_difference"
 C_CONFIRMATION = "confirmation"
+C_CONNECT_TIMEOUT = "connect_timeout"
 C_COVID = "covid"
 C_DATE = "date"
 C_DBS = "dbs"
@@ -143,6 +160,7 @@ C_EDIT = "edit"
 C_ELEMENTS = "elements"
 C_ELEMENTS2 = "elements2"
 C_EMAIL = "email"
+C_ENTITY_TTL = "entity_ttl"
 C_EXCLUDE_MAX = "exclude_from_max_sessions"
 C_EXPIRY = "expiry"
 C_FACEBOOK = "facebook"
@@ -172,9 +190,12 @@ C_MANDATORY = "mandatory"
 C_MAPPING = "mapping"
 C_MAX_AGE = "max_age"
 C_MAX_AGE_EOY = "max_age_eoy"
+C_MAX_REQUESTS = "max_requests"
 C_MAX_SESSIONS = "max_sessions"
+C_MAX_SIZE = "max_size"
 C_MAX_YEAR = "max_year"
 C_MEMBERS = "members"
+C_MEMBER_SYNC = "member_sync"
 C_MESSAGE = "message"
 C_MIN_AGE = "min_age"
 C_MIN_AGE_EOY = "min_age_eoy"
@@ -191,10 +212,13 @@ C_PARENTS = "parents"
 C_PASSWORD = "password"
 C_PREFIX = "prefix"
 C_PRIORITY = "priority"
+C_PROCESSES = "processes"
+C_READ_TIMEOUT = "read_timeout"
 C_RECORDS = "records"
 C_RECORDSET = "recordset"
 C_REGISTER = "register"
 C_RELAY = "relay"
+C_RETRIES = "retries"
 C_ROLE = "role"
 C_ROLES = "roles"
 C_SE_ONLY = "se_only"
@@ -211,6 +235,7 @@ C_SWIMMERS = "swimmers"
 C_TEST_ID = "test_id"
 C_TIME = "time"
 C_TLS = "tls"
+C_TTL = "ttl"
 C_TYPE = "type"
 C_TYPES = "types"
 C_UNIQUE = "unique"
@@ -219,6 +244,8 @@ C_USERNAME = "username"
 C_VERIFY = "verify"
 C_VOLUNTEER = "volunteer"
 C_WEB_DRIVER = "web_driver"
+C_WORKERS = "workers"
+C_WRITERS = "writers"
 C_XPATH = "xpath"
 
 CTYPE_COACH = "coach"
@@ -247,12 +274,59 @@ CTYPES = [
     CTYPE_VOLUNTEER,
 ]
 
+# Member types, as bits in Member.types
+T_COACH = 0x001
+T_COMMITTEE = 0x002
+T_LIFESAVER = 0x004
+T_LTS = 0x008
+T_MASTER = 0x010
+T_OPENWATER = 0x020
+T_PARENT = 0x040
+T_POLO = 0x080
+T_SWIMMER = 0x100
+T_SYNCHRO = 0x200
+T_VOLUNTEER = 0x400
+
+CTYPE_BITS = {
+    CTYPE_COACH: T_COACH,
+    CTYPE_COMMITTEE: T_COMMITTEE,
+    CTYPE_LIFESAVER: T_LIFESAVER,
+    CTYPE_LTS: T_LTS,
+    CTYPE_MASTER: T_MASTER,
+    CTYPE_OPENWATER: T_OPENWATER,
+    CTYPE_PARENT: T_PARENT,
+    CTYPE_POLO: T_POLO,
+    CTYPE_SWIMMER: T_SWIMMER,
+    CTYPE_SYNCHRO: T_SYNCHRO,
+    CTYPE_VOLUNTEER: T_VOLUNTEER,
+}
+
+# SCM check box for each member type
+TYPE_ATTRIBUTES = {
+    A_ISCOACH: T_COACH,
+    A_ISCOMMITTEE: T_COMMITTEE,
+    A_ISLIFESAVER: T_LIFESAVER,
+    A_ISLTS: T_LTS,
+    A_ISMASTER: T_MASTER,
+    A_ISOPENWATER: T_OPENWATER,
+    A_ISPARENT: T_PARENT,
+    A_ISPOLO: T_POLO,
+    A_ISSWIMMER: T_SWIMMER,
+    A_ISSYNCHRO: T_SYNCHRO,
+    A_ISVOLUNTEER: T_VOLUNTEER,
+}
+
 O_NEWSTARTER = "--newstarter"
 O_TO = "--to"
 O_VERIFY = "--verify"
 O_BACKUP = "--backup"
 O_FORMAT = "--format"
 O_FIX = "--fix"
+O_BULK = "--bulk"
+O_LISTS = "--lists"
+O_REFRESH = "--refresh"
+O_DUMP = "--dump"
+O_RESTORE = "--restore"
 
 VAR_CONDUCT = []
 VAR_GROUP = []
@@ -303,6 +377,21 @@ SCHEMA = Schema(
         C_CLUB: str,
         C_ALLOW_UPDATE: bool,
         Optional(C_DEBUG_LEVEL): int,
+        Optional(C_API): {
+            Optional(C_WORKERS): And(int, lambda n: n >= 1),
+            Optional(C_MAX_REQUESTS): And(int, lambda n: n >= 1),
+            Optional(C_CONNECT_TIMEOUT): And(int, lambda n: n >= 1),
+            Optional(C_READ_TIMEOUT): And(int, lambda n: n >= 1),
+            Optional(C_RETRIES): And(int, lambda n: n >= 0),
+            Optional(C_WRITERS): And(int, lambda n: n >= 1),
+            Optional(C_PROCESSES): And(int, lambda n: n >= 1),
+            Optional(C_MEMBER_SYNC): And(int, lambda n: n >= 1),
+            Optional(C_CACHE): {
+                Optional(C_TTL): And(int, lambda n: n >= 0),
+                Optional(C_MAX_SIZE): And(int, lambda n: n >= 1),
+                Optional(C_ENTITY_TTL): {Optional(str): And(int, lambda n: n >= 0)},
+            },
+        },
         Optional(C_EMAIL): {
             C_USERNAME: str,
             C_SMTP_SERVER: str,
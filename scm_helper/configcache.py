@@ -0,0 +1,118 @@
+"""Cache of the parsed and verified config file, keyed on its content."""
+
+import hashlib
+import json
+import os
+import os.path
+import re
+from pathlib import Path
+
+from scm_helper.config import (
+    CONFIG_CACHE,
+    CONFIG_DIR,
+    SCHEMA,
+    VAR_CONDUCT,
+    VAR_GROUP,
+    VAR_ISSUE,
+    VAR_ROLE,
+    VAR_SESSION,
+)
+from scm_helper.issue import debug
+from scm_helper.version import VERSION
+
+# Labels in the cache
+K_CONFIG = "config"
+K_HASH = "hash"
+K_VARS = "vars"
+
+# Names registered while verifying the schema
+VARS = {
+    "conduct": VAR_CONDUCT,
+    "group": VAR_GROUP,
+    "issue": VAR_ISSUE,
+    "role": VAR_ROLE,
+    "session": VAR_SESSION,
+}
+
+
+def config_cache_file():
+    """Config cache filename."""
+    home = str(Path.home())
+    return os.path.join(home, CONFIG_DIR, CONFIG_CACHE)
+
+
+def schema_fingerprint():
+    """The schema the config was verified against, as text."""
+    # Without the addresses of the functions in it, which change every run
+    return re.sub(r" at 0x[0-9a-fA-F]+", "", repr(SCHEMA))
+
+
+def config_hash(data):
+    """Key for the cache: the config file contents, the version and the schema."""
+    digest = hashlib.sha256(VERSION.encode())
+    digest.update(schema_fingerprint().encode())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def read_config_cache(key):
+    """
+    Config, if the cache is for the same config file (None if not).
+
+    The names registered with the schema are restored too,
+    as verify_schema() would have done.
+    """
+    filename = config_cache_file()
+    if os.path.isfile(filename) is False:
+        return None
+
+    try:
+        with open(filename, "r", encoding="utf8") as file:
+            cache = json.load(file)
+        if cache[K_HASH] == key:
+            names = {name: list(cache[K_VARS][name]) for name in VARS}
+            for name, var in VARS.items():
+                var.clear()
+                var.extend(names[name])
+            debug("Using cached config: %s", 5, filename)
+            return cache[K_CONFIG]
+    except (OSError, ValueError, KeyError, TypeError, RecursionError):
+        pass  # Damaged, or not a cache - read the config file instead
+
+    debug("Config cache not usable - ignoring", 5)
+    return None
+
+
+def write_config_cache(key, config):
+    """
+    Save a config that has been verified.
+
+    As JSON, which loads much faster than YAML - but only if it reads back
+    the same (YAML can have dates, and keys that are not strings).
+    """
+    cache = {
+        K_HASH: key,
+        K_CONFIG: config,
+        K_VARS: {name: list(var) for name, var in VARS.items()},
+    }
+
+    try:
+        data = json.dumps(cache)
+        if json.loads(data) != cache:
+            debug("Config cannot be cached", 5)
+            return False
+    except (TypeError, ValueError) as error:
+        debug("Config cannot be cached: %s", 5, error)
+        return False
+
+    filename = config_cache_file()
+    tmp = f"{filename}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf8") as file:
+            file.write(data)
+        os.replace(tmp, filename)
+        return True
+
+    except OSError as error:
+        debug("Cannot write config cache: %s", 1, error)
+        return False
@@ -51,6 +51,19 @@ class Crypto:
             notify("Cannot encrypt file - token error?\n")
             return False
 
+    def encrypt_data(self, data):
+        """Encrypt data (bytes)."""
+        fernet = Fernet(self.__key)
+        return fernet.encrypt(data)
+
+    def decrypt_data(self, data):
+        """Decrypt data (bytes), None if it cannot be decrypted."""
+        try:
+            fernet = Fernet(self.__key)
+            return fernet.decrypt(data)
+        except InvalidToken:
+            return None
+
     def encrypt_backup(self, name, data):
         """Encrypt file."""
         try:
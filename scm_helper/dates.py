@@ -0,0 +1,91 @@
+"""Date parsing - the same few dates are parsed many times, so make it quick."""
+
+import datetime
+
+from scm_helper.config import PRINT_DATE_FORMAT, SCM_CSV_DATE_FORMAT, SCM_DATE_FORMAT
+
+CACHE_MAX = 100000  # Dates per format, there are not many distinct ones
+
+_CACHE = {}
+
+
+def _ymd(text, sep):
+    """Parse YYYY<sep>MM<sep>DD, None if it is not laid out like that."""
+    if len(text) == 10 and text[4] == sep and text[7] == sep:
+        digits = text[0:4] + text[5:7] + text[8:10]
+        if digits.isascii() and digits.isdigit():
+            return datetime.datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    return None
+
+
+def _dmy(text, sep):
+    """Parse DD<sep>MM<sep>YYYY, None if it is not laid out like that."""
+    if len(text) == 10 and text[2] == sep and text[5] == sep:
+        digits = text[0:2] + text[3:5] + text[6:10]
+        if digits.isascii() and digits.isdigit():
+            return datetime.datetime(int(text[6:10]), int(text[3:5]), int(text[0:2]))
+    return None
+
+
+# Format: (parser, separator) for the fixed width formats used by SCM
+FAST_FORMATS = {
+    SCM_DATE_FORMAT: (_ymd, "-"),
+    SCM_CSV_DATE_FORMAT: (_dmy, "/"),
+    PRINT_DATE_FORMAT: (_dmy, "-"),
+}
+
+
+def _parse(text, xformat):
+    """Parse a date, without the cache."""
+    fast = FAST_FORMATS.get(xformat, None)
+    if fast:
+        func, sep = fast
+        try:
+            res = func(text, sep)
+            if res:
+                return res
+        except ValueError:
+            pass  # e.g. 31st February, let strptime report it
+    return datetime.datetime.strptime(text, xformat)
+
+
+def parse_date(text, xformat=SCM_DATE_FORMAT):
+    """Parse a date, as datetime.strptime (raises ValueError)."""
+    cache = _CACHE.get(xformat, None)
+    if cache is None:
+        cache = _CACHE.setdefault(xformat, {})
+    res = cache.get(text, None)
+    if res is None:
+        res = _parse(text, xformat)
+        if len(cache) < CACHE_MAX:
+            cache[text] = res  # datetime is immutable, so can be shared
+    return res
+
+
+class DateFormats:
+    """Parse dates in a file that uses one of several formats."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, formats):
+        """Initialise."""
+        self.formats = formats
+        self.found = formats[0]  # The format that worked last time
+
+    def parse(self, text):
+        """Parse a date, trying the last format that worked first."""
+        try:
+            return parse_date(text, self.found)
+        except ValueError as err:
+            error = err
+
+        for xformat in self.formats:
+            if xformat == self.found:
+                continue
+            try:
+                res = parse_date(text, xformat)
+                self.found = xformat
+                return res
+            except ValueError as err:
+                error = err
+        raise error
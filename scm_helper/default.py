@@ -360,6 +360,31 @@ issues:
 #    se_only: false
 
 
+##################################################
+# SCM API access
+##################################################
+
+#api:
+#  workers: 4      # Number of pages (or codes of conduct) to read at the same time
+#  max_requests: 8 # Read Members, Groups, Sessions etc at the same time,
+#                  # with no more than this many requests to SCM at once
+#  connect_timeout: 30  # Seconds to wait to connect to SCM
+#  read_timeout: 30     # Seconds to wait for SCM to respond
+#  retries: 3           # Times to retry if SCM is busy, or does not respond
+#  writers: 4           # Fixes to write at the same time (--fix --bulk)
+#  processes: 4         # Check members etc in this many processes (large clubs)
+#  member_sync: 7   # Only read members changed since the last run,
+#                   # reading all members every 7 days (or with --refresh)
+#  cache:            # Keep a local (encrypted) copy of data read from SCM
+#    ttl: 900        # Seconds to use the copy, without checking with SCM
+#    max_size: 50    # MBytes
+#    entity_ttl:     # Override ttl by type (as used by --dump)
+#      member: 300
+#      list: 0       # Always check with SCM
+#                    # Use --refresh to ignore the cache.
+#                    # --fix, --lists, --backup and the GUI always check with SCM.
+
+
 
 # Debug level, set to 0 for no debug info
 debug_level: 0
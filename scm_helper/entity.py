@@ -1,37 +1,36 @@
 """SCM entity superclass."""
 
 import csv
-import datetime
 import json
 import pprint
 import sys
 
+from scm_helper.checkpoint import delete_checkpoint, read_checkpoint, write_checkpoint
 from scm_helper.config import (
     A_ACTIVE,
     A_ARCHIVED,
     A_GUID,
     A_MEMBERS,
-    CTYPE_COACH,
-    CTYPE_COMMITTEE,
-    CTYPE_LIFESAVER,
-    CTYPE_LTS,
-    CTYPE_MASTER,
-    CTYPE_OPENWATER,
-    CTYPE_PARENT,
-    CTYPE_POLO,
-    CTYPE_SWIMMER,
-    CTYPE_SYNCHRO,
-    CTYPE_VOLUNTEER,
+    C_API,
+    C_WORKERS,
+    CTYPE_BITS,
+    SCM_CHECKED,
     SCM_DATE_FORMAT,
+    TYPE_ATTRIBUTES,
+    get_config,
 )
+from scm_helper.dates import parse_date
+from scm_helper.fetch import read_pages
 from scm_helper.issue import E_INACTIVE, debug, debug_trace, issue
 from scm_helper.notify import interact, interact_yesno, notify
+from scm_helper.rules import record
 
 
 class Entities:
     """Superclass for Entities."""
 
     # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-public-methods
     # Need them all!
 
     def __init__(self, scm, name, url):
@@ -40,32 +39,70 @@ class Entities:
         self.by_guid = {}
         self.by_name = {}
         self.knownas = {}
+        self.member_index = {}  # name: {member: entity}, built in linkage
         self.scm = scm
         self._name = name
         self._url = url
         self.count = 0
         self._raw_data = []
+        self._progress = None
+
+    @property
+    def keep_raw(self):
+        """Keep the data read from SCM, as read (for backup, dump...)."""
+        return True
 
     def get_data(self):
         """Get data."""
-        notify(f"{self._name}... ")
-        loop = 100
-        page = 1
+        self.progress(f"{self._name}... ")
+        workers = get_config(self.scm, C_API, C_WORKERS)
         count = 0
-        while loop == 100:
-            if count != 0:
-                notify(f"{count} ")
-            data = self.scm.api_read(self._url, page)
+
+        # Continue from where an earlier (failed) read got to
+        pages = read_checkpoint(self.scm, self._url)
+        if pages:
+            self.progress(f"(continuing from page {len(pages) + 1}) ")
+        for data in pages:
+            count += self.create_entities(data)
+            if self.keep_raw:
+                self._raw_data += data
+
+        first = len(pages) + 1
+        for data in read_pages(self.scm, self._url, workers, first=first):
             if data is None:
+                if write_checkpoint(self.scm, self._url, pages):
+                    self.progress(f"\nSaved {count} {self._name}, rerun to continue.\n")
                 return False
-            loop = self.create_entities(data)
-            self._raw_data += data
-            page += 1
-            count += loop
-
-        notify(f"{count}\n")
+            if count != 0:
+                self.progress(f"{count} ")
+            count += self.create_entities(data)
+            if self.keep_raw:
+                self._raw_data += data
+            pages.append(data)
+
+        delete_checkpoint(self._url)
+        self.progress(f"{count}\n")
         return True
 
+    def progress(self, msg):
+        """Report progress, or hold it back if reading in parallel."""
+        if self._progress is None:
+            notify(msg)
+        else:
+            self._progress.append(msg)
+
+    def hold_progress(self):
+        """Hold back progress messages until release_progress."""
+        self._progress = []
+
+    def release_progress(self):
+        """Return held back progress messages, and stop holding them."""
+        msg = ""
+        if self._progress:
+            msg = "".join(self._progress)
+        self._progress = None
+        return msg
+
     def parse_data(self, data):
         """Read data."""
         notify(f"{self._name}...\n")
@@ -93,14 +130,38 @@ class Entities:
 
     def analyse(self):
         """Analyse the members."""
-        for entity in self.entities:
+        for entity in self.to_analyse():
             entity.analyse()
 
+    def to_analyse(self):
+        """Entities to check (the rule is each entity's analyse, see rules.py)."""
+        return self.entities
+
+    def prepare_rules(self):
+        """Before checking in parallel, decode anything the checks decode on use."""
+        # Once, here, rather than in every worker - and notes can raise issues
+        self.scm.members.decode_all()
+
+    def rule_groups(self, entities):
+        """Rows of entities that must be checked together, in order."""
+        return [[row] for row in range(len(entities))]
+
     def linkage(self):
         """Create Member links."""
         for entity in self.entities:
             entity.linkage(self.scm.members)
 
+    def index_member(self, entity, member):
+        """Index a member linked to entity (first entity of a name wins)."""
+        self.member_index.setdefault(entity.name, {}).setdefault(member, entity)
+
+    def linked_entity(self, name, member):
+        """Entity called name that member is linked to, or None."""
+        links = self.member_index.get(name)
+        if links:
+            return links.get(member)
+        return None
+
     def print_name(self):
         """Print name."""
         for entity in self.entities:
@@ -116,6 +177,7 @@ class Entities:
         self.by_guid = {}
         self.by_name = {}
         self.knownas = {}
+        self.member_index = {}
         self.count = 0
         self._raw_data = []
 
@@ -155,10 +217,30 @@ class Entities:
         """Return name."""
         return self._name
 
+    @property
+    def url(self):
+        """Return URL."""
+        return self._url
+
 
 class Entity:
     """A entity."""
 
+    # pylint: disable=too-many-instance-attributes
+    # Need them all!
+
+    # Subclasses with many entities (Member) add __slots__ too, to save memory
+    __slots__ = (
+        "data",
+        "newdata",
+        "fixmsg",
+        "url",
+        "members",
+        "_scm",
+        "_fix_members",
+        "_fixable",
+    )
+
     def __init__(self, entity, scm, url):
         """Initialize."""
         self.data = entity
@@ -167,6 +249,8 @@ class Entity:
         self.url = f"{url}/{self.guid}"
         self.members = []
         self._scm = scm
+        self._fix_members = None  # GUID: add (True) or remove (False)
+        self._fixable = None  # The scm.fixable list this was added to
 
     def print_exception(self, exception):
         """Is the exception allowable."""
@@ -180,10 +264,8 @@ class Entity:
         if (A_MEMBERS in self.data) and (len(self.data[A_MEMBERS]) > 0):
             for swimmer in self.data[A_MEMBERS]:
                 if swimmer[A_GUID] not in members.by_guid:
-                    msg = (
-                        f"GUID {swimmer[A_GUID]} missing in list - email address only?"
-                    )
-                    debug(msg, 7)
+                    msg = "GUID %s missing in list - email address only?"
+                    debug(msg, 7, swimmer[A_GUID])
                     continue
                 guid = members.by_guid[swimmer[A_GUID]]
                 if guid.is_active:
@@ -191,15 +273,7 @@ class Entity:
                 else:
                     name = guid.name
                     issue(self, E_INACTIVE, f"member {name}", 0, "Fixable")
-
-                    if self.newdata and (A_MEMBERS in self.newdata):
-                        fix = self.newdata
-                    else:
-                        fix = {}
-                        fix[A_MEMBERS] = self.data[A_MEMBERS].copy()
-                    remove = {A_GUID: guid.guid}
-                    fix[A_MEMBERS].remove(remove)
-                    self.fixit(fix, f"Delete {guid.name} (inactive)")
+                    self.fix_member(guid, False, f"Delete {guid.name} (inactive)")
 
     def check_attribute(self, attribute):
         """Return the value, if there is one."""
@@ -213,7 +287,7 @@ class Entity:
         date = self.check_attribute(field)
         if date is None:
             return None
-        return datetime.datetime.strptime(date, SCM_DATE_FORMAT)
+        return parse_date(date, SCM_DATE_FORMAT)
 
     def delete(self):
         """Delete."""
@@ -269,6 +343,9 @@ class Entity:
 
     def fixit(self, fix, message):
         """Prepare to fix an entity."""
+        if record(self, "fixit", fix, message):
+            return
+
         if self.newdata is None:
             self.newdata = fix
             self.fixmsg = message
@@ -276,12 +353,46 @@ class Entity:
             self.newdata.update(fix)
             self.fixmsg += f", {message}"
 
-        if self in self.scm.fixable:
+        # Only search scm.fixable (slow, with many fixes) if added to an earlier one
+        fixable = self.scm.fixable
+        if self._fixable is fixable:
+            return
+        if self._fixable is None or self not in fixable:
+            fixable.append(self)
+        self._fixable = fixable
+
+    def fix_member(self, member, add, message):
+        """Prepare to add (or remove) a member, see build_fix."""
+        if record(self, "fix_member", member, add, message):
             return
-        self.scm.fixable.append(self)
+
+        if self._fix_members is None:
+            self._fix_members = {}
+        self._fix_members[member.guid] = add
+        self.fixit({}, message)
+
+    def build_fix(self):
+        """Make the member list for the fix, from all the adds and removes."""
+        changes = self._fix_members
+        if not changes:
+            return
+        self._fix_members = None
+
+        members = []
+        found = set()
+        for member in self.data[A_MEMBERS]:
+            guid = member[A_GUID]
+            if changes.get(guid, True):
+                members.append(member)
+                found.add(guid)
+        for guid, add in changes.items():
+            if add and guid not in found:
+                members.append({A_GUID: guid})
+        self.newdata[A_MEMBERS] = members
 
     def apply_fix(self):
         """Fix an entity."""
+        self.build_fix()
         printer = pprint.PrettyPrinter(indent=4)
         data = printer.pformat(self.newdata)
         err = f"Fix '{self.name}' with:\n    {self.fixmsg}\nConfirm"
@@ -291,16 +402,20 @@ class Entity:
         if resp is False:
             return False
 
-        self.newdata[A_GUID] = self.guid
-
         notify(f"Fixing: {self.name}...")
 
-        res = self.scm.api_write(self, False)
+        res = self.write_fix()
 
         if res:
             notify("Success.\n")
         return res
 
+    def write_fix(self):
+        """Write the fix to SCM."""
+        self.build_fix()
+        self.newdata[A_GUID] = self.guid
+        return self.scm.api_write(self, False)
+
     @property
     def guid(self):
         """Guid."""
@@ -337,48 +452,30 @@ class Entity:
 # Not part of class
 def check_type(member, xtype):
     """Check each type for a match."""
-    # pylint: disable=too-many-return-statements
-    # Need them all!
-    if xtype == CTYPE_MASTER:
-        return member.is_master
-
-    if xtype == CTYPE_SWIMMER:
-        return member.is_swimmer
-
-    if xtype == CTYPE_SYNCHRO:
-        return member.is_synchro
-
-    if xtype == CTYPE_COACH:
-        return member.is_coach
-
-    if xtype == CTYPE_COMMITTEE:
-        return member.is_committee
-
-    if xtype == CTYPE_OPENWATER:
-        return member.is_openwater
-
-    if xtype == CTYPE_POLO:
-        return member.is_polo
-
-    if xtype == CTYPE_PARENT:
-        return member.is_parent
+    return (member.types & CTYPE_BITS.get(xtype, 0)) != 0
 
-    if xtype == CTYPE_VOLUNTEER:
-        return member.is_volunteer
 
-    if xtype == CTYPE_LTS:
-        return member.is_lts
+def type_mask(xtypes):
+    """Bits (Member.types) for a list of member types."""
+    mask = 0
+    for xtype in xtypes:
+        mask |= CTYPE_BITS.get(xtype, 0)
+    return mask
 
-    if xtype == CTYPE_LIFESAVER:
-        return member.is_lifesaver
 
-    return False
+def member_types(data):
+    """Member types (bits) ticked in the SCM data."""
+    types = 0
+    for attr, bit in TYPE_ATTRIBUTES.items():
+        if data.get(attr) in SCM_CHECKED:
+            types |= bit
+    return types
 
 
 def get_date(date, xformat):
     """Parse a date."""
     try:
-        res = datetime.datetime.strptime(date, xformat)
+        res = parse_date(date, xformat)
         return res
     except ValueError as error:
         notify(f"Error in date: {error}")
@@ -407,7 +504,7 @@ class Who(Entities):
 
     def get_data(self):
         """Get data."""
-        notify(f"{self._name}... ")
+        self.progress(f"{self._name}... ")
 
         data = self.scm.api_read(self._url, 1)
         if data is None:
@@ -416,7 +513,7 @@ class Who(Entities):
         # line below is subtly different, who's who data is already a list.
         self._raw_data = data
 
-        notify(f"{count}\n")
+        self.progress(f"{count}\n")
         if count != 1:
             debug("Who's who assumption failure", 0)
 
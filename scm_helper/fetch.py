@@ -0,0 +1,107 @@
+"""Concurrent reading of SCM API pages, and writing to SCM."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from scm_helper.config import C_API, C_WRITERS, get_config
+
+PAGE_SIZE = 100  # SCM returns (up to) 100 rows per page
+WRITERS = 4  # Writes to SCM at the same time
+
+
+def read_pages(scm, url, workers=1, headers=None, first=1):
+    """
+    Read all pages from a URL (starting at page first), yielding each in order.
+
+    Any headers are added to each request.
+    With more than one worker, pages are read ahead speculatively.
+    Reading stops at the first short (or empty) page.
+    None is yielded, and reading stops, if a page cannot be read.
+    """
+    if workers is None or workers <= 1:
+        page = first
+        while True:
+            data = scm.api_read(url, page, headers)
+            if data is None:
+                yield None
+                return
+            if data is False:  # 404 - no (more) data
+                return
+            yield data
+            if len(data) < PAGE_SIZE:
+                return
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for page in range(first, first + workers):
+            pending[page] = executor.submit(scm.api_read, url, page, headers)
+
+        page = first
+        next_page = first + workers
+        try:
+            while True:
+                data = pending.pop(page).result()
+                if data is None:
+                    yield None
+                    return
+                if data is False:
+                    return
+                yield data
+                if len(data) < PAGE_SIZE:
+                    return
+                pending[next_page] = executor.submit(
+                    scm.api_read, url, next_page, headers
+                )
+                next_page += 1
+                page += 1
+        finally:
+            # Past the end of the data - don't wait for the read ahead.
+            for future in pending.values():
+                future.cancel()
+
+
+def read_urls(scm, urls, workers=1):
+    """
+    Read page 1 of each URL, yielding the results in the order given.
+
+    At most 'workers' reads are in progress at once.
+    None is yielded, and reading stops, at the first read that fails.
+    """
+    if workers is None or workers <= 1:
+        for url in urls:
+            data = scm.api_read(url, 1)
+            yield data
+            if data is None:
+                return
+        return
+
+    urls = iter(urls)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for url in islice(urls, workers):
+            pending.append(executor.submit(scm.api_read, url, 1))
+
+        try:
+            while pending:
+                data = pending.popleft().result()
+                yield data
+                if data is None:
+                    return
+                for url in islice(urls, 1):
+                    pending.append(executor.submit(scm.api_read, url, 1))
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def write_all(scm, write, items):
+    """
+    Call write (which writes to SCM) for each item, returning results in order.
+
+    At most 'api: writers' writes are in progress at once.
+    """
+    writers = get_config(scm, C_API, C_WRITERS) or WRITERS
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        return list(executor.map(write, items))
@@ -1,7 +1,6 @@
 """Read and process CSV Files."""
 
 import csv
-import datetime
 import ntpath
 import re
 
@@ -20,6 +19,7 @@ from scm_helper.config import (
     SCM_DATE_FORMAT,
     get_config,
 )
+from scm_helper.dates import parse_date
 from scm_helper.files import Files
 from scm_helper.notify import notify
 
@@ -74,9 +74,7 @@ class Csv(Files):
                     # Fix DOB
                     if cfg_dob in row:
                         try:
-                            row[cfg_dob] = datetime.datetime.strptime(
-                                row[cfg_dob], cfg_dob_format
-                            )
+                            row[cfg_dob] = parse_date(row[cfg_dob], cfg_dob_format)
                         except ValueError as error:
                             notify(f"Date format error in CSV:\n{error}\n")
                             return False
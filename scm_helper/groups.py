@@ -1,24 +1,7 @@
 """SCM Group."""
 
-import datetime
-
 from scm_helper.config import (
     A_USERNAME,
-    C_CHECK_DBS,
-    C_CONFIRMATION,
-    C_GROUP,
-    C_GROUPS,
-    C_IGNORE_GROUP,
-    C_IGNORE_SWIMMER,
-    C_LOGIN,
-    C_MAX_AGE,
-    C_MIN_AGE,
-    C_NO_CLUB_SESSIONS,
-    C_NO_SESSION_ALLOWED,
-    C_NO_SESSIONS,
-    C_SESSIONS,
-    C_TYPE,
-    C_TYPES,
     CTYPE_COACH,
     CTYPE_SWIMMER,
     CTYPE_MASTER,
@@ -26,11 +9,10 @@ from scm_helper.config import (
     CTYPE_POLO,
     EXCEPTION_GROUPNOSESSION,
     EXCEPTION_NONSWIMMINGMASTER,
-    SCM_CSV_DATE_FORMAT,
     SCM_TRUE,
-    get_config,
 )
 from scm_helper.entity import Entities, Entity, check_type
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_CONFIRMATION_EXPIRED,
     E_NO_LOGIN,
@@ -42,7 +24,6 @@ from scm_helper.issue import (
     debug_trace,
     issue,
 )
-from scm_helper.notify import notify
 
 A_GROUP_NAME = "GroupName"
 
@@ -62,9 +43,10 @@ class Group(Entity):
         """Link members."""
         super().linkage(members)
 
-        no_session = self.config_item(C_NO_CLUB_SESSIONS)
-        ignore_group = self.config_item(C_IGNORE_GROUP)
-        ignore_swimmer = self.config_item(C_IGNORE_SWIMMER)
+        cfg = self.config
+        no_session = cfg.no_club_sessions
+        ignore_group = cfg.ignore_group
+        ignore_swimmer = cfg.ignore_swimmer
 
         if self.members:
             for swimmer in self.members:
@@ -77,62 +59,39 @@ class Group(Entity):
                     swimmer.set_ignore_group(True)
 
     @debug_trace(5)
+    @timed
     def analyse(self):
         """Analyse the group."""
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-statements
         # pylint: disable=too-many-locals
-        no_session = False
-        check_dbs = False
+        cfg = self.config
         wanted_session = None
-        wanted_sessions = None
-        allowed = None
-        xtype = None
-        xtypes = None
-        ignore = None
-        confirm = None
-        login = None
-
-        if self.config:
-            ignore = self.config_item(C_IGNORE_GROUP)
-            no_session = self.config_item(C_NO_SESSIONS)
-            check_dbs = self.config_item(C_CHECK_DBS)
-            wanted_sessions = self.config_item(C_SESSIONS)
-            allowed = self.config_item(C_NO_SESSION_ALLOWED)
-            xtype = self.config_item(C_TYPE)
-            xtypes = self.config_item(C_TYPES)
-            confirm = self.config_item(C_CONFIRMATION)
-            login = self.config_item(C_LOGIN)
-
-        if ignore:
-            debug(f"Ignoring group {self.name}", 7)
+        wanted_sessions = cfg.sessions
+        allowed = cfg.no_session_allowed
+        xtype = cfg.type
+        xtypes = cfg.types
+        confirm = cfg.confirmation  # Already a date
+
+        if cfg.ignore_group:
+            debug("Ignoring group %s", 7, self.name)
             return
 
         if len(self.members) == 0:
             issue(self, E_NO_SWIMMERS, "Group")
             return
 
-        if no_session:
+        if cfg.no_sessions:
             for member in self.members:
                 if len(member.sessions) > 0:
                     name = member.sessions[0].name
                     issue(member, E_SESSIONS, f"Group: {self.name}, Session: {name}")
 
-        if confirm:
-            try:
-                date = datetime.datetime.strptime(confirm, SCM_CSV_DATE_FORMAT)
-                confirm = date
-            except ValueError:
-                notify(
-                    f"*** Error in date format in config file for groups config: {confirm} ***\n"
-                )
-                confirm = None
-
         fix = {}
 
         for member in self.members:
             self.check_age(member)
-            if check_dbs:
+            if cfg.check_dbs:
                 member.check_dbs(self.name)
 
             if confirm:
@@ -161,7 +120,7 @@ class Group(Entity):
                             issue(member, E_NOT_IN_SESSION, f"Group: {self.name}")
                     break
 
-            if login:
+            if cfg.login:
                 if member.username is None:
                     issue(member, E_NO_LOGIN, f"Group: {self.name}")
                     fix[A_USERNAME] = member.email
@@ -205,11 +164,11 @@ class Group(Entity):
         mymin = 3
         mymax = 100
 
-        max_age = self.config_item(C_MAX_AGE)
+        max_age = self.config.max_age
         if max_age:
             mymax = max_age
 
-        min_age = self.config_item(C_MIN_AGE)
+        min_age = self.config.min_age
         if min_age:
             mymin = min_age
 
@@ -224,11 +183,7 @@ class Group(Entity):
     @property
     def config(self):
         """Own config parameters..."""
-        return get_config(self.scm, C_GROUPS, C_GROUP, self.name)
-
-    def config_item(self, item):
-        """Own config parameters..."""
-        return get_config(self.scm, C_GROUPS, C_GROUP, self.name, item)
+        return self.scm.settings.group(self.name)
 
 
 def check_in_session(swimmer, wanted_session, allowed):
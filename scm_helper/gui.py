@@ -87,6 +87,7 @@ class ScmGui:
         set_notify(self.notify_text)
         self.issues = IssueHandler()
         self.scm = API(self.issues)
+        self.scm.revalidate = True  # Fixes can be made from any analysis
 
         if self.scm.get_config_file() is False:
             msg = "Error in config file - see status window for details."
@@ -445,7 +446,7 @@ class ScmGui:
             self.set_buttons(NORMAL)
             return
 
-        wrap(None, self.scm.apply_fixes)
+        wrap(None, self.scm.apply_fixes_bulk)
 
         self.set_buttons(NORMAL)
 
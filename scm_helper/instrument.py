@@ -0,0 +1,247 @@
+"""Instrumentation - where the time (and memory) goes, for --profile."""
+
+import functools
+import json
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from types import FunctionType
+
+from scm_helper.config import URL_BASE
+from scm_helper.issue import TRACES
+from scm_helper.notify import notify
+from scm_helper.version import VERSION
+
+PERCENTILES = [50, 90, 99]
+MBYTE = 1024 * 1024
+
+# Functions decorated with timed: the timed version of each
+TIMERS = {}
+
+
+def percentile(values, pct):
+    """Nearest rank percentile of sorted values."""
+    if not values:
+        return 0
+    rank = max(1, round(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+def add_time(stats, name, wall, cpu):
+    """Add a timing to stats[name]."""
+    if name not in stats:
+        stats[name] = {"calls": 0, "wall": 0.0, "cpu": 0.0}
+    entry = stats[name]
+    entry["calls"] += 1
+    entry["wall"] += wall
+    entry["cpu"] += cpu
+
+
+class Profile:
+    """Collect timings, requests and memory use."""
+
+    # pylint: disable=too-many-instance-attributes
+    # Need them all!
+
+    def __init__(self):
+        """Initialise."""
+        self.active = False
+        self.filename = None
+        self.scm = None
+        self.start = 0.0
+        self.phases = {}
+        self.classes = {}
+        self.checks = {}
+        self.requests = {}
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def start_profile(self, scm, filename):
+        """Start collecting."""
+        self.active = True
+        self.scm = scm
+        self.filename = filename
+        self.start = time.perf_counter()
+        tracemalloc.start()
+        install_timers()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase (read, linkage, analyse...) of the whole run."""
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()  # All threads
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            _, peak = tracemalloc.get_traced_memory()
+            with self._lock:
+                add_time(self.phases, name, wall, cpu)
+                entry = self.phases[name]
+                entry["peak_mb"] = max(entry.get("peak_mb", 0), peak / MBYTE)
+                self.peak = max(self.peak, peak)
+
+    @contextmanager
+    def section(self, xphase, name):
+        """Time an entity class within a phase."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()  # Classes may be read in parallel
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            with self._lock:
+                add_time(self.classes.setdefault(xphase, {}), name, wall, cpu)
+
+    def add_check(self, name, wall, cpu):
+        """Record a call of a check function."""
+        with self._lock:
+            add_time(self.checks, name, wall, cpu)
+
+    def add_request(self, url, status, size, elapsed):
+        """Record a request to SCM."""
+        with self._lock:
+            if url not in self.requests:
+                self.requests[url] = {
+                    "count": 0,
+                    "cached": 0,
+                    "bytes": 0,
+                    "status": {},
+                    "latency": [],
+                }
+            entry = self.requests[url]
+            if status is None:  # Used the cache
+                entry["cached"] += 1
+                return
+            entry["count"] += 1
+            entry["bytes"] += size
+            entry["latency"].append(elapsed)
+            status = str(status)
+            entry["status"][status] = entry["status"].get(status, 0) + 1
+
+    def report(self):
+        """Collected data, as a dict for JSON."""
+        _, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+
+        requests = {}
+        for url, entry in self.requests.items():
+            latency = sorted(entry["latency"])
+            res = {key: value for key, value in entry.items() if key != "latency"}
+            for pct in PERCENTILES:
+                res[f"p{pct}"] = percentile(latency, pct)
+            res["max"] = latency[-1] if latency else 0
+            requests[url.replace(URL_BASE, "", 1)] = res  # Same on any server
+
+        entities = {}
+        if self.scm:
+            for aclass in self.scm.classes:
+                entities[aclass.name] = len(aclass.entities)
+
+        return {
+            "version": VERSION,
+            "python": platform.python_version(),
+            "wall": time.perf_counter() - self.start,
+            "cpu": time.process_time(),
+            "peak_mb": self.peak / MBYTE,
+            "entities": entities,
+            "phases": self.phases,
+            "classes": self.classes,
+            "checks": self.checks,
+            "requests": requests,
+        }
+
+    def write(self):
+        """Write the report to file."""
+        try:
+            with open(self.filename, "w", encoding="utf8") as file:
+                json.dump(self.report(), file, indent=2)
+            notify(f"Profile written to {self.filename}\n")
+        except OSError as error:
+            notify(f"Cannot write profile: {error}\n")
+
+
+PROFILE = Profile()
+
+
+def start_profile(scm, filename):
+    """Start profiling."""
+    PROFILE.start_profile(scm, filename)
+
+
+def write_profile():
+    """Write the profile (if profiling)."""
+    if PROFILE.active:
+        PROFILE.write()
+
+
+def phase(name):
+    """Context to time a phase, if profiling."""
+    if PROFILE.active:
+        return PROFILE.phase(name)
+    return nullcontext()
+
+
+def section(xphase, name):
+    """Context to time an entity class within a phase, if profiling."""
+    if PROFILE.active:
+        return PROFILE.section(xphase, name)
+    return nullcontext()
+
+
+def record_request(url, status, size, elapsed):
+    """Record a request to SCM (status None if cached), if profiling."""
+    if PROFILE.active:
+        PROFILE.add_request(url, status, size, elapsed)
+
+
+def timed(func):
+    """
+    Decorator to time a check function, if profiling.
+
+    The plain function is used, unless profiling, so there is no overhead
+    in normal use. install_timers swaps in the timed version.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapped_f(*args, **kwargs):
+        """The wrapped..."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            PROFILE.add_check(name, wall, cpu)
+
+    TIMERS[func] = wrapped_f
+    return func
+
+
+def install_timers():
+    """Use the timed version of each timed function, wherever it is used."""
+    for trace in TRACES:  # debug_trace installs its own copy of the method
+        if trace.func in TIMERS:
+            trace.func = TIMERS[trace.func]
+            trace.install()
+
+    for module in list(sys.modules.values()):
+        if getattr(module, "__name__", "").startswith("scm_helper") is False:
+            continue
+        holders = [module]  # Functions, and those imported from other modules
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and value.__module__ == module.__name__:
+                holders.append(value)  # Methods
+        for holder in holders:
+            for name, value in list(vars(holder).items()):
+                if isinstance(value, FunctionType) and value in TIMERS:
+                    setattr(holder, name, TIMERS[value])
@@ -1,8 +1,18 @@
 """Issue handling."""
 
+import functools
 from datetime import datetime
 
-from scm_helper.config import C_IGNORE_ERROR, C_ISSUES, EXCEPTION_GENERAL, O_NEWSTARTER
+from scm_helper.config import (
+    C_IGNORE_ERROR,
+    C_ISSUES,
+    EXCEPTION_GENERAL,
+    O_NEWSTARTER,
+    T_PARENT,
+    T_POLO,
+    T_SWIMMER,
+    T_SYNCHRO,
+)
 from scm_helper.notify import notify
 
 R_COACH = "coaches"
@@ -27,6 +37,14 @@ R_PRINT = {
     R_ROLE: "Roles Report",
 }
 
+# Grouping of confirmation emails, first match wins
+CONFIRM_TYPES = [
+    (T_SWIMMER, "swimmer"),
+    (T_SYNCHRO, "synchro"),
+    (T_POLO, "polo"),
+    (T_PARENT, "parent"),
+]
+
 NAME = "name"
 MESSAGE = "message"
 REPORT = "report"
@@ -427,14 +445,19 @@ ISSUE_LIST = [
 # Handler
 HANDLER = None
 
+# Methods decorated with debug_trace
+TRACES = []
+
 
 def issue(xobject, error, msg=None, level=0, msg2=""):
     """Record an issue."""
-    debug(f"ISSUE: {xobject.name}, {error[MESSAGE]} / {msg}", 5)
+    if HANDLER.debug_level >= 5:
+        debug("ISSUE: %s, %s / %s", 5, xobject.name, error[MESSAGE], msg)
 
     if level != -1:
         if xobject.print_exception(EXCEPTION_GENERAL) is False:
-            debug(f"Error ignored due to exception {xobject.name}", 3)
+            if HANDLER.debug_level >= 3:
+                debug("Error ignored due to exception %s", 3, xobject.name)
             return
 
         if level > HANDLER.debug_level:
@@ -444,48 +467,99 @@ def issue(xobject, error, msg=None, level=0, msg2=""):
             if xobject.scm.option(O_NEWSTARTER):
                 pass
             else:
-                prefix = "Error ignored - new starter - "
-                debug(f"{prefix}{xobject.name}, {error[MESSAGE]} ({msg})", 3)
+                if HANDLER.debug_level >= 3:
+                    prefix = "Error ignored - new starter - "
+                    debug("%s%s, %s (%s)", 3, prefix, xobject.name, error[MESSAGE], msg)
                 return
 
     HANDLER.add_issue(xobject, error, msg, msg2)
 
 
-def debug(msg, level):
-    """Debug error handler."""
+def debug(msg, level, *args):
+    """
+    Debug error handler.
+
+    Any args are formatted into msg (msg % args) only if the message is printed.
+    """
     if level > HANDLER.debug_level:
         return
 
+    if args:
+        msg = msg % args
     msg += "\n"
     notify(msg)
 
 
+def is_debug(level):
+    """Is debug at level on? To avoid building expensive messages."""
+    return level <= HANDLER.debug_level
+
+
 def set_debug_level(level):
     """Set debugging level."""
     if level is None:
-        HANDLER.debug_level = 0
-        return
+        level = 0
 
     HANDLER.debug_level = level
+    for trace in TRACES:
+        trace.install()
 
 
-def debug_trace(level):
-    """Decorator to provide a trace capability."""
+class Trace:
+    """
+    A method traced by debug_trace.
 
-    def wrap(func):
-        """The wrapper..."""
+    The class has the plain method, unless the debug level is high enough,
+    so there is no overhead in normal use.
+    set_debug_level swaps the methods.
+    """
+
+    def __init__(self, func, level):
+        """Initialise."""
+        self.func = func
+        self.level = level
+        self.owner = None
+        self.name = func.__name__
 
-        def wrapped_f(self, *args):
+        @functools.wraps(func)
+        def wrapped_f(xself, *args):
             """The wrapped..."""
-            name = func.__name__
-            xclass = self.__class__.__name__
+            xclass = xself.__class__.__name__
             xtime = datetime.now().time()
-            debug(f"{xtime}: Entry {name}/{xclass}/{self.name}", level)
-            retval = func(self, *args)
-            debug(f"Exit {self.name}", level)
+            debug("%s: Entry %s/%s/%s", level, xtime, self.name, xclass, xself.name)
+            retval = self.func(xself, *args)  # Timed, if profiling
+            debug("Exit %s", level, xself.name)
             return retval
 
-        return wrapped_f
+        self.traced = wrapped_f
+
+    def __set_name__(self, owner, name):
+        """Class created - register, and replace with the method to use."""
+        self.owner = owner
+        self.name = name
+        TRACES.append(self)
+        self.install()
+
+    def __get__(self, instance, owner):
+        """Not installed (yet) - act as the plain method."""
+        return self.func.__get__(instance, owner)
+
+    def install(self):
+        """Put the traced or plain method in the class."""
+        if self.owner is None:
+            return
+        if HANDLER and self.level <= HANDLER.debug_level:
+            setattr(self.owner, self.name, self.traced)
+        else:
+            setattr(self.owner, self.name, self.func)
+
+
+def debug_trace(level):
+    """Decorator to provide a trace capability."""
+
+    def wrap(func):
+        """The wrapper..."""
+        return Trace(func, level)
 
     return wrap
 
@@ -504,6 +578,7 @@ class IssueHandler:
 
         global HANDLER  # pylint: disable=global-statement
         HANDLER = self
+        set_debug_level(0)
 
     def delete(self):
         """Clear database, ready for rerun."""
@@ -548,12 +623,12 @@ class IssueHandler:
 
     def print_by_name(self, reports):
         """Print all issues by name."""
-        debug(f"Print by name called {reports}", 6)
+        debug("Print by name called %s", 6, reports)
         return print_dict(self.by_name, reports)
 
     def print_by_error(self, reports):
         """Print all issues by error."""
-        debug(f"Print by error called {reports}", 6)
+        debug("Print by error called %s", 6, reports)
         if reports is None:
             res = ""
             for report in REPORTS:
@@ -581,14 +656,10 @@ class IssueHandler:
                 _, _, report, _, entity = line
                 if report == R_CONFIRMATION:
                     key = "Other"
-                    if entity.is_parent:
-                        key = "parent"
-                    if entity.is_polo:
-                        key = "polo"
-                    if entity.is_synchro:
-                        key = "synchro"
-                    if entity.is_swimmer:
-                        key = "swimmer"
+                    for bit, name in CONFIRM_TYPES:
+                        if entity.types & bit:
+                            key = name
+                            break
                     if key in matrix:
                         matrix[key].append(entity)
                     else:
@@ -628,7 +699,7 @@ def print_dict(xdict, reports):
         for key2 in sorted(xdict[key1]):
             to_print += f"    {key2}"
 
-            debug(f"PRINT ISSUE: {key1} / {key2}", 6)
+            debug("PRINT ISSUE: %s / %s", 6, key1, key2)
             inner_match = False
             first = True
             length = len(xdict[key1][key2])
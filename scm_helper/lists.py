@@ -23,9 +23,22 @@ from scm_helper.config import (
     EXCEPTION_NOEMAIL,
     get_config,
 )
-from scm_helper.entity import Entities, Entity, check_type
+from scm_helper.entity import Entities, Entity, type_mask
+from scm_helper.fetch import write_all
+from scm_helper.instrument import timed
 from scm_helper.issue import E_LIST_ERROR, E_NO_SWIMMERS, debug_trace, issue
 from scm_helper.notify import notify
+from scm_helper.rules import record
+from scm_helper.table import (
+    AGE,
+    AGE_EOY,
+    CANDIDATE,
+    EMAIL,
+    GENDER,
+    GROUPS,
+    NO_EMAIL,
+    YEAR,
+)
 
 A_LISTNAME = "ListName"
 
@@ -39,6 +52,7 @@ class Lists(Entities):
         self._suffix = None
         self.by_name = {}
         self.newlists = []
+        self._newlists_by_name = {}
 
     def new_entity(self, entity):
         """Create a new entity for list in SCM."""
@@ -61,17 +75,26 @@ class Lists(Entities):
         self._suffix = get_config(self.scm, C_LISTS, C_SUFFIX)
 
         if lists:
+            rules = []
             for xlist in lists:
-                newlist = NewList(self.scm, xlist, self._url)
-                self.newlists.append(newlist)
-                newlist.populate()
+                newlist = self.new_list(xlist)
+                cfg = get_config(self.scm, C_LISTS, C_LIST, xlist)
+                rules.append((ListRule(self.scm, cfg), newlist))
+            self.populate(rules)
 
         # Separate for loop, as add_to_list may have created some too
+        changed = []
         for xlist in self.newlists:
-            xlist.generate_data(self._suffix)
+            if xlist.generate_data(self._suffix):
+                changed.append(xlist)
+                notify(f"Creating / Updating list: {xlist.name}\n")
+
+        unchanged = len(self.newlists) - len(changed)
+        if unchanged:
+            notify(f"{unchanged} lists unchanged\n")
 
-            if xlist.upload() is None:
-                pass  # not sure what to do, just carry on!
+        # Failures are reported by api_write - not sure what else to do, carry on!
+        write_all(self.scm, lambda xlist: xlist.upload(), changed)
 
     def delete(self):
         """Delete all members."""
@@ -81,23 +104,52 @@ class Lists(Entities):
             entity.delete()
             del entity
         self.newlists = []
+        self._newlists_by_name = {}
+
+    def new_list(self, name):
+        """Create a new list."""
+        newlist = NewList(self.scm, name, self._url)
+        self.newlists.append(newlist)
+        self._newlists_by_name.setdefault(name, newlist)
+        return newlist
 
     def add(self, name, person):
         """Add a person to a new list."""
-        for xlist in self.newlists:
-            if xlist.name == name:
-                xlist.add_member(person)
-                return
+        if record(self, "add", name, person):
+            return
 
-        newlist = NewList(self.scm, name, self._url)
-        self.newlists.append(newlist)
+        newlist = self._newlists_by_name.get(name, None)
+        if newlist is None:
+            newlist = self.new_list(name)
         newlist.add_member(person)
 
+    def populate(self, rules):
+        """Fill the lists, visiting only the members selected for each."""
+        table = self.scm.members.table
+        candidate = table.is_set(CANDIDATE)
+        email = table.is_set(EMAIL)
+        no_email = table.is_set(NO_EMAIL)
+        missing = []  # (row, list), reported in member order
+
+        for rule, newlist in rules:
+            mask = table.all_of(candidate, rule.mask(table))
+            rows = table.where(table.all_of(mask, email))
+            newlist.add_guids([table.guids[row] for row in rows])
+            for row in table.where(table.all_of(mask, no_email)):
+                missing.append((row, newlist))
+
+        for row, newlist in sorted(missing, key=lambda item: item[0]):
+            member = table.members[row]
+            if member.print_exception(EXCEPTION_NOEMAIL):
+                msg = f"No email, but required for email list {newlist.name}"
+                issue(member, E_LIST_ERROR, msg)
+
 
 class List(Entity):
     """An existing list."""
 
     @debug_trace(5)
+    @timed
     def analyse(self):
         """Analyse existing lists."""
         if len(self.members) == 0:
@@ -109,13 +161,7 @@ class List(Entity):
                 # Never get here as entity linkage prevents it.
                 msg = f"Inactive but on email list {self.name} (fixable)"
                 issue(member, E_LIST_ERROR, msg)
-                if self.newdata and (A_MEMBERS in self.newdata):
-                    fix = self.newdata
-                else:
-                    fix = {}
-                    fix[A_MEMBERS] = self.data[A_MEMBERS].copy()
-                fix[A_MEMBERS].remove({A_GUID: member.guid})
-                self.fixit(fix, f"Delete {member.name}")
+                self.fix_member(member, False, f"Delete {member.name}")
 
             if member.email is None:
                 issue(member, E_LIST_ERROR, f"No email, but on email list {self.name}")
@@ -136,7 +182,8 @@ class NewList(Entity):
         # pylint: disable=super-init-not-called
         # Do not call super...
         self.data = None
-        self.members = []
+        self.members = []  # GUIDs, in the order added
+        self._guids = set()
         self._scm = scm
         self.ignore = False
         self._name = xlist
@@ -144,121 +191,8 @@ class NewList(Entity):
         self.newdata = {}
         self.url = url
 
-    def populate(self):
-        """Search for entries and fill the list."""
-        # pylint: disable=too-many-branches, too-many-statements
-        # pylint: disable=too-many-locals
-        cfg = get_config(self.scm, C_LISTS, C_LIST, self.name)
-
-        # set defaults
-        min_age = 0
-        if C_MIN_AGE in cfg:
-            min_age = cfg[C_MIN_AGE]
-
-        max_age = 999
-        if C_MAX_AGE in cfg:
-            max_age = cfg[C_MAX_AGE]
-
-        min_age_eoy = 0
-        if C_MIN_AGE_EOY in cfg:
-            min_age_eoy = cfg[C_MIN_AGE_EOY]
-
-        max_age_eoy = 999
-        if C_MAX_AGE_EOY in cfg:
-            max_age_eoy = cfg[C_MAX_AGE_EOY]
-
-        min_year = 1900
-        if C_MIN_YEAR in cfg:
-            min_year = cfg[C_MIN_YEAR]
-
-        max_year = 2200
-        if C_MAX_YEAR in cfg:
-            max_year = cfg[C_MAX_YEAR]
-
-        # pylint: disable=too-many-nested-blocks
-        for member in self.scm.members.entities:
-
-            if member.is_active is False:
-                continue
-
-            if member.in_ignore_group:
-                continue
-
-            if member.age and (member.age < min_age):
-                continue
-
-            if member.age and (member.age > max_age):
-                continue
-
-            if member.age_eoy and (member.age_eoy < min_age_eoy):
-                continue
-
-            if member.age_eoy and (member.age_eoy > max_age_eoy):
-                continue
-
-            if member.dob and (member.dob.year > max_year):
-                continue
-
-            if member.dob and (member.dob.year < min_year):
-                continue
-
-            found = True
-            xgroups = []
-            if C_GROUP in cfg:
-                xgroups = [cfg[C_GROUP]]
-                found = False
-            if C_GROUPS in cfg:
-                xgroups = cfg[C_GROUPS]
-                found = False
-
-            end_loop = False
-            for xgroup in xgroups:
-                if member.find_group(xgroup) is True:
-                    found = True
-                    if C_UNIQUE in cfg:
-                        if len(member.groups) > 1:
-                            if C_ALLOW_GROUP not in cfg:
-                                end_loop = True
-                            if member.find_group(cfg[C_ALLOW_GROUP]) is False:
-                                end_loop = True
-
-            if end_loop or not found:
-                continue
-
-            if C_GENDER in cfg:
-                gender = cfg[C_GENDER]
-                xgender = "F"
-                if gender == "male":
-                    xgender = "M"
-                if member.gender != xgender:
-                    continue
-
-            found = True
-            xtypes = []
-            if C_TYPE in cfg:
-                xtypes = [cfg[C_TYPE]]
-                found = False
-            if C_GROUPS in cfg:
-                xtypes = cfg[C_TYPES]
-                found = False
-
-            for xtype in xtypes:
-                if check_type(member, xtype) is True:
-                    found = True
-
-            if not found:
-                continue
-
-            if member.email is None:
-                if member.print_exception(EXCEPTION_NOEMAIL):
-                    msg = f"No email, but required for email list {self.name}"
-                    issue(member, E_LIST_ERROR, msg)
-                continue
-
-            self.add_member(member)
-
     def generate_data(self, suffix):
-        """Create data to upload."""
+        """Create data to upload, returning False if the list is unchanged."""
         listname = f"{self.name}{suffix}"
         self.newdata[A_LISTNAME] = listname
         self.newdata[A_MEMBERS] = []
@@ -271,20 +205,95 @@ class NewList(Entity):
             self.newdata[A_GUID] = xlist.guid
             self.new_list = False
 
+            # Only need to upload if the members have changed
+            existing = xlist.data.get(A_MEMBERS) or []
+            existing = {member[A_GUID] for member in existing}
+            return existing != self._guids
+
+        return True
+
     def upload(self):
         """Create data to upload."""
-        notify(f"Creating / Updating list: {self.name}\n")
         return self.scm.api_write(self, self.new_list)
 
     def add_member(self, member):
         """Add a member to the list."""
-        if member.guid in self.members:
-            return  # Already on list
-
         if member.email:
-            self.members.append(member.guid)
+            self.add_guids([member.guid])
+
+    def add_guids(self, guids):
+        """Add members (with an email address) to the list, by GUID."""
+        for guid in guids:
+            if guid in self._guids:
+                continue  # Already on list
+            self.members.append(guid)
+            self._guids.add(guid)
 
     @property
     def name(self):
         """name."""
         return self._name
+
+
+class ListRule:
+    """Which members belong on a list, from its config."""
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+    # Need them all!
+
+    def __init__(self, scm, cfg):
+        """Initialise."""
+        self.scm = scm
+        self.min_age = cfg.get(C_MIN_AGE, 0)
+        self.max_age = cfg.get(C_MAX_AGE, 999)
+        self.min_age_eoy = cfg.get(C_MIN_AGE_EOY, 0)
+        self.max_age_eoy = cfg.get(C_MAX_AGE_EOY, 999)
+        self.min_year = cfg.get(C_MIN_YEAR, 1900)
+        self.max_year = cfg.get(C_MAX_YEAR, 2200)
+
+        self.groups = None
+        if C_GROUP in cfg:
+            self.groups = [cfg[C_GROUP]]
+        if C_GROUPS in cfg:
+            self.groups = cfg[C_GROUPS]
+        self.unique = C_UNIQUE in cfg
+        self.allow_group = cfg.get(C_ALLOW_GROUP, None)
+
+        self.gender = None
+        if C_GENDER in cfg:
+            self.gender = "M" if cfg[C_GENDER] == "male" else "F"
+
+        self.types = None
+        if C_TYPE in cfg:
+            self.types = type_mask([cfg[C_TYPE]])
+        if C_TYPES in cfg:
+            self.types = type_mask(cfg[C_TYPES])
+
+    def mask(self, table):
+        """Which members of the table belong on the list (email aside)."""
+        masks = [
+            table.between(AGE, self.min_age, self.max_age),
+            table.between(AGE_EOY, self.min_age_eoy, self.max_age_eoy),
+            table.between(YEAR, self.min_year, self.max_year),
+        ]
+
+        if self.groups is not None:
+            groups = self.scm.groups
+            masks.append(
+                table.any_of(*[table.in_group(groups, x) for x in self.groups])
+            )
+            if self.unique:
+                others = table.more_than(GROUPS, 1)
+                if self.allow_group is not None:
+                    allowed = table.in_group(groups, self.allow_group)
+                    others = table.all_of(others, table.none_of(allowed))
+                masks.append(table.none_of(others))
+
+        if self.gender:
+            masks.append(table.equal(GENDER, self.gender))
+
+        if self.types is not None:
+            masks.append(table.has_type(self.types))
+
+        return table.all_of(*masks)
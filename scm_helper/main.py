@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 """SCM support tools."""
+import atexit
 import getopt
 import sys
 
@@ -7,6 +8,7 @@ from scm_helper.api import API
 from scm_helper.config import HELPURL
 from scm_helper.facebook import Facebook
 from scm_helper.file import Csv
+from scm_helper.instrument import phase, start_profile, write_profile
 from scm_helper.issue import REPORTS, IssueHandler
 from scm_helper.notify import notify, set_notify
 from scm_helper.records import Records
@@ -20,6 +22,7 @@ Where <options> are:
    --analyse = run analysis on archive date
    --archive <date> = which archive to use in restore
    --backup = backup
+   --bulk = with --fix, confirm all fixes at once, and apply them at the same time
    --coaches = report of coaches per session
    --confirm_email = print email addresses for confirm errors
    --covid = print a list of sessions with who has replied to the Covid declaration
@@ -36,8 +39,10 @@ Where <options> are:
    --newstarter = report on new starters anyway (normally inhibited)
    --notes = print notes
    --password <password> = supply the password - useful for scripting.
+   --profile <file> = write timings, requests and memory use to <file> (JSON)
    -q, --quiet = quiet mode
    --records = process records
+   --refresh = re-read data from SCM, rather than using the local cache
    --newtimes <csvfile> = process new swim times into records
    --report <report> = which reports to run
    --restore <type> = restore an entity of <type> (need -archive as well)
@@ -55,6 +60,7 @@ LONG_OPTS = [
     "analyse",
     "archive=",
     "backup",
+    "bulk",
     "coaches",
     "confirm_email",
     "covid",
@@ -72,8 +78,10 @@ LONG_OPTS = [
     "newtimes=",
     "notes",
     "password=",
+    "profile=",
     "quiet",
     "records",
+    "refresh",
     "report=",
     "restore=",
     "se",
@@ -136,7 +144,13 @@ def cmd(argv=None):
 
     parse_opts(argv, scm)
 
-    if scm.initialise(scm.option("--password")) is False:
+    if scm.option("--profile"):
+        start_profile(scm, scm.option("--profile"))
+        atexit.register(write_profile)  # Lots of exit points...
+
+    with phase("config"):
+        res = scm.initialise(scm.option("--password"))
+    if res is False:
         sys.exit()
 
     output = ""
@@ -203,7 +217,8 @@ def cmd(argv=None):
         sys.exit()
 
     if scm.option("--coaches"):
-        output = scm.sessions.print_coaches()
+        with phase("report"):
+            output = scm.sessions.print_coaches()
         if scm.option("--email"):
             send_email(scm, output, "SCM: Coaches Report")
         else:
@@ -260,7 +275,8 @@ def cmd(argv=None):
         sys.exit()
 
     if scm.option("--sessions"):
-        output = scm.members.print_swimmers_sessions()
+        with phase("report"):
+            output = scm.members.print_swimmers_sessions()
         if scm.option("--email"):
             send_email(scm, output, "SCM: Swimmers Per Session Report")
         else:
@@ -289,12 +305,13 @@ def cmd(argv=None):
             scm.apply_fixes()
         sys.exit()
 
-    if scm.option("--errors"):
-        output = issues.print_by_error(reports)
-    elif scm.option("--member"):
-        output = issues.print_by_name(reports)
-    else:
-        output = issues.print_by_error(reports)
+    with phase("report"):
+        if scm.option("--errors"):
+            output = issues.print_by_error(reports)
+        elif scm.option("--member"):
+            output = issues.print_by_name(reports)
+        else:
+            output = issues.print_by_error(reports)
 
     if scm.option("--email"):
         if reports:
@@ -1,7 +1,6 @@
 """SCM Members."""
 
 # pylint: disable=too-many-lines
-import datetime
 import re
 
 from scm_helper.coach import analyse_coach
@@ -13,34 +12,11 @@ from scm_helper.config import (
     A_DOB,
     A_FIRSTNAME,
     A_GUID,
-    A_ISCOACH,
-    A_ISMASTER,
-    A_ISPARENT,
-    A_ISVOLUNTEER,
     A_KNOWNAS,
+    A_LAST_MODIFIED,
     A_LASTNAME,
     A_PARENTS,
     A_USERNAME,
-    C_ALIGN_QUARTER,
-    C_CONFIRMATION,
-    C_DBS,
-    C_EXPIRY,
-    C_GRACE,
-    C_GROUP,
-    C_GROUPS,
-    C_IGNORE,
-    C_IGNORE_COACH,
-    C_IGNORE_COMMITTEE,
-    C_IGNORE_UNKNOWN,
-    C_INACTIVE,
-    C_JOBTITLE,
-    C_LISTS,
-    C_MEMBERS,
-    C_NAME,
-    C_NEWSTARTER,
-    C_PRIORITY,
-    C_TIME,
-    C_TYPES,
     CTYPE_COACH,
     CTYPE_COMMITTEE,
     CTYPE_MASTER,
@@ -54,9 +30,21 @@ from scm_helper.config import (
     EXCEPTION_NOSAFEGUARD,
     PRINT_DATE_FORMAT,
     SCM_DATE_FORMAT,
-    get_config,
+    T_COACH,
+    T_COMMITTEE,
+    T_LIFESAVER,
+    T_LTS,
+    T_MASTER,
+    T_OPENWATER,
+    T_PARENT,
+    T_POLO,
+    T_SWIMMER,
+    T_SYNCHRO,
+    T_VOLUNTEER,
 )
-from scm_helper.entity import Entity, get_date, print_all
+from scm_helper.dates import parse_date
+from scm_helper.entity import Entity, get_date, member_types, print_all
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_CATEGORY,
     E_CONFIRMATION_EXPIRED,
@@ -80,10 +68,12 @@ from scm_helper.issue import (
     E_UNKNOWN,
     debug,
     debug_trace,
+    is_debug,
     issue,
 )
 from scm_helper.notify import notify
 from scm_helper.parent import analyse_parent
+from scm_helper.rules import record
 from scm_helper.swimmer import analyse_swimmer
 
 FACEBOOK_RE = re.compile(r"Facebook: *([a-zA-Z\- ]+)")
@@ -97,6 +87,37 @@ A_DBS_RENEWAL_DATE = "DBSRenewalDate"
 A_SAFEGUARDING_RENEWAL_DATE = "SafeguardingRenewalDate"
 A_SWIMMERS = "Swimmers"
 
+# Member data used by the checks, see Member.compact()
+# The member type check boxes are not needed, once decoded into Member.types
+MEMBER_FIELDS = [
+    A_ACTIVE,
+    A_ASA_CATEGORY,
+    A_ASA_NUMBER,
+    A_DATELEFT,
+    A_DBS_RENEWAL_DATE,
+    A_DOB,
+    A_FIRSTNAME,
+    A_GUID,
+    A_KNOWNAS,
+    A_LAST_MODIFIED,
+    A_LASTNAME,
+    A_PARENTS,
+    A_SAFEGUARDING_RENEWAL_DATE,
+    A_SWIMMERS,
+    A_USERNAME,
+    "Address1",
+    "DateJoinedClub",
+    "DetailsConfirmedCorrect",
+    "Email",
+    "Gender",
+    "HomePhone",
+    "JobTitle",
+    "LastLoggedIn",
+    "MobilePhone",
+    "Notes",
+    "SessionRestrictions",
+]
+
 CAT_MAPPING = {
     "1": "Club Train",
     "2": "Club Compete",
@@ -135,18 +156,49 @@ class Member(Entity):
     # pylint: disable=too-many-public-methods
     # Need them all!
 
+    # No __dict__, there are a lot of members
+    __slots__ = (
+        "types",
+        "_parents",
+        "_swimmers",
+        "_sessions",
+        "_coach_sessions",
+        "_restricted",
+        "_facebook",
+        "groups",
+        "_conduct",
+        "_ignore_errors",
+        "_in_ignore_swimmer",
+        "_in_ignore_group",
+        "_first_group",
+        "_lastseen",
+        "_in_coach_role",
+        "_no_session_ok",
+        "_dob",
+        "_date_joined",
+        "_last_modified",
+        "_confirmed_date",
+        "_last_login",
+        "_dates_done",
+        "_notes_done",
+        "_derived",
+    )
+
     def __init__(self, entity, scm, url):
         """Initialise."""
         super().__init__(entity, scm, url)
-        self._parents = []
-        self._swimmers = []
-        self._sessions = []
-        self._coach_sessions = []
-        self._restricted = []
-        self.facebook = []
-        self.groups = []
-        self._conduct = []
-        self.ignore_errors = []
+        self.types = member_types(entity)
+        # Tuples, most stay empty (a shared ()) or short, so smaller than lists
+        self.members = ()  # Not used by a Member
+        self._parents = ()
+        self._swimmers = ()
+        self._sessions = ()
+        self._coach_sessions = ()
+        self._restricted = ()
+        self._facebook = ()
+        self.groups = ()
+        self._conduct = ()
+        self._ignore_errors = ()
         self._in_ignore_swimmer = False
         self._in_ignore_group = False
         self._first_group = None
@@ -160,11 +212,19 @@ class Member(Entity):
         self._confirmed_date = None
         self._last_login = None
 
-        self.set_dates()
-        self.get_notes()
+        # Decoded on first use, many members (e.g. archived) never need them
+        self._dates_done = False
+        self._notes_done = False
+        self._derived = None  # See derived()
+
+    def compact(self):
+        """Drop the SCM data not used by the checks, to save memory."""
+        data = self.data
+        self.data = {key: data[key] for key in MEMBER_FIELDS if key in data}
 
     def get_notes(self):
         """Extract Facebook name from Notes."""
+        self._notes_done = True
         notes = self.notes
         if notes is None:
             return
@@ -173,8 +233,8 @@ class Member(Entity):
         if note:
             for facebook in note:
                 facebook = facebook.strip()
-                self.facebook.append(facebook)
-                debug(f"Found Facebook name in notes '{facebook}'", 8)
+                self._facebook += (facebook,)
+                debug("Found Facebook name in notes '%s'", 8, facebook)
 
         note = API_RE.findall(notes)
         if note is None:
@@ -197,10 +257,10 @@ class Member(Entity):
             if when:
                 excl = exclusion.group(0).strip()
                 if (self.scm.today - when).days <= 0:
-                    self.ignore_errors.append(excl)
-                    debug(f"Found API token in notes {api}", 8)
+                    self._ignore_errors += (excl,)
+                    debug("Found API token in notes %s", 8, api)
                 else:
-                    debug(f"Token expired {api}", 8)
+                    debug("Token expired %s", 8, api)
             elif gotdate:
                 issue(self, E_DATE, f"Notes: {api}")
 
@@ -226,19 +286,19 @@ class Member(Entity):
             if guid == self.guid:
                 issue(self, E_OWNPARENT)
 
-            self._parents.append(guid)
+            self._parents += (guid,)
 
     def linkage_swimmer(self, members):
         """Link swimmers."""
         for swimmer in self.data[A_SWIMMERS]:
             guid = members.by_guid[swimmer[A_GUID]]
-            self._swimmers.append(guid)
+            self._swimmers += (guid,)
 
     def linkage_restrictions(self):
         """Link restrictinos."""
         for session in self.session_restrictions:
             guid = self.scm.sessions.by_guid[session[A_GUID]]
-            self._restricted.append(guid)
+            self._restricted += (guid,)
 
     def linkage2(self):
         """Link parents to swimmers."""
@@ -247,8 +307,8 @@ class Member(Entity):
         # pylint: disable=protected-access
         for swimmer in self._swimmers:
             if len(swimmer._parents) == 0:
-                debug(f"Found swimmer - API error - recovered {swimmer.name}", 7)
-                swimmer._parents.append(self)
+                debug("Found swimmer - API error - recovered %s", 7, swimmer.name)
+                swimmer._parents += (self,)
 
     def linkage(self, members):
         """Link parents and swimmers."""
@@ -265,32 +325,21 @@ class Member(Entity):
 
     def find_session_substr(self, substring):
         """Find a session containing substring."""
-        for session in self.sessions:
-            if session.name.find(substring) >= 0:
-                return True
-        return False
+        return not self.scm.sessions.matching(substring).isdisjoint(self.sessions)
 
     def find_group(self, name):
         """Find a group containing string."""
-        for group in self.groups:
-            if name == group.name:
-                return True
-        return False
+        return self.scm.groups.linked_entity(name, self) is not None
 
     def find_conduct(self, find):
         """Find a group containing string."""
-        for codes in self._conduct:
-            if find == codes:
-                return True
-        return False
+        return find in self._conduct
 
     def get_conduct_name(self, find):
         """Get a code of conduct."""
-        for code in self._conduct:
-            if find == code.name:
-                return code
-        return None
+        return self.scm.conduct.linked_entity(find, self)
 
+    @timed
     def check_email(self):
         """Check email."""
         email = self.email
@@ -303,15 +352,16 @@ class Member(Entity):
             if space:
                 issue(self, E_EMAIL_SPACE, f"{email}")
 
+    @timed
     def check_dbs(self, xtype):
         """Check DBS and Safeguarding."""
         if self.print_exception(EXCEPTION_NODBS) is False:
-            debug(f"DBS Exception ignored: {self.name}", 7)
+            debug("DBS Exception ignored: %s", 7, self.name)
             return
 
         dbs_date = self.set_date(A_DBS_RENEWAL_DATE)
         safe_date = self.set_date(A_SAFEGUARDING_RENEWAL_DATE)
-        notice = get_config(self.scm, C_MEMBERS, C_DBS, C_EXPIRY)
+        notice = self.scm.settings.dbs_expiry
 
         if dbs_date:
             days = (dbs_date - self.scm.today).days
@@ -325,7 +375,7 @@ class Member(Entity):
             issue(self, E_NO_DBS, f"{xtype}")
 
         if self.print_exception(EXCEPTION_NOSAFEGUARD) is False:
-            debug(f"Safeguard Exception ignored: {self.name}", 7)
+            debug("Safeguard Exception ignored: %s", 7, self.name)
             return
 
         if safe_date:
@@ -338,12 +388,13 @@ class Member(Entity):
         else:
             issue(self, E_NO_SAFEGUARD, f"{xtype}")
 
+    @timed
     def check_inactive(self):
         """Check an inactive member."""
         lastmod = self.last_modified_date
         if lastmod:
             gap = (self.scm.today - lastmod).days
-            inactive = get_config(self.scm, C_MEMBERS, C_INACTIVE, C_TIME)
+            inactive = self.scm.settings.inactive_time
             if inactive and (gap > inactive):
                 when = lastmod.strftime(PRINT_DATE_FORMAT)
                 issue(self, E_INACTIVE_TOOLONG, f"Last Modified: {when}")
@@ -371,12 +422,12 @@ class Member(Entity):
             xtype = " (Parent)"
         if self.is_polo:
             xtype = " (Water Polo)"
-            cfg = get_config(self.scm, C_TYPES, CTYPE_POLO, C_NAME)
+            cfg = self.scm.settings.member_type(CTYPE_POLO).name
             if cfg:
                 xtype = f" ({cfg})"
         if self.is_synchro:
             xtype = " (Synchro)"
-            cfg = get_config(self.scm, C_TYPES, CTYPE_SYNCHRO, C_NAME)
+            cfg = self.scm.settings.member_type(CTYPE_SYNCHRO).name
             if cfg:
                 xtype = f" ({cfg})"
         if self.is_swimmer:
@@ -386,11 +437,13 @@ class Member(Entity):
 
         self.scm.lists.add(msg, self)
 
+    @timed
     def check_confirmation(self):
         """Check confimation status."""
-        expiry = get_config(self.scm, C_MEMBERS, C_CONFIRMATION, C_EXPIRY)
-        align = get_config(self.scm, C_MEMBERS, C_CONFIRMATION, C_ALIGN_QUARTER)
-        xlist = get_config(self.scm, C_LISTS, C_CONFIRMATION)
+        settings = self.scm.settings
+        expiry = settings.confirm_expiry
+        align = settings.confirm_align
+        xlist = settings.list_confirmation
         q_offset = 0
 
         if align:
@@ -400,15 +453,16 @@ class Member(Entity):
             gap = (self.scm.today - self.confirmed_date).days
             if gap > (expiry + q_offset):
                 issue(self, E_CONFIRMATION_EXPIRED, f"{self.first_group}")
-                self.scm.members.count_not_confirmed += 1
+                self.scm.members.add_not_confirmed()
                 if xlist:
                     self._list_add(E_CONFIRMATION_EXPIRED)
         else:
             issue(self, E_NOT_CONFIRMED, f"{self.first_group}")
-            self.scm.members.count_not_confirmed += 1
+            self.scm.members.add_not_confirmed()
             if xlist:
                 self._list_add(E_NOT_CONFIRMED)
 
+    @timed
     def check_name(self):
         """Check capitilisation of name."""
         firstname = self.data[A_FIRSTNAME]
@@ -444,13 +498,15 @@ class Member(Entity):
         fix[A_KNOWNAS] = knownas.title()
         self.fixit(fix, f"Capitalisation of {knownas}")
 
+    @timed
     def check_type(self, xtype):
         """Check the member type check box config."""
-        cfg = get_config(self.scm, C_TYPES, xtype, C_GROUPS)
-        name = get_config(self.scm, C_TYPES, xtype, C_NAME)
+        type_cfg = self.scm.settings.member_type(xtype)
+        cfg = type_cfg.groups
+        name = type_cfg.name
         if name is None:
             name = xtype
-        jobtitle = get_config(self.scm, C_TYPES, xtype, C_JOBTITLE)
+        jobtitle = type_cfg.jobtitle
         if cfg:
             found = False
             for group in cfg:
@@ -470,6 +526,7 @@ class Member(Entity):
             fix["JobTitle"] = xtype.title()
             self.fixit(fix, f"Add jobtitle: {name}")
 
+    @timed
     def check_category(self):
         """Check the member categoty."""
         cat = self.data[A_ASA_CATEGORY]
@@ -480,11 +537,15 @@ class Member(Entity):
             issue(self, E_CATEGORY, cat)
 
     @debug_trace(5)
+    @timed
     def analyse(self):
         """Analyse the member."""
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-statements
 
+        if self._notes_done is False:
+            self.get_notes()  # Report any errors in the notes
+
         if self.is_active is False:
             self.check_inactive()
             return
@@ -526,8 +587,9 @@ class Member(Entity):
             found = True
 
         if self.is_volunteer:
-            vol = get_config(self.scm, C_TYPES, CTYPE_VOLUNTEER, C_IGNORE_COACH)
-            ctte = get_config(self.scm, C_TYPES, CTYPE_VOLUNTEER, C_IGNORE_COMMITTEE)
+            cfg = self.scm.settings.member_type(CTYPE_VOLUNTEER)
+            vol = cfg.ignore_coach
+            ctte = cfg.ignore_committee
 
             if vol or ctte or self.is_coach:
                 pass
@@ -548,8 +610,7 @@ class Member(Entity):
                 and (self.is_committee_member is not True)
                 and (self.is_coach is not True)
             ):
-                cfg = get_config(self.scm, C_JOBTITLE, C_IGNORE)
-                if self.jobtitle not in cfg:
+                if self.jobtitle not in self.scm.settings.jobtitle_ignore:
                     issue(self, E_JOB, self.jobtitle)
 
         if found:
@@ -557,11 +618,11 @@ class Member(Entity):
                 return
             self.check_email()
             self.check_confirmation()  # Must come after analyse_swimmer
-            check_conduct(self, self._conduct)
+            check_conduct(self)
             return
 
         for group in self.groups:
-            if get_config(self.scm, C_GROUPS, C_GROUP, group.name, C_IGNORE_UNKNOWN):
+            if self.scm.settings.group(group.name).ignore_unknown:
                 continue
             issue(self, E_UNKNOWN)
 
@@ -623,37 +684,40 @@ class Member(Entity):
 
     def add_group(self, group):
         """Add a group to the swimmer."""
-        debug(f"Added {self.name} to {group.name}", 9)
-        self.groups.append(group)
+        if is_debug(9):
+            debug("Added %s to %s", 9, self.name, group.name)
+        self.groups += (group,)
+        self.scm.groups.index_member(group, self)
 
     def add_session(self, session):
         """Add swimemrs sessions."""
-        self._sessions.append(session)
+        self._sessions += (session,)
 
     def add_conduct(self, conduct):
         """Add a conduct to the swimmer."""
-        self._conduct.append(conduct)
+        self._conduct += (conduct,)
+        self.scm.conduct.index_member(conduct, self)
 
     def add_coach_session(self, session):
         """Add coaches sessions."""
-        self._coach_sessions.append(session)
+        self._coach_sessions += (session,)
 
     def add_restrictions(self, restriction):
         """Add swimmers restricted sessions."""
-        self._restricted.append(restriction)
+        self._restricted += (restriction,)
 
     def set_in_coach_role(self):
         """Member of a role."""
+        record(self, "set_in_coach_role")  # And set it here, for later checks
         self._in_coach_role = True
 
     def set_first_group(self):
         """Print the members primary group."""
-        cfg_groups = self.scm.config(C_GROUPS)
-        if cfg_groups is None:
+        group_priority = self.scm.settings.group_priority
+        if group_priority is None:
             if self.groups:
                 return self.groups[0]
             return None
-        group_priority = cfg_groups[C_PRIORITY]
         if self.groups and group_priority:
             for group in self.groups:
                 for priority in group_priority:
@@ -666,7 +730,7 @@ class Member(Entity):
 
     def set_lastseen(self, lastseen):
         """Set when the swimmer was last seen."""
-        when = datetime.datetime.strptime(lastseen, SCM_DATE_FORMAT)
+        when = parse_date(lastseen, SCM_DATE_FORMAT)
         if self._lastseen is None:
             self._lastseen = when
             return
@@ -674,6 +738,9 @@ class Member(Entity):
 
     def set_confirmed(self, date):
         """Set confirmed date."""
+        record(self, "set_confirmed", date)  # And set it here, for later checks
+        if self._dates_done is False:
+            self.set_dates()
         self._confirmed_date = date
 
     def set_no_session_ok(self):
@@ -780,30 +847,47 @@ class Member(Entity):
                 firstname = self.data[A_KNOWNAS]
         return firstname
 
+    def derived(self):
+        """Age, age at the end of the year, and new starter.
+
+        Asked for many times by the checks, so worked out once
+        for each scm.today (and config).
+        """
+        scm = self.scm
+        derived = self._derived
+        if derived and derived[0] is scm.today and derived[1] is scm.settings:
+            return derived
+
+        age = age_eoy = None
+        dob = self.dob
+        if dob:
+            age = (scm.today - dob).days // 365
+            age_eoy = (scm.eoy - dob).days // 365
+
+        newstarter = False
+        grace = scm.settings.newstarter_grace
+        joined = self.date_joined
+        if grace and joined:
+            if (scm.today - joined).days < grace:
+                newstarter = True
+
+        self._derived = (scm.today, scm.settings, age, age_eoy, newstarter)
+        return self._derived
+
     @property
     def newstarter(self):
         """Is the member a new stater."""
-        grace = get_config(self.scm, C_MEMBERS, C_NEWSTARTER, C_GRACE)
-        if grace and self._date_joined:
-            if (self.scm.today - self._date_joined).days < grace:
-                return True
-        return False
+        return self.derived()[4]
 
     @property
     def age(self):
         """Calculate age."""
-        myage = None
-        if self._dob:
-            myage = (self.scm.today - self._dob).days // 365
-        return myage
+        return self.derived()[2]
 
     @property
     def age_eoy(self):
         """Calculate age at eof of year."""
-        myage = None
-        if self._dob:
-            myage = (self.scm.eoy - self._dob).days // 365
-        return myage
+        return self.derived()[3]
 
     def check_age(self, xmin, xmax, group):
         """Check swimmer within age group."""
@@ -813,41 +897,63 @@ class Member(Entity):
             if not self.is_coach:
                 issue(self, E_TOO_OLD, f"{group}: {self.age}")
 
+    def decode(self):
+        """Decode the dates and notes now, rather than on first use."""
+        if self._dates_done is False:
+            self.set_dates()
+        if self._notes_done is False:
+            self.get_notes()
+
     def set_dates(self):
         """Calculate dates."""
         self._dob = self.set_date(A_DOB)
         self._date_joined = self.set_date("DateJoinedClub")
-        self._last_modified = self.set_date("LastModifiedDate")
+        self._last_modified = self.set_date(A_LAST_MODIFIED)
         self._confirmed_date = self.set_date("DetailsConfirmedCorrect")
         self._last_login = self.set_date("LastLoggedIn")
+        self._dates_done = True
 
     def set_joined_today(self):
         """Set joined date."""
+        record(self, "set_joined_today")  # And set it here, for later checks
+        if self._dates_done is False:
+            self.set_dates()
         self._date_joined = self.scm.today
+        self._derived = None
 
     @property
     def confirmed_date(self):
         """Set confirmed date Date."""
+        if self._dates_done is False:
+            self.set_dates()
         return self._confirmed_date
 
     @property
     def dob(self):
         """Set DOB."""
+        if self._dates_done is False:
+            self.set_dates()
         return self._dob
 
     @property
     def date_joined(self):
         """Set joining date."""
+        if self._dates_done is False:
+            self.set_dates()
         return self._date_joined
 
     @property
     def last_login(self):
         """Set last login date."""
+        if self._dates_done is False:
+            self.set_dates()
         return self._last_login
 
     @property
     def last_modified_date(self):
         """Set Last Modified Date."""
+        if self._dates_done is False:
+            self.set_dates()
         return self._last_modified
 
     @property
@@ -865,6 +971,20 @@ class Member(Entity):
         """Set Notes."""
         return self.check_attribute("Notes")
 
+    @property
+    def facebook(self):
+        """Facebook names, from Notes."""
+        if self._notes_done is False:
+            self.get_notes()
+        return self._facebook
+
+    @property
+    def ignore_errors(self):
+        """Exceptions (API tokens) from Notes."""
+        if self._notes_done is False:
+            self.get_notes()
+        return self._ignore_errors
+
     @property
     def username(self):
         """Set Username."""
@@ -898,112 +1018,57 @@ class Member(Entity):
     @property
     def is_swimmer(self):
         """Is it a swimmer."""
-        isa = self.check_attribute("IsASwimmer")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_SWIMMER) != 0
 
     @property
     def is_coach(self):
         """Is it a Coach."""
-        isa = self.check_attribute(A_ISCOACH)
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_COACH) != 0
 
     @property
     def is_master(self):
         """Is it a Master."""
-        isa = self.check_attribute(A_ISMASTER)
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_MASTER) != 0
 
     @property
     def is_parent(self):
         """Is it a swimmer."""
-        isa = self.check_attribute(A_ISPARENT)
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_PARENT) != 0
 
     @property
     def is_synchro(self):
         """Is it a syncro swimmer."""
-        isa = self.check_attribute("SynchronisedSwimming")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_SYNCHRO) != 0
 
     @property
     def is_lts(self):
         """Is it a LTS Teacher."""
-        isa = self.check_attribute("LTSTeacher")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_LTS) != 0
 
     @property
     def is_openwater(self):
         """Is it a Open Water swimmer."""
-        isa = self.check_attribute("OpenWater")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_OPENWATER) != 0
 
     @property
     def is_lifesaving(self):
         """Is it a Life saver."""
-        isa = self.check_attribute("LifeSaving")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_LIFESAVER) != 0
 
     @property
     def is_polo(self):
         """Is it a polo player."""
-        isa = self.check_attribute("WaterPolo")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_POLO) != 0
 
     @property
     def is_committee_member(self):
         """Is it a CommitteeMember."""
-        isa = self.check_attribute("CommitteeMember")
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_COMMITTEE) != 0
 
     @property
     def is_volunteer(self):
         """Is it a Volunteer."""
-        isa = self.check_attribute(A_ISVOLUNTEER)
-        if isa == "1":
-            return True
-        if isa == "Yes":
-            return True
-        return False
+        return (self.types & T_VOLUNTEER) != 0
 
     @property
     def email(self):
@@ -1,20 +1,46 @@
 """SCM Members."""
 
+from datetime import datetime, timedelta
+
 from scm_helper.config import (
     A_ACTIVE,
     A_FIRSTNAME,
+    A_GUID,
+    A_LAST_MODIFIED,
     A_LASTNAME,
+    C_API,
+    C_CLUB,
+    C_MEMBER_SYNC,
     C_NAME,
     C_TYPES,
+    C_WORKERS,
     CTYPE_SYNCHRO,
+    MODIFIED_SINCE,
+    SCM_DATE_FORMAT,
     SCM_FALSE,
     SCM_TRUE,
+    T_COACH,
+    T_PARENT,
+    T_POLO,
+    T_SWIMMER,
+    T_SYNCHRO,
+    T_VOLUNTEER,
     get_config,
 )
 from scm_helper.entity import Entities
+from scm_helper.fetch import read_pages
 from scm_helper.issue import E_DUPLICATE, debug, issue
 from scm_helper.member import Member
 from scm_helper.notify import notify
+from scm_helper.rules import record
+from scm_helper.snapshot import (
+    K_FULL,
+    K_MEMBERS,
+    K_SYNCED,
+    read_snapshot,
+    write_snapshot,
+)
+from scm_helper.table import MemberTable
 
 
 class Members(Entities):
@@ -37,8 +63,10 @@ class Members(Entities):
         self._name = name
         self._url = url
         self._raw_data = []
+        self._progress = None
 
-        self.facebook = {}
+        self._facebook = None
+        self._table = None
         self.count_coaches = 0
         self.count_parents = 0
         self.count_inactive = 0
@@ -51,6 +79,97 @@ class Members(Entities):
 
         self.scm = scm
 
+    @property
+    def keep_raw(self):
+        """Keep all the member data (not just what the checks use)."""
+        if self.scm.keep_raw:
+            return True
+        # Needed for the snapshot
+        return get_config(self.scm, C_API, C_MEMBER_SYNC) is not None
+
+    @property
+    def table(self):
+        """The members as columns (built on first use, after linkage)."""
+        if self._table is None:
+            self._table = MemberTable(self.entities)
+        return self._table
+
+    @property
+    def facebook(self):
+        """Members by Facebook name (from their notes)."""
+        if self._facebook is None:
+            self._facebook = {}
+            for member in self.entities:
+                for face in member.facebook:
+                    self._facebook[face] = member
+        return self._facebook
+
+    def get_data(self):
+        """Get data, just the members changed since the last run if possible."""
+        sync = get_config(self.scm, C_API, C_MEMBER_SYNC)
+        if sync is None or self.scm.ipad:
+            return super().get_data()
+
+        club = get_config(self.scm, C_CLUB)
+        today = self.scm.today
+
+        snapshot = None
+        if self.scm.refresh is False:
+            snapshot = read_snapshot(self.scm, club)
+
+        if snapshot:
+            full = datetime.strptime(snapshot[K_FULL], SCM_DATE_FORMAT)
+            if (today - full).days >= sync:
+                snapshot = None  # Re-read all, to catch deleted members
+
+        if snapshot is None:
+            if super().get_data() is False:
+                return False
+            write_snapshot(self.scm, club, self._raw_data, today, today)
+            return True
+
+        return self.get_changes(snapshot, club)
+
+    def get_changes(self, snapshot, club):
+        """Get members changed since the snapshot, and merge them in."""
+        # Dates are to the day, so allow a day for any timezone difference
+        since = datetime.strptime(snapshot[K_SYNCED], SCM_DATE_FORMAT)
+        since = (since - timedelta(days=1)).strftime(SCM_DATE_FORMAT)
+
+        self.progress(f"{self._name}... ")
+        workers = get_config(self.scm, C_API, C_WORKERS)
+        headers = {MODIFIED_SINCE: since}
+
+        changes = []
+        for data in read_pages(self.scm, self._url, workers, headers):
+            if data is None:
+                return False
+            changes += data
+
+        full = datetime.strptime(snapshot[K_FULL], SCM_DATE_FORMAT)
+        for member in changes:
+            modified = member.get(A_LAST_MODIFIED)
+            if (modified is None) or (modified < since):
+                # Not filtered by SCM - so this is everyone
+                debug(f"{MODIFIED_SINCE} ignored, full read of members", 2)
+                full = self.scm.today
+                merged = changes
+                break
+        else:
+            # Archived members are changes too, so just need replacing.
+            merged = {member[A_GUID]: member for member in snapshot[K_MEMBERS]}
+            for member in changes:
+                merged[member[A_GUID]] = member
+            merged = list(merged.values())
+            self.progress(f"{len(changes)} changed, ")
+
+        count = self.create_entities(merged)
+        self._raw_data = merged
+        self.progress(f"{count}\n")
+
+        write_snapshot(self.scm, club, merged, full, self.scm.today)
+        return True
+
     def check_duplicate(self, member):
         """See if member already exists before adding."""
         firtname = member[A_FIRSTNAME]
@@ -60,7 +179,7 @@ class Members(Entities):
             if member[A_ACTIVE] == SCM_TRUE and self.by_name[name].is_active:
                 act1 = member[A_ACTIVE]
                 act2 = self.by_name[name].is_active
-                debug(f"{name}: {act1}-{act2}", 6)
+                debug("%s: %s-%s", 6, name, act1, act2)
                 issue(self.by_name[name], E_DUPLICATE, name)
             else:
                 active = self.by_name[name].is_active
@@ -77,11 +196,17 @@ class Members(Entities):
 
     def create_entities(self, entities):
         """Create a member objects."""
+        # pylint: disable=too-many-branches
         i = 0
+        keep_raw = self.keep_raw
+        self._facebook = None
+        self._table = None
         for member in entities:
             self.check_duplicate(member)
 
             data = Member(member, self.scm, self._url)
+            if keep_raw is False:
+                data.compact()
             self.entities.append(data)
             self.by_guid[data.guid] = data
             self.by_name[data.name] = data
@@ -89,21 +214,19 @@ class Members(Entities):
             if data.asa_number:
                 self.by_asa[data.asa_number] = data
 
-            if data.facebook:
-                for face in data.facebook:
-                    self.facebook[face] = data
             if data.is_active:
-                if data.is_coach:
+                types = data.types
+                if types & T_COACH:
                     self.count_coaches += 1
-                if data.is_parent:
+                if types & T_PARENT:
                     self.count_parents += 1
-                if data.is_swimmer:
+                if types & T_SWIMMER:
                     self.count_swimmers += 1
-                if data.is_polo:
+                if types & T_POLO:
                     self.count_waterpolo += 1
-                if data.is_synchro:
+                if types & T_SYNCHRO:
                     self.count_synchro += 1
-                if data.is_volunteer:
+                if types & T_VOLUNTEER:
                     self.count_volunteer += 1
                 self.count += 1
             else:
@@ -131,6 +254,39 @@ class Members(Entities):
             # TODO remove when API fixed.
             member.linkage2()
 
+    def add_not_confirmed(self):
+        """Count a member who has not confirmed their details."""
+        if record(self, "add_not_confirmed"):
+            return
+        self.count_not_confirmed += 1
+
+    def decode_all(self):
+        """Decode the dates and notes of every member (done on first use)."""
+        for member in self.entities:
+            member.decode()
+
+    def rule_groups(self, entities):
+        """Rows of each family - a swimmer's checks update their parents."""
+        rows = {member: row for row, member in enumerate(entities)}
+        family = list(range(len(entities)))
+
+        def find(row):
+            while family[row] != row:
+                family[row] = family[family[row]]
+                row = family[row]
+            return row
+
+        for row, member in enumerate(entities):
+            for parent in member.parents:
+                other = rows.get(parent, None)
+                if other is not None:
+                    family[find(other)] = find(row)
+
+        groups = {}
+        for row in range(len(entities)):
+            groups.setdefault(find(row), []).append(row)
+        return list(groups.values())
+
     def fix_secat(self):
         """fix_se categories."""
         for member in self.entities:
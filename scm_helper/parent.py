@@ -3,15 +3,9 @@
 from scm_helper.config import (
     A_ISPARENT,
     A_USERNAME,
-    C_AGE,
-    C_CHILD,
-    C_LOGIN,
-    C_MANDATORY,
-    C_MIN_AGE,
-    C_PARENTS,
-    get_config,
     SCM_FALSE,
 )
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_INACTIVE,
     E_NO_CHILD,
@@ -22,6 +16,7 @@ from scm_helper.issue import (
 )
 
 
+@timed
 def analyse_parent(parent):
     """Analyse a parent..."""
     # pylint: disable=too-many-branches
@@ -51,16 +46,16 @@ def analyse_parent(parent):
     if (newmember is True) and parent.swimmers:
         parent.set_joined_today()
 
-    age = get_config(parent.scm, C_PARENTS, C_AGE, C_MIN_AGE)
+    age = parent.scm.settings.parent_min_age
     if parent.age and (parent.age < age):
         issue(parent, E_PARENT_AGE)
 
-    age = get_config(parent.scm, C_PARENTS, C_AGE, C_CHILD)
+    age = parent.scm.settings.parent_child_age
     for swimmer in parent.swimmers:
         if active and swimmer.age and (swimmer.age >= age):
             issue(swimmer, E_PARENT_AGE_TOO_OLD, f"{swimmer.age}, {parent.name}")
 
-    login = get_config(parent.scm, C_PARENTS, C_LOGIN, C_MANDATORY)
+    login = parent.scm.settings.parent_login
     if login and (parent.username is None) and parent.email:
         issue(parent, E_NO_LOGIN, "Parent (fixable)")
         fix = {A_USERNAME: parent.email}
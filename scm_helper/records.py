@@ -9,19 +9,6 @@ from pathlib import Path
 from shutil import copyfile
 
 from scm_helper.config import (
-    C_25M,
-    C_AGE_EOY,
-    C_ALL_AGES,
-    C_FILTER,
-    C_IGNORE_GROUP,
-    C_IGNORE_NO_SESSIONS,
-    C_OPENAGE,
-    C_OVERALL_FASTEST,
-    C_RECORDS,
-    C_RECORDSET,
-    C_RELAY,
-    C_SE_ONLY,
-    C_VERIFY,
     CONFIG_DIR,
     EXCEPTION_ALLOW_RECORDS,
     FILE_READ,
@@ -30,8 +17,8 @@ from scm_helper.config import (
     RECORDS_DIR,
     SCM_ALT_CSV_DATE_FORMAT,
     SCM_CSV_DATE_FORMAT,
-    get_config,
 )
+from scm_helper.dates import DateFormats
 from scm_helper.issue import debug
 from scm_helper.notify import notify
 
@@ -43,6 +30,8 @@ STROKES = {
     "Medley": "Individual Medley",
 }
 
+SWIM_DATE_FORMATS = [SCM_CSV_DATE_FORMAT, SCM_ALT_CSV_DATE_FORMAT, "%d-%b-%y"]
+
 RELAY_STROKES = {
     "Free": "Freestyle",
     "Medley": "Medley",
@@ -235,7 +224,7 @@ class Records:
 
     def process_records(self):
         """Process all records files."""
-        cfg_set = get_config(self.scm, C_RECORDSET)
+        cfg_set = self.scm.settings.recordsets
 
         if cfg_set:
             for cfg in cfg_set:
@@ -294,9 +283,9 @@ class RecordFile:
         self.html = None
         self.ages = None
 
+        rcfg = self.scm.settings.recordset(cfg)
         if cfg is None:
-            cfg_relay = get_config(self.scm, C_RECORDS, C_RELAY)
-            if cfg_relay:
+            if rcfg.relay:
                 baseline = F_RELAY_BASELINE
                 self.is_relay = True
             else:
@@ -304,24 +293,17 @@ class RecordFile:
                 self.is_relay = False
         else:
             baseline = cfg + ".csv"
-            cfg_relay = get_config(self.scm, C_RECORDSET, self.cfg, C_RELAY)
-            if cfg_relay:
+            if rcfg.relay:
                 self.is_relay = True
             else:
                 self.is_relay = False
 
-        cfg_set = get_config(self.scm, C_RECORDSET)
-        if cfg_set:
-            all_ages = get_config(self.scm, C_RECORDSET, self.cfg, C_ALL_AGES)
-        else:
-            all_ages = get_config(self.scm, C_RECORDS, C_ALL_AGES)
-
-        if all_ages:
+        if rcfg.all_ages:
             self.ages = ALL_AGES.copy()
         else:
             self.ages = AGES.copy()
 
-        c_open = get_config(self.scm, C_RECORDSET, self.cfg, C_OPENAGE)
+        c_open = rcfg.open_age
 
         if c_open:
             self.ages[f"{c_open}-99"] = 0
@@ -416,16 +398,18 @@ class SwimTimes:
         self.filter = None
         self.cfg = cfg
         self.ages = None
+        self.dates = None
 
     def merge_times(self, filename, scm, ages):
         """Read Facebook file."""
         self._filename = filename
         self.scm = scm
         self.ages = ages
+        self.dates = DateFormats(SWIM_DATE_FORMATS)  # Each file uses one
 
         notify(f"Reading {filename}...\n")
 
-        self.filter = get_config(self.scm, C_RECORDSET, self.cfg, C_FILTER)
+        self.filter = self.scm.settings.recordset(self.cfg).filter
 
         try:
             count = 0
@@ -514,36 +498,22 @@ class SwimTimes:
             location = "Unknown"
 
         if dist not in DISTANCE:
-            debug(f"Line {count}: Unknown distance {dist}", 1)
+            debug("Line %s: Unknown distance %s", 1, count, dist)
             return
 
         if stroke not in STROKES:
-            debug(f"Line {count}: Unknown stroke {stroke}", 1)
+            debug("Line %s: Unknown stroke %s", 1, count, stroke)
             return
 
-        cfg_set = get_config(self.scm, C_RECORDSET)
-        if cfg_set:
-            verify = get_config(self.scm, C_RECORDSET, self.cfg, C_VERIFY)
-            age_eoy = get_config(self.scm, C_RECORDSET, self.cfg, C_AGE_EOY)
-            se_only = get_config(self.scm, C_RECORDSET, self.cfg, C_SE_ONLY)
-            all_ages = get_config(self.scm, C_RECORDSET, self.cfg, C_ALL_AGES)
-            c_25m = get_config(self.scm, C_RECORDSET, self.cfg, C_25M)
-            c_open = get_config(self.scm, C_RECORDSET, self.cfg, C_OPENAGE)
-            c_ignore = get_config(self.scm, C_RECORDSET, self.cfg, C_IGNORE_GROUP)
-            c_ignore_no_sessions = get_config(
-                self.scm, C_RECORDSET, self.cfg, C_IGNORE_NO_SESSIONS
-            )
-        else:
-            verify = get_config(self.scm, C_RECORDS, C_VERIFY)
-            age_eoy = get_config(self.scm, C_RECORDS, C_AGE_EOY)
-            se_only = get_config(self.scm, C_RECORDS, C_SE_ONLY)
-            all_ages = get_config(self.scm, C_RECORDS, C_ALL_AGES)
-            c_ignore = get_config(self.scm, C_RECORDSET, C_IGNORE_GROUP)
-            c_ignore_no_sessions = get_config(
-                self.scm, C_RECORDSET, C_IGNORE_NO_SESSIONS
-            )
-            c_25m = False
-            c_open = False
+        rcfg = self.scm.settings.recordset(self.cfg)
+        verify = rcfg.verify
+        age_eoy = rcfg.age_eoy
+        se_only = rcfg.se_only
+        all_ages = rcfg.all_ages
+        c_25m = rcfg.c_25m
+        c_open = rcfg.open_age
+        c_ignore = rcfg.ignore_group
+        c_ignore_no_sessions = rcfg.ignore_no_sessions
 
         if c_25m is False and dist == "25m":
             return
@@ -551,7 +521,7 @@ class SwimTimes:
         member = None
 
         if asa not in self.scm.members.by_asa:
-            debug(f"Line {count}: No SE Number {swimmer}", 2)
+            debug("Line %s: No SE Number %s", 2, count, swimmer)
             # We can't check, so go with it...
             if se_only:
                 return
@@ -564,13 +534,7 @@ class SwimTimes:
         if swimage and swimage >= 25:
             age_eoy = True  # Masters are always EOY
 
-        try:
-            swimdate = datetime.datetime.strptime(xdate, SCM_CSV_DATE_FORMAT)
-        except ValueError:
-            try:
-                swimdate = datetime.datetime.strptime(xdate, SCM_ALT_CSV_DATE_FORMAT)
-            except ValueError:
-                swimdate = datetime.datetime.strptime(xdate, "%d-%b-%y")
+        swimdate = self.dates.parse(xdate)
 
         if member and age_eoy:
             yob = member.dob.year
@@ -578,11 +542,11 @@ class SwimTimes:
             swimage = swimyear - yob
 
         if verify and member and member.date_joined and (swimdate < member.date_joined):
-            debug(f"Line {count}: Ignored, not a member at time of swim", 2)
+            debug("Line %s: Ignored, not a member at time of swim", 2, count)
             return
 
         if verify and member and member.is_active is False:
-            debug(f"Line {count}: Ignored, inactive member", 2)
+            debug("Line %s: Ignored, inactive member", 2, count)
             return
 
         if swimage is None:
@@ -723,11 +687,7 @@ class Record:
 
         self.newrecords[check_event] = newrec
 
-        cfg_set = get_config(self.scm, C_RECORDSET)
-        if cfg_set:
-            overall = get_config(self.scm, C_RECORDSET, self.cfg, C_OVERALL_FASTEST)
-        else:
-            overall = get_config(self.scm, C_RECORDS, C_OVERALL_FASTEST)
+        overall = self.scm.settings.recordset(self.cfg).overall_fastest
 
         if overall:
             split_event = swim[S_EVENT].split()
@@ -751,11 +711,7 @@ class Record:
             notify(f"Line {count}: unknown gender '{test[0]}'\n")
             return
 
-        cfg_set = get_config(self.scm, C_RECORDSET)
-        if cfg_set:
-            c_all_ages = get_config(self.scm, C_RECORDSET, self.cfg, C_ALL_AGES)
-        else:
-            c_all_ages = get_config(self.scm, C_RECORDS, C_ALL_AGES)
+        c_all_ages = self.scm.settings.recordset(self.cfg).all_ages
 
         if c_all_ages:
             ages = ALL_AGES
@@ -896,16 +852,9 @@ class Record:
 
         res = prefix
 
-        cfg_set = get_config(self.scm, C_RECORDSET)
-        if cfg_set:
-            overall = get_config(self.scm, C_RECORDSET, self.cfg, C_OVERALL_FASTEST)
-            c_25m = get_config(self.scm, C_RECORDSET, self.cfg, C_25M)
-        else:
-            overall = get_config(self.scm, C_RECORDS, C_OVERALL_FASTEST)
-            c_25m = False
-
-        if overall is None:
-            overall = False
+        rcfg = self.scm.settings.recordset(self.cfg)
+        overall = rcfg.overall_fastest
+        c_25m = rcfg.c_25m
 
         for gender in arg_gender:
             o_gender = ""
@@ -1145,7 +1094,7 @@ def convert_time(xtime):
             res = float(hms[0])
         return res
     except ValueError:
-        debug(f"invalid time {xtime} ", 3)
+        debug("invalid time %s ", 3, xtime)
         return 999999
 
 
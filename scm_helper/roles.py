@@ -1,23 +1,9 @@
 """SCM Role."""
 
 from scm_helper.coach import check_coach_permissions
-from scm_helper.config import (
-    A_GUID,
-    A_ISVOLUNTEER,
-    A_MEMBERS,
-    C_CHECK_PERMISSIONS,
-    C_CHECK_RESTRICTIONS,
-    C_IS_COACH,
-    C_LOGIN,
-    C_MANDATORY,
-    C_ROLE,
-    C_ROLES,
-    C_UNUSED,
-    C_VOLUNTEER,
-    get_config,
-    SCM_TRUE,
-)
+from scm_helper.config import A_ISVOLUNTEER, SCM_TRUE
 from scm_helper.entity import Entities, Entity
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_COACH_ROLE,
     E_INACTIVE,
@@ -43,10 +29,11 @@ class Role(Entity):
     """A role."""
 
     @debug_trace(5)
+    @timed
     def analyse(self):
         """Analyse the role."""
-        cfg = get_config(self.scm, C_ROLES, C_ROLE)
-        unused = get_config(self.scm, C_ROLES, C_LOGIN, C_UNUSED)
+        cfg = self.scm.settings.roles
+        unused = self.scm.settings.role_login_unused
 
         if len(self.members) == 0:
             issue(self, E_NO_SWIMMERS, "Role")
@@ -55,29 +42,24 @@ class Role(Entity):
         for member in self.members:
             self.check_role_member(member, unused)
 
-            if cfg and (self.name in cfg):
+            if self.name in cfg:
                 self.check_role_permissions(member)
 
     def check_role_member(self, member, unused):
         """Check out a role member."""
         if member.is_active is False:
             issue(member, E_INACTIVE, f"Member of role {self.name} (fixable)")
-            if self.newdata and (A_MEMBERS in self.newdata):
-                fix = self.newdata
-            else:
-                fix = {}
-                fix[A_MEMBERS] = self.data[A_MEMBERS].copy()
-            fix[A_MEMBERS].remove({A_GUID: member.guid})
-            self.fixit(fix, f"Delete from role {self.name}")
+            self.fix_member(member, False, f"Delete from role {self.name}")
 
         if member.username is None:
             issue(member, E_NO_LOGIN, f"Member of role {self.name}, so cannot login")
 
-        if get_config(self.scm, C_ROLES, C_ROLE, self.name, C_IS_COACH):
+        settings = self.scm.settings
+        if settings.role(self.name).is_coach:
             if member.is_coach is False:
                 issue(member, E_COACH_ROLE, f"Role: {self.name}")
 
-        if get_config(self.scm, C_ROLES, C_VOLUNTEER, C_MANDATORY):
+        if settings.role_volunteer:
             if member.is_volunteer is False:
                 issue(member, E_VOLUNTEER, f"Role: {self.name} (fixable)")
                 fix = {A_ISVOLUNTEER: SCM_TRUE}
@@ -95,14 +77,12 @@ class Role(Entity):
 
     def check_role_permissions(self, member):
         """Check out a role permissions."""
-        lookup = get_config(self.scm, C_ROLES, C_ROLE, self.name)
-        if lookup is None:
-            return
+        lookup = self.scm.settings.role(self.name)
 
-        if (C_CHECK_PERMISSIONS in lookup) and lookup[C_CHECK_PERMISSIONS]:
+        if lookup.check_permissions:
             check_coach_permissions(member, self)
 
-        if (C_CHECK_RESTRICTIONS in lookup) and lookup[C_CHECK_RESTRICTIONS]:
+        if lookup.check_restrictions:
             if len(member.restricted) == 0:
                 issue(member, E_NO_RESTRICTIONS, f"Role: {self.name}")
 
@@ -0,0 +1,187 @@
+"""Run the checks as rules, one entity at a time - optionally in parallel.
+
+The rule for an entity class is each entity's analyse(), run on every
+entity of the class (Entities.to_analyse). With more than one process
+(api: processes), the entities are split into chunks, and each chunk is
+checked in a forked process. A worker does not change the shared data:
+what the checks do (issues, fixes, additions to lists, and the few calls
+that update another member) is recorded, see record(). The records are
+merged back in entity order, so the result is the same as checking one
+entity after another in this process.
+"""
+
+import multiprocessing
+
+from scm_helper import issue as issues
+from scm_helper import notify as notifier
+from scm_helper.instrument import PROFILE
+from scm_helper.issue import ISSUE_LIST, NAME
+
+CHUNKS_PER_PROCESS = 4  # So a slow chunk does not hold up the rest
+MIN_CHUNK = 250  # Entities, fewer are not worth starting a process for
+
+ISSUE = "issue"
+CALL = "call"
+
+RECORDER = None  # Only set in a worker process
+_WORK = None  # (scm, entities) for the worker processes
+
+
+class Ref:
+    """An entity class (index None), or an entity, by position in scm.classes."""
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("aclass", "index")
+
+    def __init__(self, aclass, index):
+        """Initialise."""
+        self.aclass = aclass
+        self.index = index
+
+    def __getstate__(self):
+        """Pickle (no __dict__)."""
+        return (self.aclass, self.index)
+
+    def __setstate__(self, state):
+        """Unpickle."""
+        self.aclass, self.index = state
+
+
+class Recorder:
+    """Record what the checks do in a worker, in place of the IssueHandler."""
+
+    def __init__(self, scm, debug_level):
+        """Initialise."""
+        self.debug_level = debug_level  # Read by issue() and debug()
+        self.records = []
+        self.position = 0  # Of the entity being checked
+        self._refs = {}
+        for i, aclass in enumerate(scm.classes):
+            self._refs[aclass] = Ref(i, None)
+            for j, entity in enumerate(aclass.entities):
+                self._refs[entity] = Ref(i, j)
+
+    def ref(self, value):
+        """Ref for an entity (or class), anything else as is."""
+        try:
+            return self._refs.get(value, value)
+        except TypeError:  # Not hashable, so not an entity
+            return value
+
+    def add_issue(self, xobject, error, msg, msg2):
+        """Record an issue (as IssueHandler.add_issue)."""
+        args = (error[NAME], error, msg, msg2)
+        entry = (self.position, len(self.records), ISSUE, self.ref(xobject), args)
+        self.records.append(entry)
+
+    def call(self, xobject, method, args):
+        """Record a call of xobject.method(*args)."""
+        args = (method, tuple(self.ref(arg) for arg in args))
+        entry = (self.position, len(self.records), CALL, self.ref(xobject), args)
+        self.records.append(entry)
+
+
+def record(xobject, method, *args):
+    """
+    Record a call of xobject.method(*args), if in a worker process.
+
+    Returns True if recorded, the call is then made when the results
+    are merged, in the main process.
+    """
+    if RECORDER is None:
+        return False
+    RECORDER.call(xobject, method, args)
+    return True
+
+
+def resolve(scm, value):
+    """The entity (or class) for a Ref, anything else as is."""
+    if isinstance(value, Ref):
+        aclass = scm.classes[value.aclass]
+        if value.index is None:
+            return aclass
+        return aclass.entities[value.index]
+    return value
+
+
+def check_chunk(rows):
+    """Check the entities in rows (in a worker process), returning the records."""
+    global RECORDER  # pylint: disable=global-statement
+    scm, entities = _WORK
+    if RECORDER is None:
+        RECORDER = Recorder(scm, issues.HANDLER.debug_level)
+        issues.HANDLER = RECORDER  # This process only
+    RECORDER.records = []
+    for row in rows:
+        RECORDER.position = row
+        entities[row].analyse()
+    return RECORDER.records
+
+
+def merge(scm, results):
+    """Make the recorded issues and calls, in the order they were made."""
+    handler = issues.HANDLER
+    errors = {error[NAME]: error for error in ISSUE_LIST}
+    records = [entry for chunk in results for entry in chunk]
+    records.sort(key=lambda entry: (entry[0], entry[1]))
+    for _, _, kind, xobject, args in records:
+        xobject = resolve(scm, xobject)
+        if kind == ISSUE:
+            name, error, msg, msg2 = args
+            # The error itself, not the copy from the worker (message may change)
+            handler.add_issue(xobject, errors.get(name, error), msg, msg2)
+        else:
+            method, margs = args
+            getattr(xobject, method)(*[resolve(scm, arg) for arg in margs])
+
+
+def make_chunks(groups, count):
+    """Split groups of rows into about count chunks, keeping each group together."""
+    total = sum(len(group) for group in groups)
+    size = max(MIN_CHUNK, -(-total // count))
+    chunks = []
+    chunk = []
+    for group in groups:
+        chunk += group
+        if len(chunk) >= size:
+            chunks.append(sorted(chunk))
+            chunk = []
+    if chunk:
+        chunks.append(sorted(chunk))
+    return chunks
+
+
+def use_processes(scm, entities):
+    """Number of processes to check entities with (1 to check them here)."""
+    processes = scm.settings.processes
+    if processes <= 1 or len(entities) < 2 * MIN_CHUNK:
+        return 1
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1  # Windows - workers need a copy of the data
+    if PROFILE.active:
+        return 1  # Check timings would be lost in the workers
+    if notifier.WHERE:
+        return 1  # GUI - a worker must not write to the window
+    return processes
+
+
+def analyse_class(scm, aclass):
+    """Run the checks for an entity class."""
+    global _WORK  # pylint: disable=global-statement
+    entities = aclass.to_analyse()
+    processes = use_processes(scm, entities)
+    if processes <= 1:
+        aclass.analyse()
+        return
+
+    aclass.prepare_rules()
+    chunks = make_chunks(aclass.rule_groups(entities), processes * CHUNKS_PER_PROCESS)
+    _WORK = (scm, entities)
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes) as pool:
+            results = pool.map(check_chunk, chunks, chunksize=1)
+    finally:
+        _WORK = None
+    merge(scm, results)
@@ -1,29 +1,17 @@
 """SCM Session."""
 
-import datetime
-
 from scm_helper.config import (
     A_ARCHIVED,
-    A_DATEAGREED,
     A_GUID,
     A_LAST_ATTENDED,
     A_MAX_MEMBERS,
     A_MEMBERS,
-    C_ABSENCE,
-    C_CONDUCT,
-    C_COVID,
-    C_DATE,
-    C_EXCLUDE_MAX,
-    C_GROUPS,
-    C_IGNORE_ATTENDANCE,
-    C_REGISTER,
-    C_SESSION,
-    C_SESSIONS,
     PRINT_DATE_FORMAT,
     SCM_DATE_FORMAT,
-    get_config,
 )
+from scm_helper.dates import parse_date
 from scm_helper.entity import Entities, Entity
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_INACTIVE,
     E_NEVER_ATTENDED,
@@ -49,12 +37,32 @@ class Sessions(Entities):
         """Create a new entity."""
         return Session(entity, self.scm, self._url)
 
+    def __init__(self, scm, name, url):
+        """Initialise."""
+        super().__init__(scm, name, url)
+        self._by_substr = {}
+
+    def create_entities(self, entities):
+        """Create entities."""
+        self._by_substr = {}
+        return super().create_entities(entities)
+
+    def substr_index(self, substr):
+        """First session, and all sessions, whose name contains substr (cached)."""
+        found = self._by_substr.get(substr)
+        if found is None:
+            found = [session for session in self.entities if substr in session.name]
+            found = (found[0] if found else None, frozenset(found))
+            self._by_substr[substr] = found
+        return found
+
+    def matching(self, substr):
+        """Sessions whose name contains substr."""
+        return self.substr_index(substr)[1]
+
     def find_session_substr(self, substr):
         """Find a session from a substring."""
-        for session in self.entities:
-            if session.name.find(substr) >= 0:
-                return session
-        return None
+        return self.substr_index(substr)[0]
 
     def print_coaches(self):
         """Print coaches per session."""
@@ -69,8 +77,7 @@ class Sessions(Entities):
 
     def print_swimmers_covid(self):
         """Print swimmers and coaches with no COVID dec."""
-        covid = get_config(self.scm, C_SESSIONS, C_COVID)
-        if covid is None:
+        if self.scm.settings.covid is None:
             notify("Missing config for COVID option")
             return ""
 
@@ -93,18 +100,9 @@ class Session(Entity):
         self.coaches = []
         self.swimmers = []
 
-        self.ignore_attendance = False
-        self.exclude_max = False
-
-        cfg = get_config(
-            self.scm, C_SESSIONS, C_SESSION, self.name, C_IGNORE_ATTENDANCE
-        )
-        if cfg:
-            self.ignore_attendance = cfg
-
-        cfg = get_config(self.scm, C_SESSIONS, C_SESSION, self.name, C_EXCLUDE_MAX)
-        if cfg:
-            self.exclude_max = cfg
+        cfg = self.scm.settings.session(self.name)
+        self.ignore_attendance = cfg.ignore_attendance
+        self.exclude_max = cfg.exclude_max
 
     def linkage(self, members):
         """Link coaches and swimmers."""
@@ -143,14 +141,14 @@ class Session(Entity):
     def print_coaches(self):
         """Print coaches."""
         res = ""
-        absence = get_config(self.scm, C_SESSIONS, C_ABSENCE)
+        absence = self.scm.settings.session_absence
         for coach in self.data[A_COACHES]:
             guid = self.scm.members.by_guid[coach[A_GUID]]
             if guid.is_active:
                 msg = ""
                 lastseen = coach.get(A_LAST_ATTENDED, None)
                 if lastseen:
-                    when = datetime.datetime.strptime(lastseen, SCM_DATE_FORMAT)
+                    when = parse_date(lastseen, SCM_DATE_FORMAT)
                     if (self.scm.today - when).days > absence:
                         msg = f"(Lastseen: {lastseen})"
                 else:
@@ -165,11 +163,8 @@ class Session(Entity):
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-locals
         res = None
-        covid = get_config(self.scm, C_SESSIONS, C_COVID)
-        c_date_str = get_config(self.scm, C_CONDUCT, covid, C_DATE)
-        if c_date_str is None:
-            c_date_str = "1900-01-01"
-        c_date = datetime.datetime.strptime(c_date_str, SCM_DATE_FORMAT)
+        covid = self.scm.settings.covid
+        c_date = self.scm.settings.code(covid).date
 
         c_res = "  Coaches:\n"
         found = False
@@ -179,17 +174,8 @@ class Session(Entity):
             if swimmer.is_active:
                 declaration = False
                 code = swimmer.get_conduct_name(covid)
-                if code:
-                    code_members = code.data[A_MEMBERS]
-                    for member in code_members:
-                        code_member = self.scm.members.by_guid[member[A_GUID]]
-                        if code_member == swimmer:
-                            if member[A_DATEAGREED]:
-                                m_date = datetime.datetime.strptime(
-                                    member[A_DATEAGREED], SCM_DATE_FORMAT
-                                )
-                                if m_date > c_date:
-                                    declaration = True
+                if code and code.agreed_since(swimmer, c_date):
+                    declaration = True
 
                 if not declaration:
                     c_res += f"   {swimmer.name} (last seen: {swimmer.lastseen_str})\n"
@@ -204,17 +190,8 @@ class Session(Entity):
             if swimmer.is_active:
                 declaration = False
                 code = swimmer.get_conduct_name(covid)
-                if code:
-                    code_members = code.data[A_MEMBERS]
-                    for member in code_members:
-                        code_member = self.scm.members.by_guid[member[A_GUID]]
-                        if code_member == swimmer:
-                            if member[A_DATEAGREED]:
-                                m_date = datetime.datetime.strptime(
-                                    member[A_DATEAGREED], SCM_DATE_FORMAT
-                                )
-                                if m_date > c_date:
-                                    declaration = True
+                if code and code.agreed_since(swimmer, c_date):
+                    declaration = True
 
                 if not declaration:
                     s_res += f"   {swimmer.name} (last seen: {swimmer.lastseen_str})\n"
@@ -228,6 +205,7 @@ class Session(Entity):
         return res
 
     @debug_trace(5)
+    @timed
     def analyse(self):
         """Analyse the session."""
         # pylint: disable=too-many-branches
@@ -238,11 +216,11 @@ class Session(Entity):
             issue(self, E_NO_SWIMMERS, "Session")
             return
 
-        cfg = get_config(self.scm, C_SESSIONS)
-        absence = cfg.get(C_ABSENCE, 9999)
-        register = cfg.get(C_REGISTER, 9999)
+        settings = self.scm.settings
+        absence = settings.session_absence
+        register = settings.session_register
 
-        groups = get_config(self.scm, C_SESSIONS, C_SESSION, self.name, C_GROUPS)
+        groups = settings.session(self.name).groups
 
         seen = None
         n_swimmers = 0
@@ -275,7 +253,7 @@ class Session(Entity):
             if self.ignore_attendance is False:
                 attr = swimmer.get(A_LAST_ATTENDED, False)
                 if attr:
-                    lastseen = datetime.datetime.strptime(attr, SCM_DATE_FORMAT)
+                    lastseen = parse_date(attr, SCM_DATE_FORMAT)
                     if (self.scm.today - lastseen).days > absence:
                         msg = lastseen.strftime(PRINT_DATE_FORMAT)
                         issue(
@@ -0,0 +1,357 @@
+"""Compiled, read only, view of the configuration file."""
+
+# pylint: disable=too-few-public-methods
+
+import datetime
+from types import MappingProxyType
+
+from scm_helper.config import (
+    C_25M,
+    C_ABSENCE,
+    C_AGE,
+    C_AGE_EOY,
+    C_ALIGN_QUARTER,
+    C_ALL_AGES,
+    C_API,
+    C_CHECK_DBS,
+    C_CHECK_PERMISSIONS,
+    C_CHECK_RESTRICTIONS,
+    C_CHECK_SE_NUMBER,
+    C_CHILD,
+    C_COACHES,
+    C_CONDUCT,
+    C_CONF_DIFF,
+    C_CONFIRMATION,
+    C_COVID,
+    C_DATE,
+    C_DBS,
+    C_EXCLUDE_MAX,
+    C_EXPIRY,
+    C_FILTER,
+    C_GRACE,
+    C_GROUP,
+    C_GROUPS,
+    C_IGNORE,
+    C_IGNORE_ATTENDANCE,
+    C_IGNORE_COACH,
+    C_IGNORE_COMMITTEE,
+    C_IGNORE_GROUP,
+    C_IGNORE_NO_SESSIONS,
+    C_IGNORE_SWIMMER,
+    C_IGNORE_UNKNOWN,
+    C_INACTIVE,
+    C_IS_COACH,
+    C_JOBTITLE,
+    C_LISTS,
+    C_LOGIN,
+    C_MANDATORY,
+    C_MAX_AGE,
+    C_MAX_SESSIONS,
+    C_MEMBERS,
+    C_MIN_AGE,
+    C_NAME,
+    C_NEWSTARTER,
+    C_NO_CLUB_SESSIONS,
+    C_NO_SESSION_ALLOWED,
+    C_NO_SESSIONS,
+    C_OPENAGE,
+    C_OVERALL_FASTEST,
+    C_PARENT,
+    C_PARENTS,
+    C_PRIORITY,
+    C_PROCESSES,
+    C_RECORDS,
+    C_RECORDSET,
+    C_REGISTER,
+    C_RELAY,
+    C_ROLE,
+    C_ROLES,
+    C_SE_ONLY,
+    C_SESSION,
+    C_SESSIONS,
+    C_SWIMMERS,
+    C_TIME,
+    C_TYPE,
+    C_TYPES,
+    C_UNIQUE,
+    C_UNUSED,
+    C_USERNAME,
+    C_VERIFY,
+    C_VOLUNTEER,
+    SCM_CSV_DATE_FORMAT,
+    SCM_DATE_FORMAT,
+)
+from scm_helper.notify import notify
+
+NO_DATE = datetime.datetime(1900, 1, 1)  # Code of conduct with no date
+NO_LIMIT = 9999  # Days, if sessions absence or register are not set
+
+
+def section(cfg, *keys):
+    """Nested section of cfg, empty if any part is missing."""
+    for key in keys:
+        if not cfg:
+            return {}
+        cfg = cfg.get(key)
+    return cfg or {}
+
+
+def frozen_list(value):
+    """Read only copy of a list (None stays None)."""
+    if value is None:
+        return None
+    return tuple(value)
+
+
+def frozen_map(cfg, xclass):
+    """Read only map of name to compiled config."""
+    return MappingProxyType({name: xclass(value) for name, value in cfg.items()})
+
+
+class Frozen:
+    """Attributes are read only, once freeze() has been called."""
+
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        """Prevent changes."""
+        if self._frozen:
+            raise AttributeError(f"{self.__class__.__name__} is read only")
+        super().__setattr__(name, value)
+
+    def freeze(self):
+        """No more changes."""
+        self._frozen = True
+
+
+class GroupConfig(Frozen):
+    """Config for a group (all None if the group is not configured)."""
+
+    # pylint: disable=too-many-instance-attributes
+    # Need them all!
+
+    def __init__(self, cfg):
+        """Initialise."""
+        cfg = cfg or {}
+        self.check_dbs = cfg.get(C_CHECK_DBS)
+        self.confirmation = None
+        self.ignore_group = cfg.get(C_IGNORE_GROUP)
+        self.ignore_swimmer = cfg.get(C_IGNORE_SWIMMER)
+        self.ignore_unknown = cfg.get(C_IGNORE_UNKNOWN)
+        self.login = cfg.get(C_LOGIN)
+        self.max_age = cfg.get(C_MAX_AGE)
+        self.max_sessions = cfg.get(C_MAX_SESSIONS)
+        self.min_age = cfg.get(C_MIN_AGE)
+        self.no_club_sessions = cfg.get(C_NO_CLUB_SESSIONS)
+        self.no_session_allowed = frozen_list(cfg.get(C_NO_SESSION_ALLOWED))
+        self.no_sessions = cfg.get(C_NO_SESSIONS)
+        self.sessions = frozen_list(cfg.get(C_SESSIONS))
+        self.type = cfg.get(C_TYPE)
+        self.types = frozen_list(cfg.get(C_TYPES))
+        self.unique = cfg.get(C_UNIQUE, True)
+
+        confirm = cfg.get(C_CONFIRMATION)
+        if confirm:
+            try:
+                self.confirmation = datetime.datetime.strptime(
+                    confirm, SCM_CSV_DATE_FORMAT
+                )
+            except ValueError:
+                notify(
+                    f"*** Error in date format in config file for groups config: {confirm} ***\n"
+                )
+
+        self.freeze()
+
+
+class SessionConfig(Frozen):
+    """Config for a session."""
+
+    def __init__(self, cfg):
+        """Initialise."""
+        cfg = cfg or {}
+        self.groups = frozen_list(cfg.get(C_GROUPS))
+        self.ignore_attendance = cfg.get(C_IGNORE_ATTENDANCE) or False
+        self.exclude_max = cfg.get(C_EXCLUDE_MAX) or False
+        self.freeze()
+
+
+class ConductConfig(Frozen):
+    """Config for a code of conduct."""
+
+    def __init__(self, cfg):
+        """Initialise."""
+        cfg = cfg or {}
+        self.types = frozen_list(cfg.get(C_TYPES))
+        self.ignore_group = frozen_list(cfg.get(C_IGNORE_GROUP))
+        self.date = NO_DATE
+        if cfg.get(C_DATE):
+            self.date = datetime.datetime.strptime(cfg[C_DATE], SCM_DATE_FORMAT)
+        self.freeze()
+
+
+class TypeConfig(Frozen):
+    """Config for a member type (swimmer, waterpolo...)."""
+
+    def __init__(self, cfg):
+        """Initialise."""
+        cfg = cfg or {}
+        self.check_se_number = cfg.get(C_CHECK_SE_NUMBER)
+        self.groups = frozen_list(cfg.get(C_GROUPS))
+        self.ignore_coach = cfg.get(C_IGNORE_COACH)
+        self.ignore_committee = cfg.get(C_IGNORE_COMMITTEE)
+        self.jobtitle = cfg.get(C_JOBTITLE)
+        self.name = cfg.get(C_NAME)
+        self.parents = cfg.get(C_PARENTS)
+        self.freeze()
+
+
+class RoleConfig(Frozen):
+    """Config for a role."""
+
+    def __init__(self, cfg):
+        """Initialise."""
+        cfg = cfg or {}
+        self.check_permissions = cfg.get(C_CHECK_PERMISSIONS)
+        self.check_restrictions = cfg.get(C_CHECK_RESTRICTIONS)
+        self.is_coach = cfg.get(C_IS_COACH)
+        self.freeze()
+
+
+class RecordConfig(Frozen):
+    """Config for a set of records (or the records section, if no sets)."""
+
+    # pylint: disable=too-many-instance-attributes
+    # Need them all!
+
+    def __init__(self, cfg, recordset):
+        """Initialise."""
+        cfg = cfg or {}
+        self.age_eoy = cfg.get(C_AGE_EOY)
+        self.all_ages = cfg.get(C_ALL_AGES)
+        self.ignore_group = cfg.get(C_IGNORE_GROUP)
+        self.ignore_no_sessions = cfg.get(C_IGNORE_NO_SESSIONS)
+        self.overall_fastest = cfg.get(C_OVERALL_FASTEST) or False
+        self.relay = cfg.get(C_RELAY)
+        self.se_only = cfg.get(C_SE_ONLY)
+        self.verify = cfg.get(C_VERIFY)
+
+        # Only in a record set
+        self.c_25m = False
+        self.filter = None
+        self.open_age = None
+        if recordset:
+            self.c_25m = cfg.get(C_25M)
+            self.filter = frozen_list(cfg.get(C_FILTER))
+            self.open_age = cfg.get(C_OPENAGE)
+
+        self.freeze()
+
+
+class Settings(Frozen):
+    """
+    Config file, compiled for the checks.
+
+    Built once the config file has been read and verified,
+    with each group, session etc looked up once (and defaults filled in),
+    rather than every time a member is checked.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-statements
+    # Need them all!
+
+    def __init__(self, cfg):
+        """Initialise."""
+        swimmers = section(cfg, C_SWIMMERS)
+        self.swimmer_absence = section(swimmers, C_ABSENCE).get(C_TIME)
+        self.swimmer_username_age = section(swimmers, C_USERNAME).get(C_MIN_AGE)
+        self.parent_mandatory = section(swimmers, C_PARENT).get(C_MANDATORY)
+        self.parent_max_age = section(swimmers, C_PARENT).get(C_MAX_AGE)
+        self.confirm_verify = section(swimmers, C_CONF_DIFF).get(C_VERIFY)
+
+        parents = section(cfg, C_PARENTS)
+        self.parent_min_age = section(parents, C_AGE).get(C_MIN_AGE)
+        self.parent_child_age = section(parents, C_AGE).get(C_CHILD)
+        self.parent_login = section(parents, C_LOGIN).get(C_MANDATORY)
+
+        members = section(cfg, C_MEMBERS)
+        self.confirm_expiry = section(members, C_CONFIRMATION).get(C_EXPIRY)
+        self.confirm_align = section(members, C_CONFIRMATION).get(C_ALIGN_QUARTER)
+        self.dbs_expiry = section(members, C_DBS).get(C_EXPIRY)
+        self.newstarter_grace = section(members, C_NEWSTARTER).get(C_GRACE)
+        self.inactive_time = section(members, C_INACTIVE).get(C_TIME)
+
+        self.coach_role = section(cfg, C_COACHES, C_ROLE).get(C_MANDATORY)
+        self.jobtitle_ignore = frozen_list(section(cfg, C_JOBTITLE).get(C_IGNORE)) or ()
+
+        roles = section(cfg, C_ROLES)
+        self.roles = frozen_map(section(roles, C_ROLE), RoleConfig)
+        self.role_login_unused = section(roles, C_LOGIN).get(C_UNUSED)
+        self.role_volunteer = section(roles, C_VOLUNTEER).get(C_MANDATORY)
+
+        groups = section(cfg, C_GROUPS)
+        self.has_groups = groups.get(C_GROUP) is not None
+        self.groups = frozen_map(section(groups, C_GROUP), GroupConfig)
+        self.group_priority = None  # No groups section
+        if cfg.get(C_GROUPS) is not None:
+            self.group_priority = frozen_list(groups.get(C_PRIORITY)) or ()
+
+        sessions = section(cfg, C_SESSIONS)
+        self.sessions = frozen_map(section(sessions, C_SESSION), SessionConfig)
+        self.session_absence = sessions.get(C_ABSENCE, NO_LIMIT)
+        self.session_register = sessions.get(C_REGISTER, NO_LIMIT)
+        self.covid = sessions.get(C_COVID)
+
+        self.has_conduct = cfg.get(C_CONDUCT) is not None
+        self.conduct = frozen_map(section(cfg, C_CONDUCT), ConductConfig)
+
+        self.types = frozen_map(section(cfg, C_TYPES), TypeConfig)
+
+        lists = section(cfg, C_LISTS)
+        self.list_confirmation = lists.get(C_CONFIRMATION)
+        self.list_conduct = frozen_list(lists.get(C_CONDUCT))
+
+        self.processes = section(cfg, C_API).get(C_PROCESSES) or 1
+
+        recordset = section(cfg, C_RECORDSET)
+        self.recordsets = tuple(recordset)
+        self.records = MappingProxyType(
+            {name: RecordConfig(value, True) for name, value in recordset.items()}
+        )
+        self.records_default = RecordConfig(section(cfg, C_RECORDS), False)
+
+        # For anything not configured
+        self._group = GroupConfig(None)
+        self._session = SessionConfig(None)
+        self._conduct = ConductConfig(None)
+        self._type = TypeConfig(None)
+        self._role = RoleConfig(None)
+
+        self.freeze()
+
+    def group(self, name):
+        """Config for group."""
+        return self.groups.get(name, self._group)
+
+    def session(self, name):
+        """Config for session."""
+        return self.sessions.get(name, self._session)
+
+    def code(self, name):
+        """Config for code of conduct."""
+        return self.conduct.get(name, self._conduct)
+
+    def member_type(self, xtype):
+        """Config for member type."""
+        return self.types.get(xtype, self._type)
+
+    def role(self, name):
+        """Config for role."""
+        return self.roles.get(name, self._role)
+
+    def recordset(self, name):
+        """Config for a set of records (None = not using record sets)."""
+        if name is None:
+            return self.records_default
+        return self.records[name]
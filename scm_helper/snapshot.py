@@ -0,0 +1,64 @@
+"""Local snapshot of member data, for incremental reads."""
+
+import json
+import os
+import os.path
+from pathlib import Path
+
+from scm_helper.config import CONFIG_DIR, SCM_DATE_FORMAT, SNAPSHOT_FILE
+from scm_helper.issue import debug
+
+# Labels in the snapshot
+K_CLUB = "club"
+K_FULL = "full"  # Date of last full read
+K_MEMBERS = "members"
+K_SYNCED = "synced"  # Date of last read (full or changes)
+
+
+def snapshot_file():
+    """Snapshot filename."""
+    home = str(Path.home())
+    return os.path.join(home, CONFIG_DIR, SNAPSHOT_FILE)
+
+
+def read_snapshot(scm, club):
+    """Read the snapshot, None if there isn't a (usable) one."""
+    filename = snapshot_file()
+    if os.path.isfile(filename) is False:
+        return None
+
+    try:
+        with open(filename, "rb") as file:
+            data = scm.crypto.decrypt_data(file.read())
+        if data:
+            snapshot = json.loads(data.decode())
+            if snapshot[K_CLUB] == club:
+                return snapshot
+    except (OSError, ValueError, KeyError):
+        pass
+
+    debug("Member snapshot not usable - ignoring", 2)
+    return None
+
+
+def write_snapshot(scm, club, members, full, synced):
+    """Write the snapshot."""
+    snapshot = {
+        K_CLUB: club,
+        K_FULL: full.strftime(SCM_DATE_FORMAT),
+        K_SYNCED: synced.strftime(SCM_DATE_FORMAT),
+        K_MEMBERS: members,
+    }
+
+    filename = snapshot_file()
+    tmp = f"{filename}.tmp"
+    try:
+        data = scm.crypto.encrypt_data(json.dumps(snapshot).encode())
+        with open(tmp, "wb") as file:
+            file.write(data)
+        os.replace(tmp, filename)
+        return True
+
+    except OSError as error:
+        debug(f"Cannot write member snapshot: {error}", 1)
+        return False
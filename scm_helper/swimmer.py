@@ -1,35 +1,14 @@
 """Swimmer routines."""
 
 from scm_helper.config import (
-    C_ABSENCE,
-    C_CHECK_SE_NUMBER,
-    C_CONF_DIFF,
-    C_GROUP,
-    C_GROUPS,
-    C_IGNORE_ATTENDANCE,
-    C_MANDATORY,
-    C_MAX_AGE,
-    C_MAX_SESSIONS,
-    C_MIN_AGE,
-    C_NO_CLUB_SESSIONS,
-    C_PARENT,
-    C_PARENTS,
-    C_SESSION,
-    C_SESSIONS,
-    C_SWIMMERS,
-    C_TIME,
-    C_TYPES,
-    C_UNIQUE,
-    C_USERNAME,
-    C_VERIFY,
     CTYPE_POLO,
     CTYPE_SYNCHRO,
     EXCEPTION_EMAILDIFF,
     EXCEPTION_NOGROUPS,
     EXCEPTION_TWOGROUPS,
     PRINT_DATE_FORMAT,
-    get_config,
 )
+from scm_helper.instrument import timed
 from scm_helper.issue import (
     E_ABSENT,
     E_ASA,
@@ -51,6 +30,7 @@ from scm_helper.issue import (
 )
 
 
+@timed
 def analyse_swimmer(swimmer):
     """Analyse a swimmer..."""
     # pylint: disable=too-many-branches
@@ -83,25 +63,25 @@ def analyse_swimmer(swimmer):
         check_max_sessions(swimmer)
         return
 
+    settings = swimmer.scm.settings
     if swimmer.is_synchro:
-        if get_config(swimmer.scm, C_TYPES, CTYPE_SYNCHRO, C_PARENTS) is False:
+        if settings.member_type(CTYPE_SYNCHRO).parents is False:
             pass
         else:
             check_parents(swimmer)
             return
 
     if swimmer.is_polo:
-        if get_config(swimmer.scm, C_TYPES, CTYPE_POLO, C_PARENTS) is False:
+        if settings.member_type(CTYPE_POLO).parents is False:
             pass
         else:
             check_parents(swimmer)
 
 
+@timed
 def check_max_sessions(swimmer):
     """Check not exceeding max numbr of sessions allowed"""
-    max_session = get_config(
-        swimmer.scm, C_GROUPS, C_GROUP, swimmer.first_group, C_MAX_SESSIONS
-    )
+    max_session = swimmer.scm.settings.group(swimmer.first_group).max_sessions
     if max_session:
         num_sessions = len(swimmer.sessions)
         if num_sessions > max_session:
@@ -113,11 +93,13 @@ def check_max_sessions(swimmer):
                 issue(swimmer, E_MAX_SESSIONS, f"{len(swimmer.sessions)}: \n{sessions}")
 
 
+@timed
 def check_asa(swimmer):
     """Check ASA (Swim England) number is OK."""
     if swimmer.asa_number is None:
-        cfg_synchro = get_config(swimmer.scm, C_TYPES, CTYPE_SYNCHRO, C_CHECK_SE_NUMBER)
-        cfg_polo = get_config(swimmer.scm, C_TYPES, CTYPE_POLO, C_CHECK_SE_NUMBER)
+        settings = swimmer.scm.settings
+        cfg_synchro = settings.member_type(CTYPE_SYNCHRO).check_se_number
+        cfg_polo = settings.member_type(CTYPE_POLO).check_se_number
 
         err = True
         if swimmer.is_polo and (cfg_polo is False):
@@ -128,6 +110,7 @@ def check_asa(swimmer):
             issue(swimmer, E_ASA)
 
 
+@timed
 def check_lastseen(swimmer):
     """Check when swimemr was last seen."""
     if swimmer.lastseen is None:
@@ -135,37 +118,34 @@ def check_lastseen(swimmer):
             # if no session, don't have data about when they have been seen
             check = True
             for session in swimmer.sessions:
-                if get_config(
-                    swimmer.scm,
-                    C_SESSIONS,
-                    C_SESSION,
-                    session.name,
-                    C_IGNORE_ATTENDANCE,
-                ):
+                if session.ignore_attendance:
                     check = False
                     continue
             if check:
                 issue(swimmer, E_NEVERSEEN)
     else:
         gap = (swimmer.scm.today - swimmer.lastseen).days
-        absence = get_config(swimmer.scm, C_SWIMMERS, C_ABSENCE, C_TIME)
+        absence = swimmer.scm.settings.swimmer_absence
         if gap > absence:
             when = swimmer.lastseen.strftime(PRINT_DATE_FORMAT)
             issue(swimmer, E_ABSENT, f"Last seen: {when}")
 
 
+@timed
 def check_login(swimmer):
     """Check if the login is OK."""
     if swimmer.username:
-        min_age = get_config(swimmer.scm, C_SWIMMERS, C_USERNAME, C_MIN_AGE)
+        min_age = swimmer.scm.settings.swimmer_username_age
         if min_age:
             if swimmer.age and (swimmer.age < min_age):
                 issue(swimmer, E_LOGIN_TOO_YOUNG, f"Age: {swimmer.age}")
 
 
+@timed
 def check_two_groups(swimmer):
     """Check if swimmer in two groups."""
-    if get_config(swimmer.scm, C_GROUPS, C_GROUP) is None:
+    settings = swimmer.scm.settings
+    if settings.has_groups is False:
         return  # No config, so ignore error.
 
     g_count = 0
@@ -173,17 +153,11 @@ def check_two_groups(swimmer):
 
     for group in swimmer.groups:
 
-        nosession = get_config(
-            swimmer.scm, C_GROUPS, C_GROUP, group.name, C_NO_CLUB_SESSIONS
-        )
-        if nosession is True:
+        cfg = settings.group(group.name)
+        if cfg.no_club_sessions is True:
             continue
 
-        unique = get_config(swimmer.scm, C_GROUPS, C_GROUP, group.name, C_UNIQUE)
-        if unique is None:
-            unique = True
-
-        if unique:
+        if cfg.unique:
             g_count += 1
             if g_count > 1:
                 errmsg += f", {group.name}"
@@ -195,6 +169,7 @@ def check_two_groups(swimmer):
             issue(swimmer, E_TWO_GROUPS, errmsg)
 
 
+@timed
 def check_parents(swimmer):
     """Check consistence between swimmer and parent email."""
     # pylint: disable=too-many-branches
@@ -203,8 +178,9 @@ def check_parents(swimmer):
     count = 0
     confirm_error = False
 
-    confirm_verify = get_config(swimmer.scm, C_SWIMMERS, C_CONF_DIFF, C_VERIFY)
-    max_age = get_config(swimmer.scm, C_SWIMMERS, C_PARENT, C_MAX_AGE)
+    settings = swimmer.scm.settings
+    confirm_verify = settings.confirm_verify
+    max_age = settings.parent_max_age
 
     if swimmer.email:
         email = swimmer.email.split(";")
@@ -232,8 +208,7 @@ def check_parents(swimmer):
             issue(swimmer, E_EMAIL_MATCH, err)
 
     if count == 0:
-        mandatory = get_config(swimmer.scm, C_SWIMMERS, C_PARENT, C_MANDATORY)
-        if mandatory and max_age:
+        if settings.parent_mandatory and max_age:
             if swimmer.age and (swimmer.age <= max_age):
                 msg = f"{swimmer.first_group}, Age: {swimmer.age}"
                 issue(swimmer, E_NO_PARENT, msg)
@@ -268,7 +243,7 @@ def check_confirmed_diff(swimmer, parent):
     if parent.confirmed_date:
         parent_mon = int((parent.confirmed_date.month - 1) / 3) * 3
 
-    if swimmer.age > get_config(swimmer.scm, C_SWIMMERS, C_PARENT, C_MAX_AGE):
+    if swimmer.age > swimmer.scm.settings.parent_max_age:
         return False
 
     if child_mon == parent_mon:
@@ -276,22 +251,22 @@ def check_confirmed_diff(swimmer, parent):
 
     prefix = "Different confirmed dates"
     postfix = "- checking other details for consistency"
-    debug(f"{prefix} {swimmer.name}, {parent.name} {postfix}", 8)
+    debug("%s %s, %s %s", 8, prefix, swimmer.name, parent.name, postfix)
 
     if swimmer.email != parent.email:
-        debug(f"email: {swimmer.email}: {parent.email}", 8)
+        debug("email: %s: %s", 8, swimmer.email, parent.email)
         return True
 
     if swimmer.homephone != parent.homephone:
-        debug(f"phone: {swimmer.homephone}: {parent.homephone}", 8)
+        debug("phone: %s: %s", 8, swimmer.homephone, parent.homephone)
         return True
 
     if swimmer.mobilephone != parent.mobilephone:
-        debug(f"mobile: {swimmer.mobilephone}: {parent.mobilephone}", 8)
+        debug("mobile: %s: %s", 8, swimmer.mobilephone, parent.mobilephone)
         return True
 
     if swimmer.address != parent.address:
-        debug(f"address: {swimmer.address}: {parent.address}", 8)
+        debug("address: %s: %s", 8, swimmer.address, parent.address)
         return True
 
     # Dates are different, but core attributes same
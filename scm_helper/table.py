@@ -0,0 +1,166 @@
+"""
+Members as columns, to filter many members at once.
+
+Used to select the members for the configured email lists
+(Lists.populate). The per-member checks (Group.check_age, check_login...)
+do not use it: they run as each entity is analysed (see rules.py), and
+report issues in that order, so there is nothing to filter in bulk.
+The summary counts are kept as the members are created.
+"""
+
+try:
+    import numpy  # pylint: disable=import-error
+except ImportError:
+    numpy = None  # pylint: disable=invalid-name
+    # Optional, the table works (more slowly) without it
+
+# Columns
+AGE = "age"
+AGE_EOY = "age_eoy"
+YEAR = "year"  # of birth
+GENDER = "gender"
+TYPES = "types"
+GROUPS = "groups"  # How many groups
+CANDIDATE = "candidate"  # Active, and not in an ignored group
+EMAIL = "email"  # Has an email address
+NO_EMAIL = "no_email"  # Email address not set (None)
+
+DTYPES = {GENDER: str, CANDIDATE: bool, EMAIL: bool, NO_EMAIL: bool}  # Others int
+
+
+class MemberTable:
+    """Columns of member attributes, built after linkage.
+
+    Predicates return a mask (a NumPy array if available, or a list of
+    bools), combined with all_of, any_of and none_of. For numbers,
+    0 means not known (e.g. no date of birth).
+    """
+
+    def __init__(self, members):
+        """Initialise."""
+        self.members = list(members)
+        self.rows = {member: row for row, member in enumerate(self.members)}
+        self.guids = [member.guid for member in self.members]
+
+        columns = {
+            AGE: [],
+            AGE_EOY: [],
+            YEAR: [],
+            GENDER: [],
+            TYPES: [],
+            GROUPS: [],
+            CANDIDATE: [],
+            EMAIL: [],
+            NO_EMAIL: [],
+        }
+        for member in self.members:
+            dob = member.dob
+            columns[AGE].append(member.age or 0)
+            columns[AGE_EOY].append(member.age_eoy or 0)
+            columns[YEAR].append(dob.year if dob else 0)
+            columns[GENDER].append(member.gender or "")
+            columns[TYPES].append(member.types)
+            columns[GROUPS].append(len(member.groups))
+            candidate = member.is_active and member.in_ignore_group is False
+            columns[CANDIDATE].append(candidate)
+            email = member.email
+            columns[EMAIL].append(bool(email))
+            columns[NO_EMAIL].append(email is None)
+
+        if numpy:
+            for key, value in columns.items():
+                columns[key] = numpy.array(value, dtype=DTYPES.get(key, int))
+        self.columns = columns
+
+    def __len__(self):
+        """Number of members."""
+        return len(self.members)
+
+    def fill(self, value):
+        """A mask of value for every member."""
+        if numpy:
+            return numpy.full(len(self.members), value, dtype=bool)
+        return [value] * len(self.members)
+
+    def between(self, column, low, high):
+        """Value is between low and high (inclusive), or is not known."""
+        col = self.columns[column]
+        if numpy:
+            return (col == 0) | ((col >= low) & (col <= high))
+        return [x == 0 or low <= x <= high for x in col]
+
+    def equal(self, column, value):
+        """Value is equal to value."""
+        col = self.columns[column]
+        if numpy:
+            return col == value
+        return [x == value for x in col]
+
+    def more_than(self, column, value):
+        """Value is more than value."""
+        col = self.columns[column]
+        if numpy:
+            return col > value
+        return [x > value for x in col]
+
+    def is_set(self, column):
+        """Value is True."""
+        col = self.columns[column]
+        if numpy:
+            return col.copy()
+        return list(col)
+
+    def has_type(self, mask):
+        """Member is any of the types in mask (bits, see type_mask)."""
+        col = self.columns[TYPES]
+        if numpy:
+            return (col & mask) != 0
+        return [(x & mask) != 0 for x in col]
+
+    def in_group(self, entities, name):
+        """Member is linked to an entity (e.g. a group) called name."""
+        links = entities.member_index.get(name, {})
+        rows = [self.rows[member] for member in links if member in self.rows]
+        res = self.fill(False)
+        for row in rows:
+            res[row] = True
+        return res
+
+    def all_of(self, *masks):
+        """All of masks are True (True if no masks)."""
+        if not masks:
+            return self.fill(True)
+        if numpy:
+            return numpy.logical_and.reduce(masks)
+        return [all(row) for row in zip(*masks)]
+
+    def any_of(self, *masks):
+        """Any of masks are True (False if no masks)."""
+        if not masks:
+            return self.fill(False)
+        if numpy:
+            return numpy.logical_or.reduce(masks)
+        return [any(row) for row in zip(*masks)]
+
+    def none_of(self, *masks):
+        """None of masks are True."""
+        mask = self.any_of(*masks)
+        if numpy:
+            return ~mask
+        return [not x for x in mask]
+
+    def count(self, mask):
+        """Number of members where mask is True."""
+        if numpy:
+            return int(numpy.count_nonzero(mask))
+        return sum(mask)
+
+    def where(self, mask):
+        """Rows where mask is True."""
+        if numpy:
+            return numpy.flatnonzero(mask).tolist()
+        return [row for row, value in enumerate(mask) if value]
+
+    def select(self, mask):
+        """Members where mask is True, in order."""
+        return [self.members[row] for row in self.where(mask)]